@@ -0,0 +1,36 @@
+"""Operating system simulator: scheduling, deadlock, synchronization and memory.
+
+The core classes import without PyQt5 or matplotlib. Submodules are loaded on
+first attribute access, so `import os_simulator` and the command line stay
+cheap; the GUI lives in os_simulator.gui and is only imported to launch it.
+"""
+import importlib
+
+_EXPORTS = {
+    'ProcessScheduler': 'scheduling',
+    'IncrementalSchedule': 'incremental',
+    'Workload': 'workload',
+    'WORKLOAD_DTYPE': 'workload',
+    'TraceLoader': 'workload',
+    'DeadlockDetector': 'deadlock',
+    'BankersAlgorithm': 'deadlock',
+    'WaitForGraph': 'deadlock',
+    'Semaphore': 'sync',
+    'WaitQueue': 'sync',
+    'Mutex': 'sync',
+    'RWLock': 'sync',
+    'Condition': 'sync',
+    'SyncSimulation': 'sync',
+    'ScriptedSimulation': 'sync',
+    'MemoryBlock': 'memory',
+    'MemoryManager': 'memory',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,491 @@
+"""Headless entry point: python -m os_simulator <command> [options]
+
+Each command imports only the simulator module it needs, so running the
+deadlock, sync or memory simulations never loads NumPy, PyQt5 or matplotlib.
+Check cold start with `python -X importtime -m os_simulator deadlock state.json`.
+"""
+import argparse
+import json
+import sys
+
+ALGORITHMS = {
+    "FCFS": "FCFS",
+    "SJF": "SJF",
+    "SRTF": "SRTF",
+    "RR": "Round Robin",
+    "CFS": "CFS",
+    "MLFQ": "MLFQ",
+    "PRIORITY": "Priority (Aging)",
+    "STRIDE": "Stride",
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="os_simulator", description="Operating system simulator")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    schedule = commands.add_parser("schedule", help="schedule a CSV or binary process trace")
+    schedule.add_argument("trace")
+    schedule.add_argument("-a", "--algorithm", choices=list(ALGORITHMS), default="FCFS")
+    schedule.add_argument("-q", "--quantum", type=int, default=2)
+    schedule.add_argument("-c", "--cpus", type=int, default=1,
+                          help="simulate several cores with per-CPU queues (FCFS, or RR with -a RR)")
+    schedule.add_argument("--gantt", action="store_true", help="print the Gantt chart slices")
+    schedule.add_argument("--replay", action="store_true",
+                          help="stream an arrival-ordered trace through FCFS in constant memory")
+    schedule.add_argument("--check", action="store_true",
+                          help="cross-check the vectorized FCFS/SJF results against the event engine")
+    schedule.set_defaults(func=run_schedule)
+
+    sweep = commands.add_parser("sweep", help="score algorithms and quanta in parallel")
+    sweep.add_argument("trace")
+    sweep.add_argument("-a", "--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS))
+    sweep.add_argument("-q", "--quanta", nargs="+", type=int, default=[1, 2, 4, 8])
+    sweep.add_argument("-j", "--workers", type=int, default=None)
+    sweep.set_defaults(func=run_sweep)
+
+    io = commands.add_parser("io", help="simulate alternating CPU and I/O bursts from a JSON workload")
+    io.add_argument("workload", help="JSON file with processes (bursts, devices), devices and quantum")
+    io.add_argument("-q", "--quantum", type=int, help="Round Robin quantum (default FCFS)")
+    io.add_argument("--gantt", action="store_true", help="print the CPU and device slices")
+    io.set_defaults(func=run_io)
+
+    deadlock = commands.add_parser("deadlock", help="detect deadlock in a JSON allocation state")
+    deadlock.add_argument("state", help="JSON file with allocation, request (dense or sparse rows) and available")
+    deadlock.set_defaults(func=run_deadlock)
+
+    risk = commands.add_parser("risk", help="estimate deadlock probability of random states")
+    risk.add_argument("capacities", nargs="+", type=int, help="units of each resource type")
+    risk.add_argument("-p", "--processes", type=int, default=5)
+    risk.add_argument("-n", "--states", type=int, default=100000)
+    risk.add_argument("-u", "--utilization", type=float, default=0.7,
+                      help="chance each unit is held by some process")
+    risk.add_argument("--request", choices=["poisson", "uniform", "bernoulli"], default="poisson")
+    risk.add_argument("--mean", type=float, default=0.5, help="mean units requested per resource type (for bernoulli, the request probability)")
+    risk.add_argument("--batch", type=int, default=1000)
+    risk.add_argument("--confidence", type=float, default=0.95)
+    risk.add_argument("--seed", type=int, default=0)
+    risk.add_argument("-j", "--workers", type=int, default=None)
+    risk.set_defaults(func=run_risk)
+
+    waitfor = commands.add_parser("waitfor", help="watch a lock trace for wait-for cycles")
+    waitfor.add_argument("trace", help="text file of '<request|grant|release> <process> <resource>' lines")
+    waitfor.set_defaults(func=run_waitfor)
+
+    banker = commands.add_parser("banker", help="benchmark Banker's avoidance against the naive safety check")
+    banker.add_argument("-p", "--processes", type=int, default=200)
+    banker.add_argument("-r", "--resources", type=int, default=8)
+    banker.add_argument("-n", "--requests", type=int, default=5000)
+    banker.add_argument("--seed", type=int, default=0)
+    banker.set_defaults(func=run_banker)
+
+    sync = commands.add_parser("sync", help="run the semaphore contention simulation")
+    sync.add_argument("config", nargs="?",
+                      help="JSON file with processes, resource, permits, steps; or resources and "
+                           "a list of processes with scripts")
+    sync.add_argument("--scenario", choices=["shared-resource", "producer-consumer", "readers-writers",
+                                             "dining-philosophers", "ordered-philosophers"])
+    sync.add_argument("-p", "--processes", type=int)
+    sync.add_argument("-r", "--resource")
+    sync.add_argument("-s", "--permits", type=int)
+    sync.add_argument("-n", "--steps", type=int)
+    sync.add_argument("--stats", metavar="PATH",
+                      help="export wait/hold percentiles, queue lengths and fairness (.json or .csv)")
+    sync.add_argument("--real", choices=["threads", "asyncio"],
+                      help="also run the scenario on real primitives and compare it with the simulation")
+    sync.add_argument("--unit", type=float, default=0.001, help="seconds per time unit in a real run")
+    sync.add_argument("--duration", type=float, default=1.0, help="length of a real run in seconds")
+    sync.set_defaults(func=run_sync)
+
+    memory = commands.add_parser("memory", help="replay a JSON memory allocation script")
+    memory.add_argument("script")
+    memory.set_defaults(func=run_memory)
+
+    gui = commands.add_parser("gui", help="launch the PyQt5 GUI")
+    gui.set_defaults(func=run_gui)
+
+    return parser
+
+
+def load_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def emit(args, data, lines):
+    if args.json:
+        print(json.dumps(data, indent=2))
+    else:
+        for line in lines:
+            print(line)
+
+
+def run_schedule(args):
+    from .scheduling import ProcessScheduler
+    from .workload import TraceLoader
+
+    scheduler = ProcessScheduler()
+    loader = TraceLoader()
+    algorithm = ALGORITHMS[args.algorithm]
+
+    if args.replay:
+        if algorithm != "FCFS":
+            raise ValueError("--replay only supports FCFS")
+        result = scheduler.fcfs_replay(loader.iter_chunks(args.trace))
+        emit(args, result, [
+            f"Processes: {result['count']}",
+            f"Makespan: {result['makespan']}",
+            f"Average Waiting Time: {result['avg_waiting']:.2f}",
+            f"Average Turnaround Time: {result['avg_turnaround']:.2f}",
+        ])
+        return 0
+
+    workload = loader.load(args.trace)
+    if args.cpus > 1:
+        quantum = args.quantum if algorithm == "Round Robin" else None
+        result = scheduler.smp(workload, args.cpus, quantum)
+    elif algorithm in ("FCFS", "SJF"):
+        if algorithm == "FCFS":
+            result = scheduler.fcfs_columnar(workload)
+        else:
+            result = scheduler.sjf_columnar(workload)
+        if args.check:
+            expected = scheduler.run_events(workload, algorithm.lower())
+            if (abs(float(result['avg_waiting']) - expected['avg_waiting']) > 1e-9
+                    or abs(float(result['avg_turnaround']) - expected['avg_turnaround']) > 1e-9):
+                raise ValueError("Vectorized and event engine results disagree")
+    else:
+        result = scheduler.schedule(workload, algorithm, args.quantum)
+
+    data = {
+        'algorithm': algorithm,
+        'count': len(workload),
+        'avg_waiting': float(result['avg_waiting']),
+        'avg_turnaround': float(result['avg_turnaround']),
+    }
+    lines = [
+        f"Algorithm: {algorithm}",
+        f"Processes: {len(workload)}",
+        f"Average Waiting Time: {data['avg_waiting']:.2f}",
+        f"Average Turnaround Time: {data['avg_turnaround']:.2f}",
+    ]
+    if 'gantt_cpu' in result:
+        for key in ('cpus', 'makespan', 'migrations', 'steals', 'utilization'):
+            data[key] = result[key]
+        lines.append(f"CPUs: {result['cpus']}  Makespan: {result['makespan']}  "
+                     f"Migrations: {result['migrations']}  Steals: {result['steals']}")
+        lines.extend(f"CPU {c}: {u:.1%} busy" for c, u in enumerate(result['utilization']))
+    if 'policy_stats' in result:
+        stats = result['policy_stats']
+        data['policy_stats'] = stats
+        lines.append(f"Slices: {stats['slices']}  Context Switches: {stats['context_switches']}")
+        if 'decisions' in stats:
+            lines.append(f"Decisions: {stats['decisions']}  Queue Ops: {stats['queue_ops']}  "
+                         f"Cost per Decision: {stats['ns_per_decision']:.0f} ns")
+    if args.gantt:
+        if 'gantt_chart' in result:
+            gantt = result['gantt_chart']
+        else:
+            names = (p['name'] for p in result['processes'])
+            gantt = zip(names, result['start_time'].tolist(), result['completion_time'].tolist())
+        data['gantt_chart'] = [list(s) for s in gantt]
+        if 'gantt_cpu' in result:
+            data['gantt_cpu'] = result['gantt_cpu']
+            lines.extend(f"CPU {c}\t{name}\t{start}\t{end}"
+                         for c, (name, start, end) in zip(result['gantt_cpu'], data['gantt_chart']))
+        else:
+            lines.extend(f"{name}\t{start}\t{end}" for name, start, end in data['gantt_chart'])
+    emit(args, data, lines)
+    return 0
+
+
+def run_sweep(args):
+    from .scheduling import ProcessScheduler
+    from .workload import TraceLoader
+
+    workload = TraceLoader().load(args.trace)
+    rows = ProcessScheduler().sweep(
+        workload, [ALGORITHMS[a] for a in args.algorithms], args.quanta, args.workers
+    )
+    lines = ["algorithm\tquantum\tavg_waiting\tavg_turnaround"]
+    lines.extend(
+        f"{r['algorithm']}\t{'' if r['quantum'] is None else r['quantum']}\t"
+        f"{r['avg_waiting']:.2f}\t{r['avg_turnaround']:.2f}"
+        for r in rows
+    )
+    emit(args, rows, lines)
+    return 0
+
+
+def run_io(args):
+    from .scheduling import ProcessScheduler
+
+    script = load_json(args.workload)
+    quantum = args.quantum if args.quantum is not None else script.get('quantum')
+    result = ProcessScheduler().io(script['processes'], quantum, script.get('devices'), args.gantt)
+
+    keys = ('avg_waiting', 'avg_turnaround', 'avg_response', 'makespan', 'throughput',
+            'cpu_utilization', 'device_utilization', 'device_wait')
+    data = {key: result[key] for key in keys}
+    lines = [
+        f"Processes: {len(script['processes'])}",
+        f"Average Waiting Time: {result['avg_waiting']:.2f}",
+        f"Average Turnaround Time: {result['avg_turnaround']:.2f}",
+        f"Average Response Time: {result['avg_response']:.2f}",
+        f"Makespan: {result['makespan']}  Throughput: {result['throughput']:.3f} per unit",
+        f"CPU: {result['cpu_utilization']:.1%} busy",
+    ]
+    lines.extend(f"{d}: {u:.1%} busy, {result['device_wait'][d]:.2f} average queue wait"
+                 for d, u in result['device_utilization'].items())
+    if args.gantt:
+        data['gantt_chart'] = [list(s) for s in result['gantt_chart']]
+        data['gantt_devices'] = [list(s) for s in result['gantt_devices']]
+        lines.extend(f"CPU\t{name}\t{start}\t{end}" for name, start, end in result['gantt_chart'])
+        lines.extend(f"{d}\t{name}\t{start}\t{end}" for d, name, start, end in result['gantt_devices'])
+    emit(args, data, lines)
+    return 0
+
+
+def run_deadlock(args):
+    from .deadlock import DeadlockDetector
+
+    state = load_json(args.state)
+    # Sparse rows are objects of resource index -> amount; JSON keys are strings
+    allocation, request = (
+        [{int(j): v for j, v in row.items()} if isinstance(row, dict) else row for row in state[key]]
+        for key in ('allocation', 'request')
+    )
+    result = DeadlockDetector().detect_deadlock(allocation, request, state['available'])
+    if result['deadlock']:
+        lines = ["Deadlock Detected! The system is in a deadlock state."]
+    else:
+        lines = ["No Deadlock. The system is in a safe state.",
+                 f"Safe Sequence: {' -> '.join(result['safe_sequence'])}"]
+    emit(args, result, lines)
+    return 0
+
+
+def run_risk(args):
+    from .deadlock import DeadlockDetector
+
+    result = DeadlockDetector().estimate_risk(
+        args.capacities, args.processes, args.states, args.utilization, args.request, args.mean,
+        args.batch, args.workers, args.seed, args.confidence
+    )
+    lines = [
+        f"States: {result['states']}  Deadlocked: {result['deadlocks']}",
+        f"Deadlock Probability: {result['probability']:.4f} "
+        f"({result['confidence']:.0%} CI {result['ci_low']:.4f} - {result['ci_high']:.4f})",
+        f"Throughput: {result['states_per_second']:,.0f} states/s",
+    ]
+    emit(args, result, lines)
+    return 0
+
+
+def read_lock_trace(path):
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            fields = line.split('#', 1)[0].split()
+            if not fields:
+                continue
+            if len(fields) != 3:
+                raise ValueError(f"{path}:{number}: expected '<event> <process> <resource>'")
+            yield fields
+
+
+def run_waitfor(args):
+    from time import perf_counter
+    from .deadlock import WaitForGraph
+
+    graph = WaitForGraph()
+    start = perf_counter()
+    found = graph.feed(read_lock_trace(args.trace))
+    elapsed = perf_counter() - start
+
+    data = {
+        'events': graph.events,
+        'events_per_second': graph.events / elapsed if elapsed else 0,
+        'deadlocks': [{'event': n, 'cycle': [{'process': p, 'waits_for': r} for p, r in cycle]}
+                      for n, cycle in found],
+    }
+    lines = [f"Events: {graph.events}  ({data['events_per_second']:,.0f} events/s)"]
+    if not found:
+        lines.append("No Deadlock.")
+    for n, cycle in found:
+        lines.append(f"Deadlock at event {n}: " + " -> ".join(f"{p} waits for {r}" for p, r in cycle))
+    emit(args, data, lines)
+    return 0
+
+
+def run_banker(args):
+    import random
+    from time import perf_counter
+    from .deadlock import BankersAlgorithm
+
+    rng = random.Random(args.seed)
+    n, m = args.processes, args.resources
+    maximum = [[rng.randint(1, 10) for _ in range(m)] for _ in range(n)]
+    allocation = [[rng.randint(0, x // 2) for x in row] for row in maximum]
+    # Enough spare capacity that most requests hinge on the safety check
+    available = [max(sum(row[j] - a[j] for row, a in zip(maximum, allocation)) // 2, 10) for j in range(m)]
+    # Each step asks for up to `caps` more of every resource, within the claim;
+    # a process whose claim is met releases everything instead
+    ops = [(rng.randrange(n), [rng.randint(0, 2) for _ in range(m)]) for _ in range(args.requests)]
+
+    data = {'processes': n, 'resources': m, 'requests': len(ops)}
+    decisions = {}
+    for mode, indexed in (('naive', False), ('indexed', True)):
+        banker = BankersAlgorithm(available, maximum, allocation, indexed=indexed)
+        granted = []
+        start = perf_counter()
+        for pid, caps in ops:
+            need = banker.need[pid]
+            if any(need):
+                granted.append(banker.try_request(pid, [min(c, x) for c, x in zip(caps, need)]))
+            else:
+                banker.release(pid, banker.allocation[pid][:])
+        elapsed = perf_counter() - start
+        decisions[mode] = granted
+        data[mode] = {'seconds': elapsed, 'requests_per_second': len(ops) / elapsed if elapsed else 0,
+                      'granted': sum(granted)}
+    if decisions['naive'] != decisions['indexed']:
+        raise ValueError("Indexed and naive safety checks disagree")
+
+    speedup = data['naive']['seconds'] / data['indexed']['seconds'] if data['indexed']['seconds'] else 0
+    data['speedup'] = speedup
+    lines = [f"Processes: {n}  Resources: {m}  Requests: {len(ops)}"]
+    lines.extend(f"{mode:>8}: {data[mode]['requests_per_second']:,.0f} requests/s, "
+                 f"{data[mode]['granted']} granted" for mode in ('naive', 'indexed'))
+    lines.append(f"Speedup: {speedup:.1f}x")
+    emit(args, data, lines)
+    return 0
+
+
+def run_sync(args):
+    from .sync import SCENARIOS, ScriptedSimulation, SyncSimulation, shared_resource
+
+    config = load_json(args.config) if args.config else {}
+    for key in ("processes", "resource", "permits", "steps"):
+        if getattr(args, key) is not None:
+            config[key] = getattr(args, key)
+
+    if args.real:
+        if args.scenario:
+            simulation = SCENARIOS[args.scenario](config.get('processes', 5))
+        elif isinstance(config.get('processes'), list):
+            simulation = ScriptedSimulation.from_config(config)
+        else:
+            simulation = shared_resource(config.get('processes', 3), config.get('permits', 1),
+                                         resource=config.get('resource', "Printer"))
+        return run_real(args, simulation)
+
+    events = []
+    if args.scenario:
+        simulation = SCENARIOS[args.scenario](config.get('processes', 5))
+    elif isinstance(config.get('processes'), list):
+        simulation = ScriptedSimulation.from_config(config)
+    else:
+        simulation = SyncSimulation()
+        simulation.start(config.get('processes', 3), config.get('resource', "Printer"), config.get('permits', 1))
+    simulation.log_callback = lambda time, message: events.append((time, message))
+    simulation.run(config.get('steps', 20))
+
+    data = {
+        'time': simulation.time,
+        'events': [{'time': t, 'message': m} for t, m in events],
+        'processes': [{'name': p['name'], 'state': p['state']} for p in simulation.processes],
+    }
+    data['fairness'] = simulation.stats.fairness()
+    if args.stats:
+        simulation.stats.export(args.stats, simulation.time)
+    if isinstance(simulation, ScriptedSimulation):
+        data['deadlocks'] = [{'time': t, 'cycle': [list(edge) for edge in cycle]}
+                             for t, cycle in simulation.deadlocks]
+    lines = [f"[{t:03d}] {m}" for t, m in events]
+    lines.append(simulation.timeline())
+    emit(args, data, lines)
+    return 0
+
+
+def run_real(args, simulation):
+    from .realtime import calibrate
+
+    result = calibrate(simulation, args.real, args.unit, args.duration)
+    if args.stats:
+        result['real'].stats.export(args.stats, result['real'].units)
+    data = {key: value for key, value in result.items() if key not in ('real', 'simulated')}
+
+    def cell(value):
+        return "-" if value is None else f"{value:.3f}"
+
+    lines = [
+        f"{args.real}: {result['elapsed']:.2f} s = {result['units']} units of {args.unit} s",
+        f"throughput: {result['throughput']:.1f} acquisitions/s real, {result['simulated_throughput']:.1f} simulated",
+        f"fairness: {cell(result['fairness'])} real, {cell(result['simulated_fairness'])} simulated",
+        f"{'resource':<16}{'rate sim':>10}{'rate real':>10}{'p50 sim':>9}{'p50 real':>9}"
+        f"{'p95 sim':>9}{'p95 real':>9}{'p95 ms':>9}",
+    ]
+    for row in result['resources']:
+        lines.append(
+            f"{row['resource']:<16}{cell(row['simulated_rate']):>10}{cell(row['real_rate']):>10}"
+            f"{cell(row['simulated_wait_p50']):>9}{cell(row['real_wait_p50']):>9}"
+            f"{cell(row['simulated_wait_p95']):>9}{cell(row['real_wait_p95']):>9}"
+            f"{cell(row['real_latency_p95_ms']):>9}"
+        )
+    emit(args, data, lines)
+    return 0
+
+
+def run_memory(args):
+    from .memory import MemoryManager
+
+    script = load_json(args.script)
+    events = []
+    manager = MemoryManager()
+    manager.log_callback = events.append
+    manager.initialize(script.get('total_memory', 1024), script.get('partition_type', "Variable"),
+                       script.get('partition_sizes'))
+    strategy = script.get('strategy', "First Fit")
+
+    for op in script.get('operations', []):
+        if 'allocate' in op:
+            if manager.allocate(op['allocate'], op.get('strategy', strategy)) is None:
+                events.append(f"No suitable block found for {op['allocate']}KB")
+        elif 'deallocate' in op:
+            if not manager.deallocate(op['deallocate']):
+                events.append(f"Process {op['deallocate']} not found in memory")
+        else:
+            raise ValueError(f"Unknown memory operation: {op}")
+
+    blocks = [{'start': b.start, 'size': b.size, 'process': b.process} for b in manager.get_blocks()]
+    frag = manager.fragmentation()
+    data = {'events': events, 'blocks': blocks, 'fragmentation': frag}
+    lines = [f"[Memory] {e}" for e in events]
+    lines.extend(f"{b['start']:>6}-{b['start'] + b['size']:<6} {b['process'] or 'Free'}" for b in blocks)
+    if frag is None:
+        lines.append("Fragmentation: None")
+    else:
+        lines.append(f"Fragmentation: External={frag['external']}KB, Internal={frag['internal']}KB")
+    emit(args, data, lines)
+    return 0
+
+
+def run_gui(args):
+    from .gui import main as gui_main
+
+    gui_main()
+    return 0
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "schedule" and args.cpus > 1 and args.algorithm not in ("FCFS", "RR"):
+        # The SMP engine runs FCFS, or Round Robin with a quantum
+        parser.error(f"--cpus > 1 only supports -a FCFS or -a RR, not {args.algorithm}")
+    try:
+        return args.func(args)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
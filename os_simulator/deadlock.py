@@ -0,0 +1,548 @@
+import heapq
+from bisect import bisect_left, insort
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from time import perf_counter
+
+# Request distributions for DeadlockDetector.estimate_risk, all with the given mean
+REQUEST_DISTRIBUTIONS = ('poisson', 'uniform', 'bernoulli')
+
+
+def risk_task(seed, count, capacities, processes, utilization, request, request_mean):
+    """Worker for DeadlockDetector.estimate_risk: draws `count` random states and
+    returns how many are deadlocked.
+
+    Every unit of each resource is held, with probability `utilization`, by a
+    uniformly random process and is otherwise available; each process then
+    requests from `request` with `request_mean` units per resource type, never
+    more than the resource's capacity. "uniform" draws a real number in
+    [0, 2 * request_mean] and rounds it up or down at random in proportion,
+    so the mean holds even when it is below one unit.
+    """
+    import numpy as np
+    
+    rng = np.random.default_rng(seed)
+    capacities = np.asarray(capacities, dtype=np.int64)
+    m = len(capacities)
+    pvals = np.full(processes + 1, utilization / processes)
+    pvals[-1] = 1 - utilization
+    held = rng.multinomial(capacities, pvals, size=(count, m))
+    allocation = held[:, :, :-1].transpose(0, 2, 1)
+    available = held[:, :, -1]
+    
+    shape = (count, processes, m)
+    if request == 'poisson':
+        wanted = rng.poisson(request_mean, size=shape)
+    elif request == 'uniform':
+        wanted = np.floor(rng.uniform(0, 2 * request_mean, size=shape) + rng.random(shape)).astype(np.int64)
+    else:
+        wanted = (rng.random(shape) < request_mean).astype(np.int64)
+    wanted = np.minimum(wanted, capacities)
+    
+    return int(DeadlockDetector().detect_deadlock_batch(allocation, wanted, available).sum())
+
+
+class DeadlockDetector:
+    # Below this many matrix cells the plain loops beat NumPy's call overhead
+    VECTORIZE_MIN = 4096
+    BLOCK_ROWS = 4096
+
+    def __init__(self):
+        pass
+    
+    def detect_deadlock(self, allocation, request, available):
+        if self.is_sparse(allocation) or self.is_sparse(request):
+            return self.detect_deadlock_sparse(allocation, request, available)
+        if hasattr(allocation, 'shape') or len(allocation) * len(available) >= self.VECTORIZE_MIN:
+            return self.detect_deadlock_numpy(allocation, request, available)
+        
+        n = len(allocation)
+        m = len(available)
+        work = available.copy()
+        finish = [False] * n
+        
+        # Safety algorithm
+        safe_sequence = []
+        count = 0
+        while count < n:
+            found = False
+            for i in range(n):
+                if not finish[i] and all(request[i][j] <= work[j] for j in range(m)):
+                    for j in range(m):
+                        work[j] += allocation[i][j]
+                    finish[i] = True
+                    safe_sequence.append(f"P{i}")
+                    found = True
+                    count += 1
+            if not found:
+                break
+        
+        if count < n:
+            return {'deadlock': True, 'safe_sequence': []}
+        else:
+            return {'deadlock': False, 'safe_sequence': safe_sequence}
+    
+    def detect_deadlock_numpy(self, allocation, request, available):
+        """The same safety algorithm over 2-D allocation/request and 1-D available arrays.
+
+        A pass still visits processes in index order and releases each one's
+        allocation before looking at the next, so the safe sequence matches
+        detect_deadlock exactly. Each block of rows is settled with a single
+        comparison against the current work vector: every satisfiable row is
+        taken, and a row that only becomes satisfiable from releases earlier in
+        the same block is found by comparing against prefix sums of those
+        releases. NumPy is imported here so the plain path stays light.
+        """
+        import numpy as np
+        
+        allocation = np.asarray(allocation)
+        request = np.asarray(request)
+        work = np.array(available)
+        work = work.astype(np.result_type(work, allocation))
+        n = len(allocation)
+        finish = np.zeros(n, dtype=bool)
+        safe = []
+        count = 0
+        
+        while count < n:
+            found = False
+            for a in range(0, n, self.BLOCK_ROWS):
+                b = min(a + self.BLOCK_ROWS, n)
+                cursor = a
+                while cursor < b:
+                    pending = ~finish[cursor:b]
+                    ok = (request[cursor:b] <= work).all(axis=1) & pending
+                    if not ok.any():
+                        break
+                    released = allocation[cursor:b].sum(axis=0, where=ok[:, None])
+                    
+                    # A waiting row can only join this block if the block's
+                    # total release would cover it; only then find out where
+                    joined = None
+                    waiting = np.flatnonzero(pending & ~ok)
+                    if len(waiting):
+                        waiting = waiting[(request[cursor + waiting] <= work + released).all(axis=1)]
+                    if len(waiting):
+                        chosen = np.flatnonzero(ok)
+                        cum = np.cumsum(allocation[cursor + chosen], axis=0)
+                        before = np.searchsorted(chosen, waiting)
+                        seen = work + np.concatenate((np.zeros_like(cum[:1]), cum))[before]
+                        late = np.flatnonzero((request[cursor + waiting] <= seen).all(axis=1))
+                        if len(late):
+                            joined = late[0]
+                    
+                    if joined is None:
+                        taken = np.flatnonzero(ok) + cursor
+                        work += released
+                        cursor = b
+                    else:
+                        # Take the chosen rows ahead of the first late joiner, then it
+                        k = before[joined]
+                        row = cursor + waiting[joined]
+                        taken = np.append(chosen[:k] + cursor, row)
+                        if k:
+                            work += cum[k - 1]
+                        work += allocation[row]
+                        cursor = row + 1
+                    
+                    finish[taken] = True
+                    safe.extend(taken.tolist())
+                    count += len(taken)
+                    found = True
+            if not found:
+                break
+        
+        if count < n:
+            return {'deadlock': True, 'safe_sequence': []}
+        return {'deadlock': False, 'safe_sequence': [f"P{i}" for i in safe]}
+
+    def detect_deadlock_batch(self, allocation, request, available):
+        """Deadlock verdicts for a batch of states.
+
+        allocation and request are (states, n, m) arrays and available is
+        (states, m). Whether every process can finish does not depend on the
+        order they are released in, so each round releases every satisfiable
+        process of every state at once. Returns a boolean array, True where
+        the state is deadlocked.
+        """
+        import numpy as np
+        
+        allocation = np.asarray(allocation)
+        request = np.asarray(request)
+        work = np.array(available, dtype=np.int64)
+        finish = np.zeros(allocation.shape[:2], dtype=bool)
+        while True:
+            ready = ~finish & (request <= work[:, None, :]).all(axis=2)
+            if not ready.any():
+                break
+            finish |= ready
+            work += np.einsum('snm,sn->sm', allocation, ready.astype(allocation.dtype))
+        return ~finish.all(axis=1)
+    
+    def estimate_risk(self, capacities, processes, states=10000, utilization=0.7, request='poisson',
+                      request_mean=0.5, batch=1000, max_workers=None, seed=0, confidence=0.95):
+        """Monte Carlo estimate of how often random states deadlock.
+
+        States are drawn in batches by risk_task across a process pool, each
+        batch from its own child seed, so the estimate only depends on `seed`
+        and not on the number of workers. Returns the deadlock probability with
+        a Wilson score interval at `confidence` and the throughput in states
+        per second.
+        """
+        import numpy as np
+        
+        if request not in REQUEST_DISTRIBUTIONS:
+            raise ValueError(f"Unknown request distribution: {request}")
+        if not 0 <= utilization <= 1:
+            raise ValueError("Utilization must be between 0 and 1")
+        if request == 'bernoulli' and not 0 <= request_mean <= 1:
+            raise ValueError("A bernoulli request mean is a probability between 0 and 1")
+        if request_mean < 0:
+            raise ValueError("Request mean cannot be negative")
+        if not 0 < confidence < 1:
+            raise ValueError("Confidence must be between 0 and 1")
+        if processes < 1 or states < 1 or batch < 1:
+            raise ValueError("Need at least one process, state and batch")
+        
+        counts = [batch] * (states // batch)
+        if states % batch:
+            counts.append(states % batch)
+        seeds = np.random.SeedSequence(seed).spawn(len(counts))
+        args = [(s, c, list(capacities), processes, utilization, request, request_mean)
+                for s, c in zip(seeds, counts)]
+        
+        start = perf_counter()
+        if max_workers == 1:
+            deadlocks = sum(risk_task(*a) for a in args)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                deadlocks = sum(f.result() for f in [pool.submit(risk_task, *a) for a in args])
+        elapsed = perf_counter() - start
+        
+        p = deadlocks / states
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        centre = (p + z * z / (2 * states)) / (1 + z * z / states)
+        spread = z * ((p * (1 - p) + z * z / (4 * states)) / states) ** 0.5 / (1 + z * z / states)
+        
+        return {
+            'states': states,
+            'deadlocks': deadlocks,
+            'probability': p,
+            'confidence': confidence,
+            'ci_low': max(centre - spread, 0.0),
+            'ci_high': min(centre + spread, 1.0),
+            'seconds': elapsed,
+            'states_per_second': states / elapsed if elapsed else 0,
+        }
+    
+    def is_sparse(self, matrix):
+        """CSR matrices (anything with indptr/indices/data) and lists of dict rows"""
+        if hasattr(matrix, 'indptr'):
+            return True
+        return isinstance(matrix, (list, tuple)) and len(matrix) > 0 and isinstance(matrix[0], dict)
+    
+    def sparse_rows(self, matrix):
+        """Yields each row as a list of (resource, amount) pairs with non-zero amounts"""
+        if hasattr(matrix, 'indptr'):
+            indptr, indices, data = (
+                a.tolist() if hasattr(a, 'tolist') else list(a)
+                for a in (matrix.indptr, matrix.indices, matrix.data)
+            )
+            for a, b in zip(indptr, indptr[1:]):
+                yield [(j, v) for j, v in zip(indices[a:b], data[a:b]) if v]
+        else:
+            for row in matrix:
+                if isinstance(row, dict):
+                    yield [(j, v) for j, v in row.items() if v]
+                else:
+                    yield [(j, v) for j, v in enumerate(row) if v]
+    
+    def detect_deadlock_sparse(self, allocation, request, available):
+        """The same safety algorithm for sparse allocation/request matrices.
+
+        Rows come as CSR (indptr, indices, data) or as dicts of resource ->
+        amount, and only non-zeros are stored. Every resource keeps the
+        processes requesting it sorted by amount, with a pointer that moves
+        forward as work grows; a process whose last outstanding request is
+        covered becomes runnable. Runnable processes wait in two heaps, ahead
+        of or behind the current scan position, so they are taken in the same
+        pass order as detect_deadlock and the safe sequence is identical. The
+        run costs O((n + nnz) log n).
+        """
+        allocation = list(self.sparse_rows(allocation))
+        n = len(allocation)
+        work = list(available)
+        waiting_on = [0] * n
+        by_amount = {}
+        for i, row in enumerate(self.sparse_rows(request)):
+            waiting_on[i] = len(row)
+            for j, v in row:
+                by_amount.setdefault(j, []).append((v, i))
+        for index in by_amount.values():
+            index.sort()
+        pos = dict.fromkeys(by_amount, 0)
+        
+        def covered(j):
+            # Requests for resource j that the current work now covers
+            index = by_amount[j]
+            p = pos[j]
+            while p < len(index) and index[p][0] <= work[j]:
+                yield index[p][1]
+                p += 1
+            pos[j] = p
+        
+        for j in by_amount:
+            for k in covered(j):
+                waiting_on[k] -= 1
+        ahead = [i for i in range(n) if not waiting_on[i]]
+        behind = []
+        safe_sequence = []
+        
+        while ahead or behind:
+            if not ahead:
+                # Start the next pass from the top
+                ahead, behind = behind, ahead
+            i = heapq.heappop(ahead)
+            safe_sequence.append(f"P{i}")
+            for j, v in allocation[i]:
+                work[j] += v
+                if j in by_amount:
+                    for k in covered(j):
+                        waiting_on[k] -= 1
+                        if not waiting_on[k]:
+                            heapq.heappush(ahead if k > i else behind, k)
+        
+        if len(safe_sequence) < n:
+            return {'deadlock': True, 'safe_sequence': []}
+        return {'deadlock': False, 'safe_sequence': safe_sequence}
+
+
+class BankersAlgorithm:
+    """Deadlock avoidance: a request is granted only if the state stays safe.
+
+    Keeps `maximum`, `allocation` and `need` (maximum - allocation) per process
+    and, for every resource type, the processes sorted by their need of it.
+    The safety check walks those sorted lists with one pointer per resource,
+    counting how many resource types each process is satisfied on; a process
+    that is satisfied on all of them finishes and releases its allocation,
+    which only ever moves the pointers forward. That is O(n·m) per check
+    instead of the O(n²·m) rescan of the textbook loop. A request that leaves
+    the requester able to finish straight away keeps an already safe state
+    safe, so it is granted without any scan.
+    """
+    def __init__(self, available, maximum, allocation=None, indexed=True):
+        self.n = len(maximum)
+        self.m = len(available)
+        self.indexed = indexed
+        self.available = list(available)
+        self.maximum = [list(row) for row in maximum]
+        if allocation is None:
+            allocation = [[0] * self.m for _ in range(self.n)]
+        self.allocation = [list(row) for row in allocation]
+        self.need = [[mx - a for mx, a in zip(mrow, arow)]
+                     for mrow, arow in zip(self.maximum, self.allocation)]
+        if any(x < 0 for row in self.need for x in row):
+            raise ValueError("Allocation exceeds the maximum claim")
+        self.by_need = None
+        if indexed:
+            self.by_need = [sorted((self.need[i][j], i) for i in range(self.n)) for j in range(self.m)]
+        self.safe = self.is_safe()
+    
+    def try_request(self, pid, request):
+        """Grants `request` to process `pid` if the result is safe; returns True if granted"""
+        need = self.need[pid]
+        if any(r > x for r, x in zip(request, need)):
+            raise ValueError(f"P{pid} has exceeded its maximum claim")
+        if any(r > a for r, a in zip(request, self.available)):
+            return False
+        
+        self.apply(pid, request, 1)
+        if self.indexed and self.safe and all(x <= a for x, a in zip(need, self.available)):
+            return True
+        if self.is_safe():
+            self.safe = True
+            return True
+        self.apply(pid, request, -1)
+        return False
+    
+    def release(self, pid, vector):
+        """Returns resources from `pid`; a safe state stays safe"""
+        if any(r > a for r, a in zip(vector, self.allocation[pid])):
+            raise ValueError(f"P{pid} is releasing more than it holds")
+        self.apply(pid, vector, -1)
+    
+    def apply(self, pid, vector, sign):
+        need = self.need[pid]
+        allocation = self.allocation[pid]
+        for j, r in enumerate(vector):
+            if not r:
+                continue
+            if self.indexed:
+                index = self.by_need[j]
+                del index[bisect_left(index, (need[j], pid))]
+            allocation[j] += sign * r
+            need[j] -= sign * r
+            self.available[j] -= sign * r
+            if self.indexed:
+                insort(index, (need[j], pid))
+    
+    def is_safe(self):
+        return self.safe_sequence() is not None
+    
+    def safe_sequence(self):
+        """Process ids in an order that can all finish, or None if unsafe"""
+        if not self.indexed:
+            return self.safe_sequence_naive()
+        
+        n, m = self.n, self.m
+        work = self.available[:]
+        satisfied = [0] * n
+        pos = [0] * m
+        runnable = []
+        sequence = []
+        
+        def advance(j):
+            index = self.by_need[j]
+            p = pos[j]
+            w = work[j]
+            while p < n and index[p][0] <= w:
+                i = index[p][1]
+                satisfied[i] += 1
+                if satisfied[i] == m:
+                    runnable.append(i)
+                p += 1
+            pos[j] = p
+        
+        if m == 0:
+            runnable = list(range(n))
+        for j in range(m):
+            advance(j)
+        while runnable:
+            i = runnable.pop()
+            sequence.append(i)
+            for j, a in enumerate(self.allocation[i]):
+                if a:
+                    work[j] += a
+                    advance(j)
+        return sequence if len(sequence) == n else None
+    
+    def safe_sequence_naive(self):
+        """The textbook rescan, kept for comparison"""
+        work = self.available[:]
+        finish = [False] * self.n
+        sequence = []
+        found = True
+        while found:
+            found = False
+            for i in range(self.n):
+                if not finish[i] and all(x <= w for x, w in zip(self.need[i], work)):
+                    for j, a in enumerate(self.allocation[i]):
+                        work[j] += a
+                    finish[i] = True
+                    sequence.append(i)
+                    found = True
+        return sequence if len(sequence) == self.n else None
+
+
+class WaitForGraph:
+    """Event-driven deadlock detection over a live lock trace.
+
+    Feed it `request`, `grant` and `release` events. Each resource is a lock
+    with one or more holders; a process that has requested a resource waits
+    for every current holder of it. A cycle of waits is a deadlock. An edge
+    only appears when a process starts waiting or a waited-on resource gains a
+    holder, and any new cycle must run through that edge, so detection walks
+    just the wait chain hanging off it. Lock traces have short chains, which
+    keeps each event close to constant time.
+    """
+    EVENTS = ('request', 'grant', 'release')
+
+    def __init__(self):
+        self.holders = {}    # resource -> {process: hold count}
+        self.waiters = {}    # resource -> set of waiting processes
+        self.waiting = {}    # process -> resource it waits for
+        self.events = 0
+        self.deadlocks = []  # (event number, cycle)
+    
+    def event(self, kind, process, resource):
+        """Applies one event; returns the deadlock cycle it closed, if any"""
+        if kind not in self.EVENTS:
+            raise ValueError(f"Unknown event: {kind}")
+        self.events += 1
+        cycle = getattr(self, kind)(process, resource)
+        if cycle:
+            self.deadlocks.append((self.events, cycle))
+        return cycle
+    
+    def feed(self, events):
+        """Applies (kind, process, resource) events; returns the deadlocks they caused"""
+        found = []
+        for kind, process, resource in events:
+            cycle = self.event(kind, process, resource)
+            if cycle:
+                found.append((self.events, cycle))
+        return found
+    
+    def request(self, process, resource):
+        if process in self.waiting:
+            raise ValueError(f"{process} is already waiting for {self.waiting[process]}")
+        self.waiting[process] = resource
+        self.waiters.setdefault(resource, set()).add(process)
+        # New edges run from process to every holder of resource
+        return self.find_cycle(process, resource, {process})
+    
+    def grant(self, process, resource):
+        if self.waiting.get(process) == resource:
+            del self.waiting[process]
+            waiters = self.waiters[resource]
+            waiters.discard(process)
+            if not waiters:
+                del self.waiters[resource]
+        holders = self.holders.setdefault(resource, {})
+        holders[process] = holders.get(process, 0) + 1
+        
+        # Waiters on resource now also wait for process, which only closes a
+        # cycle if process is itself waiting on one of them
+        if holders[process] == 1 and process in self.waiting and resource in self.waiters:
+            targets = self.waiters[resource] - {process}
+            if targets:
+                return self.find_cycle(process, self.waiting[process], targets, resource)
+        return None
+    
+    def release(self, process, resource):
+        holders = self.holders.get(resource)
+        if not holders or process not in holders:
+            raise ValueError(f"{process} does not hold {resource}")
+        holders[process] -= 1
+        if not holders[process]:
+            del holders[process]
+            if not holders:
+                del self.holders[resource]
+        return None
+    
+    def find_cycle(self, start, resource, targets, closing=None):
+        """Searches the waits reachable from `start` (waiting on `resource`) for
+        any of `targets`; returns the cycle as [(process, resource waited on)]"""
+        parent = {start: None}
+        stack = [start]
+        while stack:
+            p = stack.pop()
+            for h in self.holders.get(self.waiting[p], ()):
+                if h == p:
+                    continue  # re-entrant hold, not a wait
+                if h in targets:
+                    path = [p]
+                    while parent[path[-1]] is not None:
+                        path.append(parent[path[-1]])
+                    path.reverse()
+                    cycle = [(q, self.waiting[q]) for q in path]
+                    if closing is not None:
+                        # The target waits on the resource just granted to start
+                        cycle.append((h, closing))
+                    return cycle
+                if h in parent:
+                    continue
+                parent[h] = p
+                if h in self.waiting:
+                    stack.append(h)
+        return None
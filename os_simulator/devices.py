@@ -0,0 +1,179 @@
+import heapq
+from collections import deque
+
+from .policies import process_field
+from .workload import Workload
+
+# Event kinds; at equal times I/O completions join the ready queue before a
+# preempted process is put back (arrivals come before both)
+IO_DONE, CPU_DONE = 0, 1
+
+
+class IOSimulation:
+    """Single-CPU scheduling of processes that alternate CPU and I/O bursts.
+
+    A process may carry `bursts`, alternating CPU and I/O lengths starting
+    with a CPU burst, and `devices` naming the device for each I/O burst (or
+    one `device` for all of them, "disk" by default). Processes without
+    `bursts` have the single CPU burst `burst_time`. The CPU runs its ready
+    queue FCFS, or Round Robin when a quantum is given, and every device
+    serves its own FIFO queue through a fixed number of channels. Arrivals,
+    CPU slice ends and I/O completions all go through one event heap, so a run
+    costs O(log n) per burst event however long the idle stretches are.
+    """
+
+    def __init__(self, quantum=None, devices=None, record_gantt=True):
+        if quantum is not None and quantum <= 0:
+            raise ValueError("Quantum must be positive")
+        devices = dict(devices or {})
+        for name, channels in devices.items():
+            if channels < 1:
+                raise ValueError(f"Device {name} needs at least one channel")
+        self.quantum = quantum
+        self.devices = devices
+        self.record_gantt = record_gantt
+
+    def run(self, scheduler, processes):
+        n = len(processes)
+        quantum = self.quantum
+        record = self.record_gantt
+        if isinstance(processes, Workload):
+            arrival, burst = scheduler.columns(processes)
+            bursts = [[b] for b in burst]
+        else:
+            arrival = [p['arrival_time'] for p in processes]
+            bursts = [p['bursts'] if 'bursts' in p else [p['burst_time']] for p in processes]
+        routes = []
+        for seq, devices, device in zip(bursts, process_field(processes, 'devices', None),
+                                        process_field(processes, 'device', "disk")):
+            routes.append(list(devices) if devices is not None else [device] * (len(seq) // 2))
+            if len(routes[-1]) < len(seq) // 2:
+                raise ValueError("Every I/O burst needs a device")
+
+        channels = dict(self.devices)
+        for route in routes:
+            for d in route:
+                channels.setdefault(d, 1)
+        free = dict(channels)
+        queues = {d: deque() for d in channels}
+        device_busy = dict.fromkeys(channels, 0)
+        device_wait = dict.fromkeys(channels, 0)
+        device_served = dict.fromkeys(channels, 0)
+
+        # Arrivals are read off the sorted order; the heap only holds the
+        # running slice and in-flight I/O, so it stays small
+        order = sorted(range(n), key=arrival.__getitem__)
+        events = []
+        k = 0
+        push = heapq.heappush
+        pop = heapq.heappop
+        ready = deque()
+        stage = [-1] * n
+        remaining = [0] * n
+        since = [0] * n
+        waiting = [0] * n
+        first_run = [None] * n
+        finish = arrival[:]
+        gantt = []
+        gantt_devices = []
+        running = None
+        slice_start = 0
+        cpu_busy = 0
+
+        def start_io(i, d, time):
+            device_wait[d] += time - since[i]
+            device_served[d] += 1
+            since[i] = time
+            push(events, (time + bursts[i][stage[i]], IO_DONE, i))
+
+        def advance(i, time):
+            # Move process i on to its next non-empty burst, or finish it
+            seq = bursts[i]
+            s = stage[i] + 1
+            while s < len(seq):
+                stage[i] = s
+                since[i] = time
+                if s % 2:
+                    d = routes[i][s // 2]
+                    if free[d]:
+                        free[d] -= 1
+                        start_io(i, d, time)
+                    else:
+                        queues[d].append(i)
+                    return
+                if seq[s] > 0:
+                    remaining[i] = seq[s]
+                    ready.append(i)
+                    return
+                s += 1
+            stage[i] = s
+            finish[i] = time
+
+        while k < n or events:
+            if k < n and (not events or arrival[order[k]] <= events[0][0]):
+                i = order[k]
+                k += 1
+                time = arrival[i]
+                advance(i, time)
+            else:
+                time, kind, i = pop(events)
+                if kind == CPU_DONE:
+                    running = None
+                    run = time - slice_start
+                    cpu_busy += run
+                    remaining[i] -= run
+                    if record:
+                        if gantt and gantt[-1][0] == i and gantt[-1][2] == slice_start:
+                            gantt[-1] = (i, gantt[-1][1], time)
+                        else:
+                            gantt.append((i, slice_start, time))
+                    if remaining[i] > 0:
+                        since[i] = time
+                        ready.append(i)
+                    else:
+                        advance(i, time)
+                else:
+                    d = routes[i][stage[i] // 2]
+                    device_busy[d] += time - since[i]
+                    if record:
+                        gantt_devices.append((d, i, since[i], time))
+                    if queues[d]:
+                        start_io(queues[d].popleft(), d, time)
+                    else:
+                        free[d] += 1
+                    advance(i, time)
+
+            # Dispatch once every event at this instant has been handled
+            if (running is None and ready and (not events or events[0][0] > time)
+                    and (k == n or arrival[order[k]] > time)):
+                running = ready.popleft()
+                waiting[running] += time - since[running]
+                if first_run[running] is None:
+                    first_run[running] = time
+                run = remaining[running] if quantum is None else min(quantum, remaining[running])
+                slice_start = time
+                push(events, (time + run, CPU_DONE, running))
+
+        makespan = max(finish) if n else 0
+        tat = [finish[i] - arrival[i] for i in range(n)]
+        response = [0 if first_run[i] is None else first_run[i] - arrival[i] for i in range(n)]
+        name = scheduler.process_name
+
+        return {
+            'processes': processes,
+            'waiting_time': waiting,
+            'turnaround_time': tat,
+            'response_time': response,
+            'avg_waiting': sum(waiting) / n if n else 0,
+            'avg_turnaround': sum(tat) / n if n else 0,
+            'avg_response': sum(response) / n if n else 0,
+            'gantt_chart': [(name(processes, i), s, e) for i, s, e in gantt],
+            'gantt_devices': [(d, name(processes, i), s, e) for d, i, s, e in gantt_devices],
+            'makespan': makespan,
+            'throughput': n / makespan if makespan else 0,
+            'cpu_utilization': cpu_busy / makespan if makespan else 0,
+            'device_utilization': {d: device_busy[d] / (makespan * channels[d]) if makespan else 0
+                                   for d in channels},
+            'device_wait': {d: device_wait[d] / device_served[d] if device_served[d] else 0
+                            for d in channels},
+        }
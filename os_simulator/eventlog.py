@@ -0,0 +1,93 @@
+import json
+import struct
+from collections import deque, namedtuple
+from itertools import islice
+
+Event = namedtuple("Event", ["seq", "time", "kind", "message"])
+
+KINDS = ('info', 'error', 'init', 'acquire', 'release', 'grant', 'block', 'wait', 'signal',
+         'deadlock', 'stall', 'finish', 'allocate', 'free')
+
+class EventLog:
+    """Fixed-size ring buffer of typed simulator events.
+
+    append() is O(1) however long the run: the buffer keeps the last
+    `capacity` events and a view pulls whatever arrived since its cursor
+    with since(), once per frame. With `spill` every event is also written
+    to disk, as JSON lines or, for a path ending in .bin, as packed records
+    of sequence number, time, kind and message (see read_events).
+    """
+    RECORD = struct.Struct("<QqBH")     # seq, time (-1 for none), kind, message length
+
+    def __init__(self, capacity=10000, spill=None):
+        self.events = deque(maxlen=capacity)
+        self.seq = 0
+        self.spill = spill
+        self.file = None
+        self.binary = bool(spill) and spill.endswith(".bin")
+        if self.binary:
+            self.file = open(spill, "wb")
+        elif spill:
+            self.file = open(spill, "w", encoding="utf-8")
+
+    def append(self, time, kind, message):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown event kind: {kind}")
+        self.seq += 1
+        event = Event(self.seq, time, kind, message)
+        self.events.append(event)
+        if self.file:
+            self.write(event)
+        return event
+
+    def write(self, event):
+        if self.binary:
+            data = event.message.encode("utf-8")[:0xFFFF]
+            time = -1 if event.time is None else event.time
+            self.file.write(self.RECORD.pack(event.seq, time, KINDS.index(event.kind), len(data)))
+            self.file.write(data)
+        else:
+            self.file.write(json.dumps(event._asdict()) + "\n")
+
+    def since(self, seq, limit=None):
+        """Returns (events after `seq` still in the buffer, how many were lost).
+
+        With `limit` only the newest `limit` events are returned and the rest
+        count as lost."""
+        wanted = self.seq - seq
+        available = min(wanted, len(self.events))
+        if limit is not None:
+            available = min(available, limit)
+        events = list(islice(reversed(self.events), available))
+        events.reverse()
+        return events, wanted - available
+
+    def clear(self):
+        self.events.clear()
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def __len__(self):
+        return len(self.events)
+
+
+def read_events(path):
+    """Yields the Events spilled to `path` by an EventLog"""
+    if path.endswith(".bin"):
+        record = EventLog.RECORD
+        with open(path, "rb") as f:
+            while True:
+                header = f.read(record.size)
+                if len(header) < record.size:
+                    return
+                seq, time, kind, length = record.unpack(header)
+                message = f.read(length).decode("utf-8", "replace")
+                yield Event(seq, None if time == -1 else time, KINDS[kind], message)
+    else:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield Event(**json.loads(line))
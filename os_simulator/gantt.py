@@ -0,0 +1,198 @@
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import LinearSegmentedColormap
+
+
+class GanttRenderer:
+    """Level-of-detail Gantt chart with one lane per process.
+
+    Every redraw re-bins the visible slices to the axes' pixel grid. Slices of a
+    lane closer than one pixel are merged into a single bar, all bars go into
+    one PolyCollection, and when there are more lanes than pixel rows (or more
+    bars than `max_bars`) the view falls back to an occupancy image. Labels are
+    only drawn on bars wide enough to hold them.
+    """
+    def __init__(self, ax, max_bars=20000, max_labels=200, fontsize=8):
+        self.ax = ax
+        self.max_bars = max_bars
+        self.max_labels = max_labels
+        self.fontsize = fontsize
+        self.names = []
+        self.lane = np.empty(0, dtype=np.int64)
+        self.start = np.empty(0)
+        self.end = np.empty(0)
+        self.slice_labels = None
+        self.labels = []
+        self.bars = PolyCollection([], facecolors='tab:blue', edgecolors='white', linewidths=0.5)
+        ax.add_collection(self.bars)
+        self.image = ax.imshow(np.ma.masked_all((1, 1)), aspect='auto', interpolation='nearest',
+                               cmap=LinearSegmentedColormap.from_list('occupancy', ['#c6dbef', 'tab:blue']),
+                               extent=(0, 1, 1, 0), visible=False)
+        self.cids = [
+            ax.callbacks.connect('xlim_changed', self.refresh),
+            ax.callbacks.connect('ylim_changed', self.refresh),
+        ]
+        self.resize_cid = ax.figure.canvas.mpl_connect('resize_event', self.refresh)
+
+    def set_schedule(self, gantt):
+        """Takes (name, start, end) slices; lanes follow first appearance"""
+        lanes = {}
+        lane = []
+        start = []
+        end = []
+        for name, s, e in gantt:
+            lane.append(lanes.setdefault(name, len(lanes)))
+            start.append(s)
+            end.append(e)
+        self.set_arrays(list(lanes), lane, start, end)
+
+    def set_arrays(self, names, lane, start, end, labels=None):
+        """Lanes are named by `names`; optional per-slice `labels` (e.g. the
+        process on a CPU lane) replace the lane name on unmerged bars"""
+        lane = np.asarray(lane, dtype=np.int64)
+        start = np.asarray(start, dtype=float)
+        end = np.asarray(end, dtype=float)
+        order = np.lexsort((start, lane))
+        self.names = list(names)
+        self.lane = lane[order]
+        self.start = start[order]
+        self.end = end[order]
+        self.slice_labels = None if labels is None else [labels[i] for i in order.tolist()]
+
+        self.ax.set_autoscale_on(False)
+        if len(self.start):
+            x0, x1 = min(self.start.min(), 0), self.end.max()
+            self.ax.set_xlim(x0, x1 if x1 > x0 else x0 + 1)
+        self.ax.set_ylim(max(len(self.names), 1) - 0.5, -0.5)
+        self.refresh()
+
+    def disconnect(self):
+        for cid in self.cids:
+            self.ax.callbacks.disconnect(cid)
+        self.ax.figure.canvas.mpl_disconnect(self.resize_cid)
+
+    def refresh(self, *args):
+        ax = self.ax
+        for text in self.labels:
+            text.remove()
+        self.labels = []
+        if not self.names:
+            self.bars.set_verts([])
+            self.image.set_visible(False)
+            return
+
+        x0, x1 = sorted(ax.get_xlim())
+        y0, y1 = sorted(ax.get_ylim())
+        width_px = max(int(ax.bbox.width), 1)
+        height_px = max(int(ax.bbox.height), 1)
+        px = (x1 - x0) / width_px
+
+        # Slices are sorted by (lane, start), so visible lanes are one range
+        first_lane = max(int(np.ceil(y0 - 0.5)), 0)
+        last_lane = min(int(np.floor(y1 + 0.5)), len(self.names) - 1)
+        if last_lane < first_lane:
+            self.bars.set_verts([])
+            self.image.set_visible(False)
+            return
+        lo = np.searchsorted(self.lane, first_lane, 'left')
+        hi = np.searchsorted(self.lane, last_lane, 'right')
+        lane = self.lane[lo:hi]
+        start = self.start[lo:hi]
+        end = self.end[lo:hi]
+        visible = (end > x0) & (start < x1)
+        lane, start, end = lane[visible], start[visible], end[visible]
+        index = np.flatnonzero(visible) + lo
+
+        lanes_visible = last_lane - first_lane + 1
+        row_px = height_px / lanes_visible
+        if row_px >= 2:
+            runs = self.merge_runs(lane, start, end, px)
+            if len(runs[0]) <= self.max_bars:
+                self.draw_bars(runs, index, px, row_px)
+                self.set_lane_ticks(first_lane, last_lane, row_px)
+                ax.figure.canvas.draw_idle()
+                return
+        self.draw_raster(lane, start, end, first_lane, lanes_visible,
+                         x0, x1, width_px, min(lanes_visible, height_px))
+        self.set_lane_ticks(first_lane, last_lane, row_px)
+        ax.figure.canvas.draw_idle()
+
+    def merge_runs(self, lane, start, end, px):
+        """Joins slices of the same lane separated by less than one pixel,
+        unless both neighbours are a pixel or wider on their own.
+
+        Returns the runs' lane, start, end and the index of each run's first
+        slice, or -1 where several slices were merged.
+        """
+        if not len(lane):
+            return lane, start, end, lane
+        brk = np.ones(len(lane), dtype=bool)
+        wide = (end - start) >= px
+        brk[1:] = (lane[1:] != lane[:-1]) | (start[1:] - end[:-1] >= px) | (wide[1:] & wide[:-1])
+        first = np.flatnonzero(brk)
+        single = np.diff(np.append(first, len(lane))) == 1
+        return lane[first], start[first], np.maximum.reduceat(end, first), np.where(single, first, -1)
+
+    def run_label(self, lane, first, index):
+        if self.slice_labels is None:
+            return self.names[lane]
+        if first < 0:
+            return ""
+        return self.slice_labels[index[first]]
+
+    def draw_bars(self, runs, index, px, row_px):
+        lane, start, end, first = runs
+        # Keep sub-pixel bars visible
+        end = np.maximum(end, start + px)
+        top = lane - 0.4
+        bottom = lane + 0.4
+        verts = np.stack([
+            np.column_stack([start, top]),
+            np.column_stack([end, top]),
+            np.column_stack([end, bottom]),
+            np.column_stack([start, bottom]),
+        ], axis=1)
+        self.bars.set_verts(verts)
+        self.bars.set_visible(True)
+        self.image.set_visible(False)
+
+        if row_px < self.fontsize * 1.5:
+            return
+        char_px = self.fontsize * 0.6 * self.ax.figure.dpi / 72
+        width_px = (end - start) / px
+        # Any label needs at least a couple of characters of room
+        candidates = np.flatnonzero(width_px >= 3 * char_px)
+        for i in candidates.tolist():
+            if len(self.labels) >= self.max_labels:
+                break
+            text = self.run_label(lane[i], first[i], index)
+            if text and width_px[i] >= (len(text) + 1) * char_px:
+                self.labels.append(self.ax.text(
+                    (start[i] + end[i]) / 2, lane[i], text,
+                    ha='center', va='center', fontsize=self.fontsize, clip_on=True
+                ))
+
+    def draw_raster(self, lane, start, end, first_lane, lanes_visible, x0, x1, cols, rows):
+        """Occupancy image: each cell counts the slices touching it"""
+        px = (x1 - x0) / cols
+        row = (lane - first_lane) * rows // lanes_visible
+        c0 = np.clip(((start - x0) / px).astype(np.int64), 0, cols - 1)
+        c1 = np.clip(np.ceil((end - x0) / px).astype(np.int64), c0 + 1, cols)
+        diff = np.zeros((rows, cols + 1), dtype=np.int64)
+        np.add.at(diff, (row, c0), 1)
+        np.add.at(diff, (row, c1), -1)
+        occupancy = np.cumsum(diff, axis=1)[:, :cols]
+
+        self.image.set_data(np.ma.masked_equal(occupancy, 0))
+        self.image.set_clim(1, max(int(occupancy.max()), 2))
+        self.image.set_extent((x0, x1, first_lane + lanes_visible - 0.5, first_lane - 0.5))
+        self.image.set_visible(True)
+        self.bars.set_visible(False)
+
+    def set_lane_ticks(self, first_lane, last_lane, row_px):
+        if row_px >= self.fontsize * 1.5:
+            ticks = list(range(first_lane, last_lane + 1))
+            self.ax.set_yticks(ticks)
+            self.ax.set_yticklabels([self.names[i] for i in ticks], fontsize=self.fontsize)
+        else:
+            self.ax.set_yticks([])
@@ -0,0 +1,1079 @@
+import sys
+from time import perf_counter
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, 
+                             QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, 
+                             QComboBox, QMessageBox, QGroupBox, QSpinBox,QTextEdit, QTableView,
+                             QAction, QFileDialog)
+from PyQt5.QtCore import Qt
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+
+from PyQt5.QtGui import QColor, QKeySequence
+from PyQt5.QtCore import Qt
+
+from .scheduling import ProcessScheduler
+from .incremental import INCREMENTAL_ALGORITHMS, IncrementalSchedule
+from .policies import POLICIES
+from .deadlock import DeadlockDetector
+from .gantt import GanttRenderer
+from .models import MatrixModel, SchedulingResultsModel, SyncStateModel, SyncStatsModel
+from .sync import SCENARIOS, SyncSimulation, shared_resource
+from .eventlog import EventLog
+from .memory import MemoryManager
+
+class SchedulingTab(QWidget):
+    MODELS = ("CPU only", "CPU + I/O")
+    ENGINE_ALGORITHMS = ("FCFS", "Round Robin")    # all the multi-CPU and I/O engines can run
+
+    def __init__(self):
+        super().__init__()
+        self.scheduler = ProcessScheduler()
+        self.incremental = None
+        self.init_ui()
+    
+    def init_ui(self):
+        layout = QVBoxLayout()
+        
+        # Algorithm selection
+        algo_group = QGroupBox("Scheduling Algorithm")
+        algo_layout = QHBoxLayout()
+        
+        self.algo_combo = QComboBox()
+        self.algo_combo.addItems(self.scheduler.algorithms())
+        self.algo_combo.currentTextChanged.connect(self.toggle_quantum)
+        
+        self.quantum_label = QLabel("Quantum:")
+        self.quantum_input = QLineEdit("2")
+        self.quantum_input.setFixedWidth(50)
+        self.quantum_label.hide()
+        self.quantum_input.hide()
+        
+        algo_layout.addWidget(QLabel("Algorithm:"))
+        algo_layout.addWidget(self.algo_combo)
+        algo_layout.addWidget(self.quantum_label)
+        algo_layout.addWidget(self.quantum_input)
+        
+        self.cpu_spin = QSpinBox()
+        self.cpu_spin.setRange(1, 256)
+        self.cpu_spin.setValue(1)
+        self.cpu_spin.valueChanged.connect(self.restrict_algorithms)
+        algo_layout.addWidget(QLabel("CPUs:"))
+        algo_layout.addWidget(self.cpu_spin)
+        
+        # "CPU + I/O" reads "cpu, io, cpu, ..." in the burst column as device queue work
+        self.model_combo = QComboBox()
+        self.model_combo.addItems(self.MODELS)
+        self.model_combo.currentTextChanged.connect(self.restrict_algorithms)
+        algo_layout.addWidget(QLabel("Model:"))
+        algo_layout.addWidget(self.model_combo)
+        algo_layout.addStretch()
+        algo_group.setLayout(algo_layout)
+        
+        # Process table
+        self.process_table = QTableWidget()
+        self.process_table.setColumnCount(5)
+        self.process_table.setHorizontalHeaderLabels(["Process", "Burst Time", "Arrival Time", "Priority", "Action"])
+        self.process_table.horizontalHeader().setStretchLastSection(True)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        add_button = QPushButton("Add Process")
+        add_button.clicked.connect(self.add_process_row)
+        run_button = QPushButton("Run Scheduling")
+        run_button.clicked.connect(self.run_scheduling)
+        button_layout.addWidget(add_button)
+        button_layout.addWidget(run_button)
+        
+        # Results
+        self.results_label = QLabel("Results will appear here")
+        self.results_label.setWordWrap(True)
+        self.results_model = SchedulingResultsModel()
+        self.results_view = QTableView()
+        self.results_view.setModel(self.results_model)
+        self.results_view.setSortingEnabled(True)
+        self.results_view.horizontalHeader().setStretchLastSection(True)
+        
+        # Gantt chart
+        self.figure = plt.figure()
+        self.canvas = FigureCanvas(self.figure)
+        self.toolbar = NavigationToolbar(self.canvas, self)
+        self.gantt_renderer = None
+        
+        layout.addWidget(algo_group)
+        layout.addWidget(self.process_table)
+        layout.addLayout(button_layout)
+        layout.addWidget(self.results_label)
+        layout.addWidget(self.results_view)
+        layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas)
+        
+        self.setLayout(layout)
+        
+        # Add initial processes
+        self.add_process_row()
+        self.add_process_row()
+    
+    def toggle_quantum(self, text):
+        if POLICIES[text].uses_quantum:
+            self.quantum_label.show()
+            self.quantum_input.show()
+        else:
+            self.quantum_label.hide()
+            self.quantum_input.hide()
+    
+    def restrict_algorithms(self, *_):
+        """The multi-CPU and I/O engines only run FCFS and Round Robin, and the I/O engine one CPU"""
+        io = self.model_combo.currentText() == "CPU + I/O"
+        if io:
+            self.cpu_spin.setValue(1)
+        self.cpu_spin.setEnabled(not io)
+        restricted = io or self.cpu_spin.value() > 1
+        items = self.algo_combo.model()
+        for row in range(self.algo_combo.count()):
+            supported = self.algo_combo.itemText(row) in self.ENGINE_ALGORITHMS
+            items.item(row).setEnabled(supported or not restricted)
+        if restricted and self.algo_combo.currentText() not in self.ENGINE_ALGORITHMS:
+            self.algo_combo.setCurrentText("FCFS")
+    
+    def add_process_row(self):
+        row = self.process_table.rowCount()
+        self.process_table.insertRow(row)
+        
+        name_item = QTableWidgetItem(f"P{row+1}")
+        burst_item = QTableWidgetItem("5")
+        arrival_item = QTableWidgetItem("0")
+        priority_item = QTableWidgetItem("0")
+        
+        remove_button = QPushButton("Remove")
+        remove_button.clicked.connect(lambda: self.remove_row(row))
+        
+        self.process_table.setItem(row, 0, name_item)
+        self.process_table.setItem(row, 1, burst_item)
+        self.process_table.setItem(row, 2, arrival_item)
+        self.process_table.setItem(row, 3, priority_item)
+        self.process_table.setCellWidget(row, 4, remove_button)
+    
+    def remove_row(self, row):
+        self.process_table.removeRow(row)
+    
+    def run_scheduling(self):
+        try:
+            model = self.model_combo.currentText()
+            processes = []
+            for row in range(self.process_table.rowCount()):
+                name = self.process_table.item(row, 0).text()
+                # "cpu, io, cpu, ..." in the burst column alternates CPU and disk I/O
+                bursts = [int(b) for b in self.process_table.item(row, 1).text().split(',')]
+                arrival = int(self.process_table.item(row, 2).text())
+                priority = int(self.process_table.item(row, 3).text())
+                process = {
+                    'name': name,
+                    'burst_time': sum(bursts[::2]),
+                    'arrival_time': arrival,
+                    'priority': priority
+                }
+                if len(bursts) > 1:
+                    if model != "CPU + I/O":
+                        raise ValueError(f"{name}: I/O bursts need the CPU + I/O model")
+                    process['bursts'] = bursts
+                processes.append(process)
+            
+            if not processes:
+                QMessageBox.warning(self, "Error", "No processes to schedule!")
+                return
+            
+            algorithm = self.algo_combo.currentText()
+            quantum = None
+            if POLICIES[algorithm].uses_quantum:
+                quantum = int(self.quantum_input.text())
+            cpus = self.cpu_spin.value()
+            key = (self.scheduler.cache_key(processes, algorithm, quantum, cpus), model)
+            result = self.scheduler.cached(
+                key, lambda: self.compute_schedule(processes, algorithm, quantum, cpus, model))
+            
+            self.display_results(result)
+            self.plot_gantt_chart(result)
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+    
+    def compute_schedule(self, processes, algorithm, quantum, cpus, model):
+        if (model == "CPU + I/O" or cpus > 1) and algorithm not in self.ENGINE_ALGORITHMS:
+            raise ValueError(f"{algorithm} is not available with more than one CPU or with I/O")
+        # Both engines run Round Robin when given a quantum and FCFS without one
+        if model == "CPU + I/O":
+            return self.scheduler.io(processes, quantum)
+        if cpus > 1:
+            return self.scheduler.smp(processes, cpus, quantum)
+        if algorithm not in INCREMENTAL_ALGORITHMS:
+            return self.scheduler.schedule(processes, algorithm, quantum)
+        
+        # Table edits only re-simulate the part of the schedule they affect
+        inc = self.incremental
+        if inc and inc.algorithm == algorithm and inc.quantum == quantum:
+            inc.sync(processes)
+        else:
+            self.incremental = IncrementalSchedule(self.scheduler, processes, algorithm, quantum)
+        return self.incremental.result()
+    
+    def display_results(self, result):
+        text = f"""
+        <h3>Scheduling Results</h3>
+        <p><b>Algorithm:</b> {self.algo_combo.currentText()} &nbsp; <b>Model:</b> {self.model_name(result)}</p>
+        <p><b>Average Waiting Time:</b> {result['avg_waiting']:.2f}</p>
+        <p><b>Average Turnaround Time:</b> {result['avg_turnaround']:.2f}</p>
+        """
+        stats = result.get('policy_stats')
+        if stats:
+            text += f"""
+        <p><b>Slices:</b> {stats['slices']} &nbsp; <b>Context Switches:</b> {stats['context_switches']}</p>
+        """
+        if stats and 'decisions' in stats:
+            text += f"""
+        <p><b>Decisions:</b> {stats['decisions']} &nbsp; <b>Queue Ops:</b> {stats['queue_ops']}
+        &nbsp; <b>Cost per Decision:</b> {stats['ns_per_decision']:.0f} ns</p>
+        """
+        if 'gantt_cpu' in result:
+            utilization = result['utilization']
+            text += f"""
+        <p><b>CPUs:</b> {result['cpus']} &nbsp; <b>Makespan:</b> {result['makespan']}
+        &nbsp; <b>Migrations:</b> {result['migrations']} &nbsp; <b>Steals:</b> {result['steals']}</p>
+        <p><b>Utilization:</b> avg {sum(utilization) / len(utilization):.0%},
+        min {min(utilization):.0%}, max {max(utilization):.0%}</p>
+        """
+        if 'device_utilization' in result:
+            devices = ", ".join(f"{d} {u:.0%}" for d, u in result['device_utilization'].items())
+            text += f"""
+        <p><b>Average Response Time:</b> {result['avg_response']:.2f} &nbsp;
+        <b>Throughput:</b> {result['throughput']:.3f} per unit</p>
+        <p><b>CPU Utilization:</b> {result['cpu_utilization']:.0%} &nbsp; <b>Devices:</b> {devices}</p>
+        """
+        self.results_label.setText(text)
+        self.results_model.set_result(result)
+    
+    def model_name(self, result):
+        if 'gantt_cpu' in result:
+            return f"{result['cpus']} CPUs, per-CPU queues"
+        if 'device_utilization' in result:
+            return "1 CPU + I/O devices"
+        return "1 CPU"
+    
+    def plot_gantt_chart(self, result):
+        if self.gantt_renderer:
+            self.gantt_renderer.disconnect()
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        ax.set_xlabel('Time')
+        ax.set_title('Gantt Chart')
+        
+        self.gantt_renderer = GanttRenderer(ax)
+        if 'gantt_cpu' in result:
+            # One lane per core, labelled with the process on it
+            gantt = result['gantt_chart']
+            self.gantt_renderer.set_arrays(
+                [f"CPU {c}" for c in range(result['cpus'])], result['gantt_cpu'],
+                [s for _, s, _ in gantt], [e for _, _, e in gantt],
+                labels=[name for name, _, _ in gantt]
+            )
+        elif 'gantt_devices' in result:
+            # A CPU lane plus one lane per I/O device
+            devices = list(result['device_utilization'])
+            lanes = {d: k + 1 for k, d in enumerate(devices)}
+            gantt = [(0, name, s, e) for name, s, e in result['gantt_chart']]
+            gantt += [(lanes[d], name, s, e) for d, name, s, e in result['gantt_devices']]
+            self.gantt_renderer.set_arrays(
+                ["CPU"] + devices, [lane for lane, _, _, _ in gantt],
+                [s for _, _, s, _ in gantt], [e for _, _, _, e in gantt],
+                labels=[name for _, name, _, _ in gantt]
+            )
+        else:
+            self.gantt_renderer.set_schedule(result['gantt_chart'])
+        self.canvas.draw()
+
+class DeadlockTab(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.detector = DeadlockDetector()
+        self.init_ui()
+    
+    def init_ui(self):
+        layout = QVBoxLayout()
+        
+        # Setup controls
+        setup_group = QGroupBox("Setup")
+        setup_layout = QHBoxLayout()
+        
+        self.processes_input = QLineEdit("3")
+        self.processes_input.setFixedWidth(50)
+        self.resources_input = QLineEdit("2")
+        self.resources_input.setFixedWidth(50)
+        
+        setup_button = QPushButton("Setup Tables")
+        setup_button.clicked.connect(self.setup_tables)
+        
+        setup_layout.addWidget(QLabel("Processes:"))
+        setup_layout.addWidget(self.processes_input)
+        setup_layout.addWidget(QLabel("Resources:"))
+        setup_layout.addWidget(self.resources_input)
+        setup_layout.addWidget(setup_button)
+        setup_layout.addStretch()
+        setup_group.setLayout(setup_layout)
+        
+        # Matrix views over NumPy arrays; Ctrl+V pastes a block at the current cell
+        tables_layout = QHBoxLayout()
+        
+        self.allocation_model = MatrixModel()
+        self.request_model = MatrixModel()
+        self.available_model = MatrixModel()
+        self.allocation_table = self.create_matrix_view(self.allocation_model)
+        self.request_table = self.create_matrix_view(self.request_model)
+        self.available_table = self.create_matrix_view(self.available_model)
+        self.available_table.verticalHeader().setVisible(False)
+        
+        tables_layout.addWidget(self.create_table_group("Allocation", self.allocation_table, self.allocation_model))
+        tables_layout.addWidget(self.create_table_group("Request", self.request_table, self.request_model))
+        tables_layout.addWidget(self.create_table_group("Available", self.available_table, self.available_model))
+        
+        # Detect button
+        detect_button = QPushButton("Detect Deadlock")
+        detect_button.clicked.connect(self.detect_deadlock)
+        
+        # Results
+        self.results_label = QLabel("Results will appear here")
+        self.results_label.setWordWrap(True)
+        
+        layout.addWidget(setup_group)
+        layout.addLayout(tables_layout)
+        layout.addWidget(detect_button)
+        layout.addWidget(self.results_label)
+        
+        self.setLayout(layout)
+        
+        # Initial setup
+        self.setup_tables()
+    
+    def create_matrix_view(self, model):
+        view = QTableView()
+        view.setModel(model)
+        paste = QAction("Paste", view)
+        paste.setShortcut(QKeySequence.Paste)
+        paste.setShortcutContext(Qt.WidgetShortcut)
+        paste.triggered.connect(lambda: self.paste_block(view, model))
+        view.addAction(paste)
+        return view
+    
+    def create_table_group(self, title, table, model):
+        group = QGroupBox(title)
+        layout = QVBoxLayout()
+        layout.addWidget(table)
+        
+        buttons = QHBoxLayout()
+        load_button = QPushButton("Load...")
+        load_button.clicked.connect(lambda: self.load_matrix(title, model))
+        save_button = QPushButton("Save...")
+        save_button.clicked.connect(lambda: self.save_matrix(title, model))
+        buttons.addWidget(load_button)
+        buttons.addWidget(save_button)
+        layout.addLayout(buttons)
+        
+        group.setLayout(layout)
+        return group
+    
+    def setup_tables(self):
+        try:
+            n = int(self.processes_input.text())
+            m = int(self.resources_input.text())
+            
+            self.allocation_model.set_array(np.zeros((n, m), dtype=np.int64))
+            self.request_model.set_array(np.zeros((n, m), dtype=np.int64))
+            self.available_model.set_array(np.ones((1, m), dtype=np.int64))
+            
+        except ValueError:
+            QMessageBox.warning(self, "Error", "Please enter valid numbers for processes and resources")
+    
+    def paste_block(self, view, model):
+        index = view.currentIndex()
+        row, column = (index.row(), index.column()) if index.isValid() else (0, 0)
+        try:
+            model.paste(row, column, QApplication.clipboard().text())
+        except ValueError as e:
+            QMessageBox.warning(self, "Error", f"Clipboard does not hold a block of integers: {e}")
+    
+    def load_matrix(self, title, model):
+        path, _ = QFileDialog.getOpenFileName(self, f"Load {title}", "", "Matrices (*.npy *.csv);;All Files (*)")
+        if not path:
+            return
+        try:
+            model.load(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "Error", f"Could not load {path}: {e}")
+            return
+        
+        # Bring the other matrices to the loaded shape
+        n, m = model.array.shape
+        if model is self.available_model:
+            n = self.allocation_model.array.shape[0]
+            if model.array.shape[0] != 1:
+                model.set_array(model.array.reshape(1, -1))
+                m = model.array.shape[1]
+        for other in (self.allocation_model, self.request_model):
+            if other is not model:
+                other.resize(n, m)
+        if model is not self.available_model:
+            self.available_model.resize(1, m, fill=1)
+        self.processes_input.setText(str(n))
+        self.resources_input.setText(str(m))
+    
+    def save_matrix(self, title, model):
+        path, _ = QFileDialog.getSaveFileName(self, f"Save {title}", f"{title.lower()}.npy",
+                                              "NumPy (*.npy);;CSV (*.csv)")
+        if not path:
+            return
+        try:
+            model.save(path)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Could not save {path}: {e}")
+    
+    def detect_deadlock(self):
+        try:
+            allocation = self.allocation_model.array
+            request = self.request_model.array
+            available = self.available_model.array[0]
+            
+            result = self.detector.detect_deadlock(allocation, request, available)
+            
+            if result['deadlock']:
+                self.results_label.setText("<h3>Deadlock Detected!</h3><p style='color: red;'>The system is in a deadlock state.</p>")
+            else:
+                self.results_label.setText(f"""
+                    <h3>No Deadlock</h3>
+                    <p style='color: green;'>The system is in a safe state.</p>
+                    <p><b>Safe Sequence:</b> {' → '.join(result['safe_sequence'])}</p>
+                """)
+        
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+
+from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, 
+                            QLabel, QSpinBox, QLineEdit, QPushButton, 
+                            QTableWidget, QTableWidgetItem, QTextEdit)
+
+LOG_LINES = 500
+TIMELINE_PROCESSES = 50
+
+def flush_events(event_log, cursor, output):
+    """Appends the events logged after `cursor` to `output` in one go; returns the new cursor"""
+    events, lost = event_log.since(cursor, limit=LOG_LINES - 1)
+    lines = [f"... {lost} events not shown"] if lost else []
+    for event in events:
+        lines.append(event.message if event.time is None else f"[{event.time:03d}] {event.message}")
+    if lines:
+        output.append("\n".join(lines))
+    return event_log.seq
+
+def format_stat(value):
+    return "-" if value is None else f"{value:.3f}"
+
+class ProcessSyncTab(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.simulation = SyncSimulation()
+        self.spill_path = None
+        self.event_log = EventLog()
+        self.log_cursor = 0
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.update_simulation)
+        self.pending_steps = 0.0
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        # Configuration Panel
+        config_group = QGroupBox("Configuration")
+        config_layout = QHBoxLayout()
+
+        self.scenario_combo = QComboBox()
+        self.scenario_combo.addItem("Single Resource", None)
+        self.scenario_combo.addItem("Producer-Consumer", 'producer-consumer')
+        self.scenario_combo.addItem("Readers-Writers", 'readers-writers')
+        self.scenario_combo.addItem("Dining Philosophers", 'dining-philosophers')
+        self.scenario_combo.addItem("Dining Philosophers (ordered forks)", 'ordered-philosophers')
+        self.scenario_combo.currentIndexChanged.connect(self.toggle_scenario)
+
+        self.process_spin = QSpinBox()
+        self.process_spin.setRange(2, 2000)
+        self.process_spin.setValue(3)
+
+        self.resource_input = QLineEdit("Printer")
+        self.semaphore_spin = QSpinBox()
+        self.semaphore_spin.setRange(1, 3)
+        self.semaphore_spin.setValue(1)
+
+        config_layout.addWidget(QLabel("Scenario:"))
+        config_layout.addWidget(self.scenario_combo)
+        config_layout.addWidget(QLabel("Processes:"))
+        config_layout.addWidget(self.process_spin)
+        config_layout.addWidget(QLabel("Shared Resource:"))
+        config_layout.addWidget(self.resource_input)
+        config_layout.addWidget(QLabel("Semaphores:"))
+        config_layout.addWidget(self.semaphore_spin)
+        config_layout.addStretch()
+
+        config_group.setLayout(config_layout)
+
+        # Control Buttons
+        button_layout = QHBoxLayout()
+        self.start_button = QPushButton("Start")
+        self.start_button.clicked.connect(self.start_simulation)
+        self.pause_button = QPushButton("Pause")
+        self.pause_button.clicked.connect(self.pause_simulation)
+        self.pause_button.setEnabled(False)
+        self.reset_button = QPushButton("Reset")
+        self.reset_button.clicked.connect(self.reset_simulation)
+
+        # Playback: simulated time units per second, sampled at a fixed frame rate
+        self.speed_spin = QSpinBox()
+        self.speed_spin.setRange(1, 1000000)
+        self.speed_spin.setValue(1)
+        self.speed_spin.setSuffix(" units/s")
+        self.fps_spin = QSpinBox()
+        self.fps_spin.setRange(1, 60)
+        self.fps_spin.setValue(10)
+        self.fps_spin.setSuffix(" fps")
+        self.fps_spin.valueChanged.connect(self.update_frame_rate)
+        self.steps_spin = QSpinBox()
+        self.steps_spin.setRange(1, 100000000)
+        self.steps_spin.setValue(1000)
+        self.run_steps_button = QPushButton("Run Steps")
+        self.run_steps_button.clicked.connect(self.run_steps)
+        self.run_steps_button.setEnabled(False)
+        self.spill_button = QPushButton("Log to File...")
+        self.spill_button.clicked.connect(self.choose_spill_file)
+
+        button_layout.addWidget(self.start_button)
+        button_layout.addWidget(self.pause_button)
+        button_layout.addWidget(self.reset_button)
+        button_layout.addWidget(QLabel("Speed:"))
+        button_layout.addWidget(self.speed_spin)
+        button_layout.addWidget(QLabel("Refresh:"))
+        button_layout.addWidget(self.fps_spin)
+        button_layout.addWidget(self.steps_spin)
+        button_layout.addWidget(self.run_steps_button)
+        button_layout.addWidget(self.spill_button)
+
+        # Process State Table
+        self.state_model = SyncStateModel()
+        self.state_table = QTableView()
+        self.state_table.setModel(self.state_model)
+        self.state_table.verticalHeader().setVisible(False)
+
+        # Timeline Visualization
+        self.timeline_label = QLabel("Timeline will appear here")
+        self.timeline_label.setWordWrap(True)
+
+        # Log Output
+        self.log_output = QTextEdit()
+        self.log_output.setReadOnly(True)
+        self.log_output.setMaximumHeight(100)
+        self.log_output.document().setMaximumBlockCount(LOG_LINES)
+
+        layout.addWidget(config_group)
+        layout.addLayout(button_layout)
+        layout.addWidget(self.state_table)
+        layout.addWidget(self.create_stats_group())
+        layout.addWidget(self.timeline_label)
+        layout.addWidget(self.log_output)
+        self.setLayout(layout)
+
+    def create_stats_group(self):
+        stats_group = QGroupBox("Statistics")
+        stats_layout = QVBoxLayout()
+        controls = QHBoxLayout()
+        self.stats_scope = QComboBox()
+        self.stats_scope.addItem("Resources", 'resource')
+        self.stats_scope.addItem("Processes", 'process')
+        self.stats_scope.addItem("Real run: Resources", 'real-resource')
+        self.stats_scope.addItem("Real run: Processes", 'real-process')
+        self.stats_scope.currentIndexChanged.connect(lambda: self.refresh_stats(force=True))
+        self.fairness_label = QLabel("Fairness: -")
+        export_button = QPushButton("Export Stats...")
+        export_button.clicked.connect(self.export_stats)
+        controls.addWidget(QLabel("Show:"))
+        controls.addWidget(self.stats_scope)
+        controls.addWidget(self.fairness_label)
+        controls.addStretch()
+        controls.addWidget(export_button)
+
+        # Run the same scenario on real threads or asyncio tasks to calibrate against
+        real_controls = QHBoxLayout()
+        self.real_mode = QComboBox()
+        self.real_mode.addItems(["threads", "asyncio"])
+        self.real_unit = QSpinBox()
+        self.real_unit.setRange(1, 1000)
+        self.real_unit.setValue(2)
+        self.real_unit.setSuffix(" ms/unit")
+        self.real_duration = QSpinBox()
+        self.real_duration.setRange(1, 60)
+        self.real_duration.setValue(2)
+        self.real_duration.setSuffix(" s")
+        real_button = QPushButton("Run for Real")
+        real_button.clicked.connect(self.run_real)
+        real_controls.addWidget(QLabel("Real run:"))
+        real_controls.addWidget(self.real_mode)
+        real_controls.addWidget(self.real_unit)
+        real_controls.addWidget(self.real_duration)
+        real_controls.addWidget(real_button)
+        real_controls.addStretch()
+        self.calibration = None
+
+        self.stats_model = SyncStatsModel()
+        self.stats_table = QTableView()
+        self.stats_table.setModel(self.stats_model)
+        self.stats_table.verticalHeader().setVisible(False)
+        self.stats_table.setMaximumHeight(160)
+        self.stats_shown = 0.0
+
+        stats_layout.addLayout(controls)
+        stats_layout.addLayout(real_controls)
+        stats_layout.addWidget(self.stats_table)
+        stats_group.setLayout(stats_layout)
+        return stats_group
+
+    def toggle_scenario(self):
+        single = self.scenario_combo.currentData() is None
+        self.resource_input.setEnabled(single)
+        self.semaphore_spin.setEnabled(single)
+
+    def start_simulation(self):
+        self.reset_simulation()
+        num_processes = self.process_spin.value()
+        resource = self.resource_input.text()
+        num_semaphores = self.semaphore_spin.value()
+
+        if self.spill_path:
+            self.event_log = EventLog(spill=self.spill_path)
+
+        scenario = self.scenario_combo.currentData()
+        if scenario:
+            self.simulation = SCENARIOS[scenario](num_processes)
+            resource = ", ".join(self.simulation.resources)
+        else:
+            self.simulation = SyncSimulation()
+            self.simulation.start(num_processes, resource, num_semaphores)
+        self.simulation.event_log = self.event_log
+
+        self.update_state_table()
+        self.refresh_stats(force=True)
+        self.timer.start(self.frame_interval())
+        self.start_button.setEnabled(False)
+        self.pause_button.setEnabled(True)
+        self.run_steps_button.setEnabled(True)
+        self.log(f"Simulation started with {len(self.simulation.processes)} processes sharing {resource}")
+
+    def pause_simulation(self):
+        if self.timer.isActive():
+            self.timer.stop()
+            self.refresh_stats(force=True)
+            self.pause_button.setText("Resume")
+            self.log("Simulation paused")
+        else:
+            self.timer.start(self.frame_interval())
+            self.pause_button.setText("Pause")
+            self.log("Simulation resumed")
+
+    def reset_simulation(self):
+        self.timer.stop()
+        self.simulation.processes = []
+        self.simulation.time = 0
+        self.pending_steps = 0.0
+        self.state_model.set_processes([])
+        self.timeline_label.setText("Timeline will appear here")
+        self.log_output.clear()
+        self.event_log.close()
+        self.event_log = EventLog()
+        self.log_cursor = 0
+        self.start_button.setEnabled(True)
+        self.pause_button.setEnabled(False)
+        self.pause_button.setText("Pause")
+        self.run_steps_button.setEnabled(False)
+
+    def choose_spill_file(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Log Events To", "", "JSON Lines (*.jsonl);;Binary (*.bin)")
+        if path:
+            self.spill_path = path
+            self.spill_button.setToolTip(path)
+            self.log(f"Events will be written to {path} from the next start")
+
+    def frame_interval(self):
+        return max(1, 1000 // self.fps_spin.value())
+
+    def update_frame_rate(self):
+        if self.timer.isActive():
+            self.timer.start(self.frame_interval())
+
+    def update_simulation(self):
+        # Advance by however much simulated time one frame covers, carrying
+        # the fraction over so slow speeds still tick at the right rate
+        self.pending_steps += self.speed_spin.value() / self.fps_spin.value()
+        steps = int(self.pending_steps)
+        self.pending_steps -= steps
+        if steps:
+            self.simulation.run(steps)
+            self.show_snapshot()
+
+    def run_steps(self):
+        self.simulation.run(self.steps_spin.value())
+        self.show_snapshot()
+        self.refresh_stats(force=True)
+
+    def show_snapshot(self):
+        self.timeline_label.setText(self.simulation.timeline(TIMELINE_PROCESSES))
+        self.update_state_table()
+        self.flush_log()
+        self.refresh_stats()
+
+    def refresh_stats(self, force=False):
+        # Percentiles walk every sketch, so during playback refresh once a second
+        now = perf_counter()
+        if not force and now - self.stats_shown < 1.0:
+            return
+        self.stats_shown = now
+        stats, time, scope = self.shown_stats()
+        if stats is None:
+            self.stats_model.set_rows([])
+            self.fairness_label.setText("No real run yet")
+            return
+        self.stats_model.set_rows(stats.rows(time, scope))
+        fairness, hold_fairness = stats.fairness(), stats.hold_fairness()
+        self.fairness_label.setText(
+            "Jain's fairness: acquisitions "
+            + ("-" if fairness is None else f"{fairness:.3f}")
+            + ", hold time "
+            + ("-" if hold_fairness is None else f"{hold_fairness:.3f}")
+        )
+
+    def shown_stats(self):
+        """(stats, elapsed time units, row scope) behind the statistics panel"""
+        scope = self.stats_scope.currentData()
+        if scope.startswith('real-'):
+            if self.calibration is None:
+                return None, 0, scope[5:]
+            real = self.calibration['real']
+            return real.stats, real.units, scope[5:]
+        return self.simulation.stats, self.simulation.time, scope
+
+    def run_real(self):
+        from .realtime import calibrate
+
+        scenario = self.scenario_combo.currentData()
+        if scenario:
+            simulation = SCENARIOS[scenario](self.process_spin.value())
+        else:
+            hold = min(self.simulation.WORK_UNITS, self.simulation.MAX_HOLD_TIME)
+            simulation = shared_resource(self.process_spin.value(), self.semaphore_spin.value(),
+                                         hold, self.resource_input.text())
+        mode, unit = self.real_mode.currentText(), self.real_unit.value() / 1000
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            self.calibration = calibrate(simulation, mode, unit, self.real_duration.value())
+        except (ValueError, RuntimeError) as e:
+            QMessageBox.warning(self, "Error", f"Real run failed: {str(e)}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        c = self.calibration
+        self.log(f"Real {mode} run: {c['elapsed']:.2f} s ({c['units']} units), "
+                 f"{c['throughput']:.0f} acquisitions/s vs {c['simulated_throughput']:.0f}/s simulated")
+        for row in c['resources'][:10]:
+            self.log(f"  {row['resource']}: rate {format_stat(row['simulated_rate'])} simulated / "
+                     f"{format_stat(row['real_rate'])} real per unit, wait p95 "
+                     f"{format_stat(row['simulated_wait_p95'])} / {format_stat(row['real_wait_p95'])} units "
+                     f"({format_stat(row['real_latency_p95_ms'])} ms)")
+        self.stats_scope.setCurrentIndex(self.stats_scope.findData('real-resource'))
+        self.refresh_stats(force=True)
+
+    def export_stats(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Statistics", "", "JSON (*.json);;CSV (*.csv)")
+        if not path:
+            return
+        stats, time, _ = self.shown_stats()
+        if stats is None:
+            return
+        try:
+            stats.export(path, time)
+            self.log(f"Statistics exported to {path}")
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"Could not export statistics: {str(e)}")
+
+    def flush_log(self):
+        self.log_cursor = flush_events(self.event_log, self.log_cursor, self.log_output)
+
+    def update_state_table(self):
+        processes = self.simulation.snapshot()
+        if self.state_model.processes is not processes:
+            self.state_model.set_processes(processes)
+            self.simulation.take_changed()
+        else:
+            self.state_model.refresh(self.simulation.take_changed())
+
+    def log(self, message):
+        self.event_log.append(self.simulation.time, 'info', message)
+        self.flush_log()
+
+  
+from PyQt5.QtGui import QPixmap, QPainter, QColor, QIntValidator
+
+from PyQt5.QtWidgets import QMessageBox, QComboBox, QGridLayout
+
+class MemoryManagerTab(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.manager = MemoryManager()
+        self.event_log = EventLog()
+        self.manager.event_log = self.event_log
+        self.log_cursor = 0
+        self.allocation_strategy = "First Fit"
+        self.partition_type = "Variable"
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        # Configuration Panel
+        config_group = QGroupBox("Memory Configuration")
+        config_layout = QGridLayout()
+
+        # Memory Size Input
+        config_layout.addWidget(QLabel("Total Memory:"), 0, 0)
+        self.memory_input = QLineEdit(str(self.manager.total_memory))
+        self.memory_input.setValidator(QIntValidator(100, 9999))
+        config_layout.addWidget(self.memory_input, 0, 1)
+
+        # Partition Type
+        config_layout.addWidget(QLabel("Partition Type:"), 1, 0)
+        self.partition_combo = QComboBox()
+        self.partition_combo.addItems(["Variable", "Fixed"])
+        self.partition_combo.currentTextChanged.connect(self.change_partition_type)
+        config_layout.addWidget(self.partition_combo, 1, 1)
+
+        # Fixed Partitions Configuration (hidden by default)
+        self.fixed_partitions_group = QGroupBox("Fixed Partitions")
+        fixed_layout = QHBoxLayout()
+        self.partition_sizes_input = QLineEdit("100,200,300,200,100")
+        fixed_layout.addWidget(QLabel("Partition Sizes:"))
+        fixed_layout.addWidget(self.partition_sizes_input)
+        self.fixed_partitions_group.setLayout(fixed_layout)
+        self.fixed_partitions_group.hide()
+        config_layout.addWidget(self.fixed_partitions_group, 2, 0, 1, 2)
+
+        # Allocation Strategy
+        config_layout.addWidget(QLabel("Allocation Strategy:"), 3, 0)
+        self.strategy_combo = QComboBox()
+        self.strategy_combo.addItems(["First Fit", "Best Fit", "Worst Fit"])
+        config_layout.addWidget(self.strategy_combo, 3, 1)
+
+        # Process Allocation Controls
+        process_group = QGroupBox("Process Allocation")
+        process_layout = QHBoxLayout()
+        self.process_size_input = QLineEdit("100")
+        self.process_size_input.setValidator(QIntValidator(1, 9999))
+        self.allocate_btn = QPushButton("Allocate")
+        self.allocate_btn.clicked.connect(self.allocate_memory)
+        self.deallocate_btn = QPushButton("Deallocate")
+        self.deallocate_btn.clicked.connect(self.deallocate_memory)
+        process_layout.addWidget(QLabel("Process Size:"))
+        process_layout.addWidget(self.process_size_input)
+        process_layout.addWidget(self.allocate_btn)
+        process_layout.addWidget(self.deallocate_btn)
+        process_group.setLayout(process_layout)
+
+        # Initialize Button
+        init_btn = QPushButton("Initialize Memory")
+        init_btn.clicked.connect(self.initialize_memory)
+
+        # Memory Visualization
+        self.memory_canvas = QLabel()
+        self.memory_canvas.setMinimumHeight(200)
+        self.memory_canvas.setStyleSheet("background-color: #f0f0f0; border: 1px solid #ccc;")
+
+        # Fragmentation Info
+        self.fragmentation_label = QLabel("Fragmentation: None")
+        self.fragmentation_label.setStyleSheet("font-weight: bold;")
+
+        # Process Table
+        self.process_table = QTableWidget()
+        self.process_table.setColumnCount(4)
+        self.process_table.setHorizontalHeaderLabels(["Process", "Size", "Location", "Action"])
+        self.process_table.verticalHeader().setVisible(False)
+
+        self.log_output = QTextEdit()
+        self.log_output.setReadOnly(True)
+        self.log_output.setMaximumHeight(100)
+        self.log_output.document().setMaximumBlockCount(LOG_LINES)
+
+        # Add widgets to main layout
+        layout.addWidget(config_group)
+        config_group.setLayout(config_layout)
+        layout.addWidget(init_btn)
+        layout.addWidget(process_group)
+        layout.addWidget(self.memory_canvas)
+        layout.addWidget(self.fragmentation_label)
+        layout.addWidget(self.process_table)
+        layout.addWidget(self.log_output)
+        self.setLayout(layout)
+
+    def change_partition_type(self, text):
+        self.partition_type = text
+        if text == "Fixed":
+            self.fixed_partitions_group.show()
+        else:
+            self.fixed_partitions_group.hide()
+
+    def initialize_memory(self):
+        try:
+            total_memory = int(self.memory_input.text())
+            sizes = None
+            if self.partition_type == "Fixed":
+                sizes = [int(s.strip()) for s in self.partition_sizes_input.text().split(",")]
+            self.manager.initialize(total_memory, self.partition_type, sizes)
+            
+            self.update_visualization()
+            self.update_fragmentation()
+            self.flush_log()
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Invalid memory configuration: {str(e)}")
+
+    def allocate_memory(self):
+        if not self.manager.memory:
+            QMessageBox.warning(self, "Error", "Memory not initialized!")
+            return
+            
+        try:
+            size = int(self.process_size_input.text())
+            strategy = self.strategy_combo.currentText()
+            
+            if self.manager.allocate(size, strategy):
+                self.update_visualization()
+                self.update_fragmentation()
+                self.flush_log()
+                self.update_process_table()
+            else:
+                QMessageBox.warning(self, "Error", "No suitable block found for allocation!")
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Allocation failed: {str(e)}")
+
+    def deallocate_memory(self):
+        if not self.manager.memory:
+            return
+            
+        selected = self.process_table.currentRow()
+        if selected == -1:
+            QMessageBox.warning(self, "Error", "No process selected!")
+            return
+            
+        process_id = self.process_table.item(selected, 0).text()
+        
+        if self.manager.deallocate(process_id):
+            self.update_visualization()
+            self.update_fragmentation()
+            self.flush_log()
+            self.update_process_table()
+        else:
+            QMessageBox.warning(self, "Error", "Process not found in memory!")
+
+    def update_visualization(self):
+        if not self.manager.memory:
+            return
+            
+        blocks = self.manager.get_blocks()
+        total_size = sum(b.size for b in blocks)
+        scale = 500 / total_size
+        
+        pixmap = QPixmap(520, 100)
+        pixmap.fill(Qt.white)
+        painter = QPainter(pixmap)
+        
+        x = 10
+        for block in blocks:
+            width = max(10, int(block.size * scale))
+            color = QColor(100, 200, 100) if block.process else QColor(200, 100, 100)
+            painter.setBrush(color)
+            painter.drawRect(x, 10, width, 80)
+            
+            text = f"{block.process or 'Free'}\n{block.size}KB"
+            painter.drawText(x, 50, width, 40, Qt.AlignCenter, text)
+            x += width + 2
+        
+        painter.end()
+        self.memory_canvas.setPixmap(pixmap)
+
+    def update_fragmentation(self):
+        if not self.manager.memory:
+            return
+            
+        frag = self.manager.fragmentation()
+        
+        if frag is None:
+            self.fragmentation_label.setText("Fragmentation: None")
+        elif self.manager.partition_type == "Variable":
+            self.fragmentation_label.setText(
+                f"Fragmentation: External={frag['external']}KB, Internal={frag['internal']}KB"
+            )
+        else:
+            self.fragmentation_label.setText(
+                f"Fragmentation: Internal={frag['internal']}KB (Fixed partitions)"
+            )
+
+    def update_process_table(self):
+        blocks = [b for b in self.manager.get_blocks() if b.process]
+        self.process_table.setRowCount(len(blocks))
+        
+        for row, block in enumerate(blocks):
+            self.process_table.setItem(row, 0, QTableWidgetItem(block.process))
+            self.process_table.setItem(row, 1, QTableWidgetItem(str(block.size)))
+            self.process_table.setItem(row, 2, QTableWidgetItem(f"{block.start}-{block.start + block.size}"))
+            
+            btn = QPushButton("Deallocate")
+            btn.clicked.connect(lambda _, r=row: self.deallocate_by_row(r))
+            self.process_table.setCellWidget(row, 3, btn)
+
+    def flush_log(self):
+        self.log_cursor = flush_events(self.event_log, self.log_cursor, self.log_output)
+
+    def deallocate_by_row(self, row):
+        self.process_table.selectRow(row)
+        self.deallocate_memory()
+
+class MainWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Operating System Project")
+        self.setGeometry(100, 100, 1000, 800)
+        
+        self.tabs = QTabWidget()
+        self.scheduling_tab = SchedulingTab()
+        self.deadlock_tab = DeadlockTab()
+        self.sync_tab = ProcessSyncTab() 
+        self.memory_tab = MemoryManagerTab()
+
+        self.tabs.addTab(self.scheduling_tab, "Process Scheduling")
+        self.tabs.addTab(self.deadlock_tab, "Deadlock Detection")
+        self.tabs.addTab(self.sync_tab, "Process Sync")  
+        self.tabs.addTab(self.memory_tab, "Memory Manager")
+        self.setCentralWidget(self.tabs)
+        
+
+
+def main():
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec_())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""Incremental re-scheduling of an edited single-CPU workload"""
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+
+from .policies import slice_stats
+
+# Algorithms whose schedule can be cut at idle points, with their engine policy
+INCREMENTAL_ALGORITHMS = {
+    "FCFS": 'fcfs',
+    "SJF": 'sjf',
+    "SRTF": 'srtf',
+    "Round Robin": None,
+}
+
+class IncrementalSchedule:
+    """Keeps a schedule up to date while processes are edited, added or removed.
+
+    The last run is kept as its time-ordered slices, the busy periods they form
+    and each process's finish time, plus the processes sorted by arrival. An
+    idle point, where the CPU has nothing queued, is a clean cut: everything
+    that arrived earlier has finished, and everything after depends only on
+    later arrivals. An edit therefore re-simulates just the window from the
+    idle point before the earliest touched arrival to the first idle point
+    after the latest one that the previous run shares, and splices the rest of
+    the old schedule back in around it.
+    """
+    def __init__(self, scheduler, processes, algorithm, quantum=None):
+        if algorithm not in INCREMENTAL_ALGORITHMS:
+            raise ValueError(f"Incremental scheduling does not support {algorithm}")
+        if algorithm == "Round Robin" and (quantum is None or quantum <= 0):
+            raise ValueError("Quantum must be positive")
+        
+        self.scheduler = scheduler
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.processes = []
+        self.index = []      # (arrival, seq, process), sorted
+        self.seq = {}        # id(process) -> position key within the list
+        self.slices = []     # (process, start, end), sorted by start
+        self.starts = []
+        self.periods = []    # [start, end] of each busy period
+        self.period_starts = []
+        self.finish = {}     # id(process) -> completion time
+        self.last_window = 0
+        self.replace(0, 0, processes)
+    
+    def insert(self, index, process):
+        self.replace(index, index, [process])
+    
+    def delete(self, index):
+        self.replace(index, index + 1, [])
+    
+    def update(self, index, process):
+        self.replace(index, index + 1, [process])
+    
+    def sync(self, processes):
+        """Brings the schedule in line with a new process list.
+
+        Only the rows between the common prefix and common suffix of the old
+        and new lists count as edited.
+        """
+        old = [(p['name'], p['arrival_time'], p['burst_time']) for p in self.processes]
+        new = [(p['name'], p['arrival_time'], p['burst_time']) for p in processes]
+        start = 0
+        while start < len(old) and start < len(new) and old[start] == new[start]:
+            start += 1
+        stop_old, stop_new = len(old), len(new)
+        while stop_old > start and stop_new > start and old[stop_old - 1] == new[stop_new - 1]:
+            stop_old -= 1
+            stop_new -= 1
+        self.replace(start, stop_old, processes[start:stop_new])
+    
+    def replace(self, start, stop, processes):
+        """Replaces self.processes[start:stop] and re-simulates the affected window"""
+        removed = self.processes[start:stop]
+        added = [dict(p) for p in processes]
+        if not removed and not added:
+            self.last_window = 0
+            return
+        
+        touched = [p['arrival_time'] for p in removed + added]
+        lo, hi = min(touched), max(touched)
+        
+        for p in removed:
+            del self.index[bisect_left(self.index, (p['arrival_time'], self.seq.pop(id(p))))]
+            self.finish.pop(id(p), None)
+        self.processes[start:stop] = added
+        self.number(start, len(added))
+        for p in added:
+            insort(self.index, (p['arrival_time'], self.seq[id(p)], p))
+        
+        # Resume from the last idle point at or before the earliest touched arrival
+        t0 = self.idle_point_before(lo)
+        first = bisect_left(self.index, (t0,))
+        last = bisect_right(self.index, (hi, float('inf')))
+        size = max(last - first, 1)
+        
+        # Grow the window until the new run goes idle where the old one did
+        while True:
+            stop = min(first + size, len(self.index))
+            while 0 < stop < len(self.index) and self.index[stop][0] == self.index[stop - 1][0]:
+                stop += 1
+            window = [entry[2] for entry in sorted(self.index[first:stop], key=itemgetter(1))]
+            slices = self.simulate(window)
+            
+            makespan = max([hi] + [p['arrival_time'] for p in window] + [end for _, _, end in slices])
+            if stop == len(self.index):
+                resume = float('inf')
+                break
+            next_arrival = self.index[stop][0]
+            reach = makespan
+            if makespan <= next_arrival:
+                resume = self.idle_point_after(makespan)
+                if hi < resume <= next_arrival and resume > 0:
+                    break
+                reach = resume
+            # The window must at least cover everything arriving before reach
+            size = max(size * 2, bisect_right(self.index, (reach, float('inf'))) - first)
+        
+        self.last_window = len(window)
+        for p in window:
+            self.finish[id(p)] = p['arrival_time']
+        for p, _, end in slices:
+            self.finish[id(p)] = max(self.finish[id(p)], end)
+        self.splice(t0, resume, slices)
+    
+    def simulate(self, window):
+        """Runs the engine over one window, returning slices sorted by start"""
+        if self.algorithm == "Round Robin":
+            slices = self.scheduler.rr_slices(window, self.quantum)
+        else:
+            slices = self.scheduler.event_slices(window, INCREMENTAL_ALGORITHMS[self.algorithm])
+        return sorted(((window[i], start, end) for i, start, end in slices), key=itemgetter(1))
+    
+    def number(self, start, count):
+        """Gives self.processes[start:start + count] keys between their neighbours"""
+        lower = self.seq[id(self.processes[start - 1])] if start > 0 else None
+        after = start + count
+        upper = self.seq[id(self.processes[after])] if after < len(self.processes) else None
+        
+        if lower is None and upper is None:
+            keys = list(range(count))
+        elif lower is None:
+            keys = [upper - count + i for i in range(count)]
+        elif upper is None:
+            keys = [lower + 1 + i for i in range(count)]
+        else:
+            step = (upper - lower) / (count + 1)
+            keys = [lower + step * (i + 1) for i in range(count)]
+            if not all(a < b for a, b in zip([lower] + keys, keys + [upper])):
+                # Out of float precision between the neighbours: renumber all
+                for i, p in enumerate(self.processes):
+                    self.seq[id(p)] = i
+                self.index = sorted((p['arrival_time'], i, p) for i, p in enumerate(self.processes)
+                                    if i < start or i >= after)
+                return
+        
+        for key, p in zip(keys, self.processes[start:after]):
+            self.seq[id(p)] = key
+    
+    def idle_point_before(self, time):
+        """Latest time <= time at which the previous run had nothing queued"""
+        j = bisect_left(self.period_starts, time) - 1
+        if j >= 0 and self.periods[j][1] > time:
+            time = self.periods[j][0]
+        # The engines start the clock at 0 with everything arrived so far
+        return time if time > 0 else float('-inf')
+    
+    def idle_point_after(self, time):
+        """Earliest time >= time at which the previous run had nothing queued"""
+        j = bisect_left(self.period_starts, time) - 1
+        if j >= 0 and self.periods[j][1] > time:
+            return self.periods[j][1]
+        return time
+    
+    def splice(self, t0, resume, slices):
+        """Replaces the old slices between two idle points with a re-simulated window"""
+        # Zero-burst processes can be dispatched right at an idle point; keep
+        # them on the side of the cut their arrival belongs to
+        k0 = bisect_left(self.starts, t0)
+        k1 = bisect_right(self.starts, t0)
+        head = [s for s in self.slices[k0:k1] if s[0]['arrival_time'] < t0]
+        k2 = bisect_left(self.starts, resume)
+        k3 = bisect_right(self.starts, resume)
+        tail = [s for s in self.slices[k2:k3] if s[0]['arrival_time'] >= resume]
+        
+        middle = head + slices + tail
+        self.slices[k0:k3] = middle
+        self.starts[k0:k3] = [start for _, start, _ in middle]
+        
+        # Rebuild the busy periods over the same span, merging at the seams
+        j0 = bisect_left(self.period_starts, t0)
+        j1 = bisect_left(self.period_starts, resume)
+        if j0 > 0 and self.periods[j0 - 1][1] >= t0:
+            j0 -= 1
+            middle = [(None, *self.periods[j0])] + middle
+        if j1 < len(self.periods):
+            middle = middle + [(None, *self.periods[j1])]
+            j1 += 1
+        periods = []
+        for _, start, end in middle:
+            if periods and start <= periods[-1][1]:
+                periods[-1][1] = max(periods[-1][1], end)
+            else:
+                periods.append([start, end])
+        self.periods[j0:j1] = periods
+        self.period_starts[j0:j1] = [start for start, _ in periods]
+    
+    def result(self):
+        """Result dict in the same shape as ProcessScheduler.schedule, in input order"""
+        n = len(self.processes)
+        gantt = [(p['name'], start, end) for p, start, end in self.slices if end > start]
+        tat = [self.finish[id(p)] - p['arrival_time'] for p in self.processes]
+        wt = [tat[i] - p['burst_time'] for i, p in enumerate(self.processes)]
+        
+        return {
+            'processes': list(self.processes),
+            'waiting_time': wt,
+            'turnaround_time': tat,
+            'avg_waiting': sum(wt) / n if n else 0,
+            'avg_turnaround': sum(tat) / n if n else 0,
+            'gantt_chart': gantt,
+            'policy_stats': slice_stats(gantt)
+        }
@@ -0,0 +1,153 @@
+class MemoryBlock:
+    def __init__(self, start, size, process=None):
+        self.start = start
+        self.size = size
+        self.process = process  # None means free block
+        self.next = None
+
+class MemoryManager:
+    """Linked list of memory blocks with fixed or variable partitioning"""
+    def __init__(self):
+        self.memory = None
+        self.total_memory = 1024  # Default 1KB memory
+        self.partition_type = "Variable"
+        self.log_callback = None
+        self.event_log = None
+
+    def initialize(self, total_memory, partition_type="Variable", partition_sizes=None):
+        self.total_memory = total_memory
+        self.partition_type = partition_type
+        
+        if partition_type == "Variable":
+            # Initialize as single free block
+            self.memory = MemoryBlock(0, total_memory)
+            self.log("Initialized variable partition memory", 'init')
+        else:
+            # Initialize fixed partitions
+            sizes = list(partition_sizes or [])
+            if sum(sizes) > total_memory:
+                raise ValueError("Partitions exceed total memory")
+            
+            self.memory = None
+            current = None
+            start = 0
+            for size in sizes:
+                block = MemoryBlock(start, size)
+                if self.memory is None:
+                    self.memory = block
+                    current = block
+                else:
+                    current.next = block
+                    current = block
+                start += size
+            self.log(f"Initialized fixed partitions: {sizes}", 'init')
+
+    def allocate(self, size, strategy="First Fit"):
+        """Returns the new process id, or None if no block fits"""
+        if size <= 0:
+            raise ValueError("Size must be positive")
+            
+        process_id = f"P{len([b for b in self.get_blocks() if b.process]) + 1}"
+        
+        if self.partition_type == "Variable":
+            block = self.find_free_block_variable(size, strategy)
+        else:
+            block = self.find_free_block_fixed(size, strategy)
+            
+        if not block:
+            return None
+        
+        block.process = process_id
+        remaining = block.size - size
+        
+        if remaining > 0 and self.partition_type == "Variable":
+            # Split the block
+            new_block = MemoryBlock(block.start + size, remaining)
+            new_block.next = block.next
+            block.next = new_block
+            block.size = size
+        
+        self.log(f"Allocated {size}KB to {process_id} using {strategy}", 'allocate')
+        return process_id
+
+    def find_free_block_variable(self, size, strategy):
+        blocks = []
+        current = self.memory
+        while current:
+            if current.process is None and current.size >= size:
+                blocks.append(current)
+            current = current.next
+        
+        if not blocks:
+            return None
+            
+        if strategy == "First Fit":
+            return next((b for b in blocks if b.size >= size), None)
+        elif strategy == "Best Fit":
+            return min((b for b in blocks if b.size >= size), key=lambda x: x.size, default=None)
+        else:  # Worst Fit
+            return max((b for b in blocks if b.size >= size), key=lambda x: x.size, default=None)
+
+    def find_free_block_fixed(self, size, strategy):
+        current = self.memory
+        while current:
+            if current.process is None and current.size >= size:
+                return current
+            current = current.next
+        return None
+
+    def deallocate(self, process_id):
+        """Returns True if the process was found and freed"""
+        current = self.memory
+        while current:
+            if current.process == process_id:
+                current.process = None
+                self.log(f"Deallocated memory from {process_id}", 'free')
+                
+                if self.partition_type == "Variable":
+                    self.coalesce_free_blocks()
+                return True
+            current = current.next
+        return False
+
+    def coalesce_free_blocks(self):
+        current = self.memory
+        while current and current.next:
+            if current.process is None and current.next.process is None:
+                current.size += current.next.size
+                current.next = current.next.next
+            else:
+                current = current.next
+
+    def fragmentation(self):
+        """Returns {'external', 'internal'} in KB, or None when no block is free"""
+        blocks = self.get_blocks()
+        allocated = [b for b in blocks if b.process]
+        free_blocks = [b for b in blocks if not b.process]
+        
+        if not free_blocks:
+            return None
+            
+        total_free = sum(b.size for b in free_blocks)
+        max_free = max(b.size for b in free_blocks)
+        internal_frag = sum(b.size - b.process.size for b in allocated if hasattr(b.process, 'size'))
+        
+        if self.partition_type == "Variable":
+            return {'external': total_free - max_free, 'internal': internal_frag}
+        return {'external': 0, 'internal': internal_frag}
+
+    def get_blocks(self):
+        blocks = []
+        current = self.memory
+        while current:
+            blocks.append(current)
+            current = current.next
+        return blocks
+
+    def log(self, message, kind="info"):
+        if self.event_log is not None:
+            self.event_log.append(None, kind, message)
+        if self.log_callback:
+            self.log_callback(message)
+        elif self.event_log is None:
+            print(f"[Memory] {message}")
@@ -0,0 +1,319 @@
+import io
+
+import numpy as np
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QColor
+
+from .workload import Workload
+
+
+class SchedulingResultsModel(QAbstractTableModel):
+    """Per-process scheduling results read straight from the result arrays.
+
+    Rows are handed to the view in batches through canFetchMore/fetchMore and
+    sorting permutes an index array, so the cost of showing a result does not
+    grow with the number of processes beyond one argsort. A new result keeps
+    the view's current sort; column -1 means input order.
+    """
+    HEADERS = ["Process", "Arrival Time", "Burst Time", "Waiting Time", "Turnaround Time"]
+
+    def __init__(self, batch_size=256):
+        super().__init__()
+        self.batch_size = batch_size
+        self.workload = None
+        self.names = None
+        self.columns = []
+        self.order = None
+        self.loaded = 0
+        self.sort_column = -1
+        self.sort_order = Qt.AscendingOrder
+
+    def set_result(self, result):
+        self.beginResetModel()
+        processes = result['processes']
+        if isinstance(processes, Workload):
+            self.workload = processes
+            self.names = None
+            arrival = processes.arrival_time
+            burst = processes.burst_time
+        else:
+            self.workload = None
+            self.names = [p['name'] for p in processes]
+            arrival = np.array([p['arrival_time'] for p in processes], dtype=np.int64)
+            burst = np.array([p['burst_time'] for p in processes], dtype=np.int64)
+        self.columns = [
+            None,
+            arrival,
+            burst,
+            np.asarray(result['waiting_time']),
+            np.asarray(result['turnaround_time']),
+        ]
+        self.order = self.sorted_order()
+        self.loaded = min(self.batch_size, len(arrival))
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self.workload = None
+        self.names = None
+        self.columns = []
+        self.order = None
+        self.loaded = 0
+        self.endResetModel()
+
+    def total_rows(self):
+        return len(self.columns[1]) if self.columns else 0
+
+    def name(self, i):
+        if self.workload is not None:
+            return self.workload.name(i)
+        return self.names[i]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loaded < self.total_rows()
+
+    def fetchMore(self, parent=QModelIndex()):
+        count = min(self.batch_size, self.total_rows() - self.loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.loaded, self.loaded + count - 1)
+        self.loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        i = index.row() if self.order is None else int(self.order[index.row()])
+        if index.column() == 0:
+            return self.name(i)
+        value = self.columns[index.column()][i]
+        return str(value.item() if hasattr(value, 'item') else value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sort_column, self.sort_order = column, order
+        if not self.columns:
+            return
+        self.layoutAboutToBeChanged.emit()
+        self.order = self.sorted_order()
+        self.layoutChanged.emit()
+
+    def sorted_order(self):
+        """Row permutation for the current sort, or None for input order"""
+        column = self.sort_column
+        if column < 0 or not self.columns:
+            return None
+        if column == 0:
+            if self.workload is not None and self.workload.names is None:
+                key = self.workload.pid
+            else:
+                key = np.array([self.name(i) for i in range(self.total_rows())])
+        else:
+            key = self.columns[column]
+        indices = np.argsort(key, kind='stable')
+        if self.sort_order == Qt.DescendingOrder:
+            indices = indices[::-1]
+        return indices
+
+
+class MatrixModel(QAbstractTableModel):
+    """Editable integer matrix backed directly by a NumPy array.
+
+    The view only asks for the cells it shows, edits and pasted blocks are
+    written straight into `array`, and callers read `array` back without any
+    per-cell conversion. Rows are labelled P0.. and columns R0.. by default.
+    """
+    def __init__(self, rows=0, columns=0, row_prefix="P", column_prefix="R"):
+        super().__init__()
+        self.array = np.zeros((rows, columns), dtype=np.int64)
+        self.row_prefix = row_prefix
+        self.column_prefix = column_prefix
+
+    def set_array(self, array):
+        array = np.array(array, dtype=np.int64, ndmin=2)
+        if array.ndim != 2:
+            raise ValueError("Expected a 2-D matrix")
+        self.beginResetModel()
+        self.array = array
+        self.endResetModel()
+
+    def resize(self, rows, columns, fill=0):
+        """Changes the shape, keeping the values that still fit"""
+        array = np.full((rows, columns), fill, dtype=np.int64)
+        r = min(rows, self.array.shape[0])
+        c = min(columns, self.array.shape[1])
+        array[:r, :c] = self.array[:r, :c]
+        self.set_array(array)
+
+    def paste(self, row, column, text):
+        """Writes a tab-, comma- or space-separated block at (row, column).
+
+        The block is clipped to the matrix; returns the (rows, columns) written.
+        """
+        delimiter = '\t' if '\t' in text else ',' if ',' in text else None
+        block = np.loadtxt(io.StringIO(text), delimiter=delimiter, dtype=np.int64, ndmin=2)
+        block = block[:self.array.shape[0] - row, :self.array.shape[1] - column]
+        rows, columns = block.shape
+        if rows and columns:
+            self.array[row:row + rows, column:column + columns] = block
+            self.dataChanged.emit(self.index(row, column),
+                                  self.index(row + rows - 1, column + columns - 1))
+        return rows, columns
+
+    def load(self, path):
+        if path.endswith('.npy'):
+            self.set_array(np.load(path))
+        else:
+            self.set_array(np.loadtxt(path, delimiter=',', dtype=np.int64, ndmin=2))
+
+    def save(self, path):
+        if path.endswith('.npy'):
+            np.save(path, self.array)
+        else:
+            np.savetxt(path, self.array, delimiter=',', fmt='%d')
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.array.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.array.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return str(self.array[index.row(), index.column()])
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        try:
+            value = int(value) if str(value).strip() else 0
+        except ValueError:
+            return False
+        self.array[index.row(), index.column()] = value
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return f"{self.column_prefix}{section}"
+        return f"{self.row_prefix}{section}"
+
+
+class SyncStateModel(QAbstractTableModel):
+    """Live view of a sync simulation's process dicts.
+
+    Cells read the dicts directly, so refresh() only has to tell the view
+    which rows changed; it emits one dataChanged per run of adjacent rows
+    and a frame costs nothing for processes that did not move.
+    """
+    HEADERS = ["Process", "State", "Action", "Blocked On", "Queue Pos"]
+    FIELDS = ['name', 'state', 'action', 'blocked_on', 'queue_pos']
+    COLORS = {
+        "Running": QColor(200, 255, 200),   # Light green
+        "Blocked": QColor(255, 255, 150),   # Light yellow
+        "Done": QColor(220, 220, 220),      # Light gray
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.processes = []
+
+    def set_processes(self, processes):
+        self.beginResetModel()
+        self.processes = processes
+        self.endResetModel()
+
+    def refresh(self, rows):
+        """Repaints the given process indexes"""
+        last = len(self.FIELDS) - 1
+        start = previous = None
+        for row in sorted(rows):
+            if start is not None and row == previous + 1:
+                previous = row
+                continue
+            if start is not None:
+                self.dataChanged.emit(self.index(start, 0), self.index(previous, last))
+            start = previous = row
+        if start is not None:
+            self.dataChanged.emit(self.index(start, 0), self.index(previous, last))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.processes)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        process = self.processes[index.row()]
+        if role == Qt.DisplayRole:
+            return str(process.get(self.FIELDS[index.column()], ""))
+        if role == Qt.BackgroundRole:
+            return self.COLORS.get(process['state'])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+
+class SyncStatsModel(QAbstractTableModel):
+    """Rows of SyncStats.rows(), one per resource or process"""
+    HEADERS = ["Name", "Acquisitions", "Rate", "Wait p50", "Wait p95", "Wait p99",
+               "Hold p50", "Hold p95", "Hold p99", "Avg Queue", "Max Queue", "Fairness"]
+    KEYS = ['name', 'acquisitions', 'rate', 'wait_p50', 'wait_p95', 'wait_p99',
+            'hold_p50', 'hold_p95', 'hold_p99', 'queue_mean', 'queue_max', 'fairness']
+
+    def __init__(self):
+        super().__init__()
+        self.rows = []
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        value = self.rows[index.row()][self.KEYS[index.column()]]
+        if value is None:
+            return "-"
+        if isinstance(value, float):
+            return f"{value:.3f}" if index.column() in (2, 11) else f"{value:.1f}"
+        return str(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
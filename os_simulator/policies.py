@@ -0,0 +1,278 @@
+import heapq
+from collections import deque
+
+from .workload import Workload
+
+POLICIES = {}
+
+
+def register_policy(cls):
+    """Class decorator adding a policy to the registry under its `name`"""
+    POLICIES[cls.name] = cls
+    return cls
+
+
+def process_field(processes, key, default):
+    """Per-process optional attribute (priority, nice, tickets) as a list"""
+    if isinstance(processes, Workload):
+        return [default] * len(processes)
+    return [p.get(key, default) for p in processes]
+
+
+def slice_stats(gantt):
+    """Slice and context-switch counts of a Gantt chart"""
+    switches = sum(1 for a, b in zip(gantt, gantt[1:]) if a[0] != b[0])
+    return {'slices': len(gantt), 'context_switches': switches}
+
+
+class SchedulingPolicy:
+    """Ready-queue policy driven by ProcessScheduler.run_policy.
+
+    The driver admits arrivals with add(), asks pick() for the next process and
+    how long it may run (None means to completion), and hands back unfinished
+    processes with requeue(). Policies count their own decisions and queue
+    operations in `stats`. Built-in algorithms with a dedicated engine
+    override run() instead, and only report the slice and context-switch
+    counts of their Gantt chart.
+    """
+    name = None
+    uses_quantum = False
+    preempt_on_arrival = False
+
+    def __init__(self, quantum=None):
+        self.quantum = quantum
+        self.stats = {'decisions': 0, 'queue_ops': 0}
+
+    def run(self, scheduler, processes):
+        return scheduler.run_policy(processes, self)
+
+    def engine_result(self, result):
+        result['policy_stats'] = slice_stats(result['gantt_chart'])
+        return result
+
+    def prepare(self, processes):
+        pass
+
+    def add(self, i, time):
+        raise NotImplementedError
+
+    def pick(self, time):
+        raise NotImplementedError
+
+    def requeue(self, i, ran, time):
+        self.add(i, time)
+
+    def finish(self, i, time):
+        pass
+
+
+@register_policy
+class FCFSPolicy(SchedulingPolicy):
+    name = "FCFS"
+
+    def run(self, scheduler, processes):
+        return self.engine_result(scheduler.fcfs(processes))
+
+
+@register_policy
+class SJFPolicy(SchedulingPolicy):
+    name = "SJF"
+
+    def run(self, scheduler, processes):
+        return self.engine_result(scheduler.sjf(processes))
+
+
+@register_policy
+class SRTFPolicy(SchedulingPolicy):
+    name = "SRTF"
+
+    def run(self, scheduler, processes):
+        return self.engine_result(scheduler.srtf(processes))
+
+
+@register_policy
+class RoundRobinPolicy(SchedulingPolicy):
+    name = "Round Robin"
+    uses_quantum = True
+
+    def run(self, scheduler, processes):
+        if self.quantum is None:
+            raise ValueError("Round Robin needs a quantum")
+        return self.engine_result(scheduler.round_robin(processes, self.quantum))
+
+
+@register_policy
+class CFSPolicy(SchedulingPolicy):
+    """Completely Fair Scheduler: min-heap keyed on weighted virtual runtime.
+
+    Each process reads an optional `nice` value. The slice is its weight's
+    share of `sched_latency`, never below `min_granularity`.
+    """
+    name = "CFS"
+
+    def __init__(self, quantum=None, sched_latency=12, min_granularity=1):
+        super().__init__(quantum)
+        self.sched_latency = sched_latency
+        self.min_granularity = min_granularity
+
+    def prepare(self, processes):
+        self.weights = [1024 / 1.25 ** nice for nice in process_field(processes, 'nice', 0)]
+        self.vruntime = [0.0] * len(processes)
+        self.heap = []
+        self.min_vruntime = 0.0
+        self.total_weight = 0.0
+
+    def add(self, i, time):
+        # Newcomers start at the current minimum so they can't starve others
+        self.vruntime[i] = max(self.vruntime[i], self.min_vruntime)
+        self.total_weight += self.weights[i]
+        heapq.heappush(self.heap, (self.vruntime[i], i))
+        self.stats['queue_ops'] += 1
+
+    def pick(self, time):
+        vruntime, i = heapq.heappop(self.heap)
+        self.stats['decisions'] += 1
+        self.stats['queue_ops'] += 1
+        self.min_vruntime = max(self.min_vruntime, vruntime)
+        share = int(self.sched_latency * self.weights[i] / self.total_weight)
+        return i, max(self.min_granularity, share)
+
+    def requeue(self, i, ran, time):
+        self.vruntime[i] += ran * 1024 / self.weights[i]
+        heapq.heappush(self.heap, (self.vruntime[i], i))
+        self.stats['queue_ops'] += 1
+
+    def finish(self, i, time):
+        self.total_weight -= self.weights[i]
+
+
+@register_policy
+class MLFQPolicy(SchedulingPolicy):
+    """Multi-level feedback queue with one deque per level.
+
+    A process drops a level once it has used that level's whole allotment,
+    and every `boost_interval` time units all processes return to the top.
+    New arrivals enter the top level and preempt lower levels.
+    """
+    name = "MLFQ"
+    uses_quantum = True
+    preempt_on_arrival = True
+
+    def __init__(self, quantum=None, quanta=(2, 4, 8), boost_interval=50):
+        super().__init__(quantum)
+        if quantum is not None:
+            quanta = tuple(quantum * 2 ** level for level in range(len(quanta)))
+        self.quanta = quanta
+        self.boost_interval = boost_interval
+        self.stats['boosts'] = 0
+
+    def prepare(self, processes):
+        n = len(processes)
+        self.levels = [deque() for _ in self.quanta]
+        self.level = [0] * n
+        self.used = [0] * n
+        self.next_boost = self.boost_interval
+
+    def add(self, i, time):
+        self.level[i] = 0
+        self.used[i] = 0
+        self.levels[0].append(i)
+        self.stats['queue_ops'] += 1
+
+    def pick(self, time):
+        if time >= self.next_boost:
+            self.boost(time)
+        self.stats['decisions'] += 1
+        for level, queue in enumerate(self.levels):
+            if queue:
+                i = queue.popleft()
+                self.stats['queue_ops'] += 1
+                return i, self.quanta[level] - self.used[i]
+
+    def requeue(self, i, ran, time):
+        self.used[i] += ran
+        level = self.level[i]
+        if self.used[i] >= self.quanta[level]:
+            self.used[i] = 0
+            if level + 1 < len(self.levels):
+                self.level[i] = level + 1
+        self.levels[self.level[i]].append(i)
+        self.stats['queue_ops'] += 1
+
+    def boost(self, time):
+        top = self.levels[0]
+        for queue in self.levels[1:]:
+            for i in queue:
+                self.level[i] = 0
+                self.used[i] = 0
+            self.stats['queue_ops'] += len(queue)
+            top.extend(queue)
+            queue.clear()
+        self.next_boost = (time // self.boost_interval + 1) * self.boost_interval
+        self.stats['boosts'] += 1
+
+
+@register_policy
+class PriorityAgingPolicy(SchedulingPolicy):
+    """Priority scheduling (lower `priority` runs first) with linear aging.
+
+    Effective priority is priority - aging_rate * (time - ready_since). The
+    time term is shared by every waiting process, so the heap can be keyed on
+    priority + aging_rate * ready_since and aging never needs a rescan.
+    """
+    name = "Priority (Aging)"
+
+    def __init__(self, quantum=None, aging_rate=0.1, preemptive=True):
+        super().__init__(quantum)
+        self.aging_rate = aging_rate
+        self.preempt_on_arrival = preemptive
+
+    def prepare(self, processes):
+        self.priority = process_field(processes, 'priority', 0)
+        self.heap = []
+
+    def add(self, i, time):
+        heapq.heappush(self.heap, (self.priority[i] + self.aging_rate * time, i))
+        self.stats['queue_ops'] += 1
+
+    def pick(self, time):
+        _, i = heapq.heappop(self.heap)
+        self.stats['decisions'] += 1
+        self.stats['queue_ops'] += 1
+        return i, None
+
+
+@register_policy
+class StridePolicy(SchedulingPolicy):
+    """Stride scheduling: each process advances its pass by STRIDE1 / tickets
+    per quantum run, and the lowest pass runs next. Reads optional `tickets`.
+    """
+    name = "Stride"
+    uses_quantum = True
+    STRIDE1 = 1 << 20
+
+    def __init__(self, quantum=None):
+        super().__init__(quantum or 1)
+
+    def prepare(self, processes):
+        self.stride = [self.STRIDE1 // max(t, 1) for t in process_field(processes, 'tickets', 100)]
+        self.passes = [0] * len(processes)
+        self.global_pass = 0
+        self.heap = []
+
+    def add(self, i, time):
+        # Arrivals join at the current pass instead of catching up from zero
+        self.passes[i] = max(self.passes[i], self.global_pass)
+        heapq.heappush(self.heap, (self.passes[i], i))
+        self.stats['queue_ops'] += 1
+
+    def pick(self, time):
+        self.global_pass, i = heapq.heappop(self.heap)
+        self.stats['decisions'] += 1
+        self.stats['queue_ops'] += 1
+        return i, self.quantum
+
+    def requeue(self, i, ran, time):
+        self.passes[i] += self.stride[i] * ran // self.quantum
+        heapq.heappush(self.heap, (self.passes[i], i))
+        self.stats['queue_ops'] += 1
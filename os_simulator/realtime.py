@@ -0,0 +1,436 @@
+"""Runs sync scenarios on real threads or asyncio tasks to calibrate the simulator"""
+import asyncio
+import threading
+from collections import deque
+from time import perf_counter
+
+from .stats import SyncStats
+from .sync import ScriptedSimulation
+
+MODES = ('threads', 'asyncio')
+POLL = 0.05     # seconds a blocked thread waits before checking for the end of the run
+# Kinds a worker holds until it releases them itself; semaphores are often
+# released by another process (producer-consumer), so they have no owner
+OWNED = ('mutex', 'rwlock')
+
+
+class ThreadRWLock:
+    """Writer-preferring reader-writer lock on a threading.Condition"""
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.readers = 0
+        self.writer = False
+        self.writers_waiting = 0
+
+    def acquire(self, shared=False, timeout=None):
+        with self.cond:
+            if shared:
+                if not self.cond.wait_for(lambda: not self.writer and not self.writers_waiting, timeout):
+                    return False
+                self.readers += 1
+                return True
+            self.writers_waiting += 1
+            try:
+                if not self.cond.wait_for(lambda: not self.writer and not self.readers, timeout):
+                    return False
+                self.writer = True
+                return True
+            finally:
+                self.writers_waiting -= 1
+
+    def release(self):
+        with self.cond:
+            if self.writer:
+                self.writer = False
+            else:
+                self.readers -= 1
+            self.cond.notify_all()
+
+
+class AsyncRWLock:
+    """Writer-preferring reader-writer lock on an asyncio.Condition"""
+    def __init__(self):
+        self.cond = asyncio.Condition()
+        self.readers = 0
+        self.writer = False
+        self.writers_waiting = 0
+
+    async def acquire(self, shared=False):
+        async with self.cond:
+            if shared:
+                await self.cond.wait_for(lambda: not self.writer and not self.writers_waiting)
+                self.readers += 1
+                return
+            self.writers_waiting += 1
+            try:
+                await self.cond.wait_for(lambda: not self.writer and not self.readers)
+                self.writer = True
+            finally:
+                self.writers_waiting -= 1
+
+    async def release(self):
+        async with self.cond:
+            if self.writer:
+                self.writer = False
+            else:
+                self.readers -= 1
+            self.cond.notify_all()
+
+
+class ThreadCondition:
+    """Condition variable whose wait() returns before re-taking the mutex,
+    so the time spent contending for it again can be measured"""
+    def __init__(self):
+        self.waiters = deque()
+
+    def wait(self, mutex, stop):
+        """Releases `mutex` and blocks until notified; False if `stop` is set first"""
+        waiter = threading.Lock()
+        waiter.acquire()
+        self.waiters.append(waiter)
+        mutex.release()
+        while not waiter.acquire(timeout=POLL):
+            if stop.is_set():
+                return False
+        return True
+
+    def notify(self, n=1):
+        while self.waiters and n:
+            self.waiters.popleft().release()
+            n -= 1
+
+    def notify_all(self):
+        self.notify(len(self.waiters))
+
+
+class AsyncCondition:
+    """asyncio counterpart of ThreadCondition"""
+    def __init__(self):
+        self.waiters = deque()
+
+    async def wait(self, mutex):
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        mutex.release()
+        try:
+            await waiter
+        finally:
+            if not waiter.done():
+                self.waiters.remove(waiter)
+
+    def notify(self, n=1):
+        while self.waiters and n:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(True)
+                n -= 1
+
+    def notify_all(self):
+        self.notify(len(self.waiters))
+
+
+def condition_mutexes(config):
+    """Maps each condition variable to the mutex its wait steps name"""
+    mutexes = {}
+    for process in config['processes']:
+        for op, *operands in process['script']:
+            if op == 'wait':
+                condition, mutex = operands
+                if mutexes.setdefault(condition, mutex) != mutex:
+                    raise ValueError(f"{condition} is waited on with more than one mutex")
+    return mutexes
+
+
+class RealRun:
+    """Runs a ScriptedSimulation's resources and scripts on real primitives.
+
+    In "threads" mode each process is a thread driving threading.Semaphore
+    and Lock; in "asyncio" mode a task driving their asyncio counterparts.
+    Condition variables are ThreadCondition/AsyncCondition, whose waits
+    return before the mutex is taken again so the relock shows up as a
+    request and a grant of its own. A work step sleeps `unit` seconds per
+    time unit. Workers timestamp their requests, grants and releases into
+    their own lists, which are merged into a SyncStats once the run is over,
+    with times in simulated units so the figures line up with the
+    simulation's own. Only mutexes and rwlocks are released for a worker
+    that is stopped while holding them.
+    """
+    def __init__(self, simulation, mode="threads", unit=0.001, duration=1.0):
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode}")
+        if unit <= 0 or duration <= 0:
+            raise ValueError("Unit and duration must be positive")
+        self.config = simulation.config()
+        self.kinds = {name: spec['kind'] for name, spec in self.config['resources'].items()}
+        self.mutexes = condition_mutexes(self.config)
+        self.mode = mode
+        self.unit = unit
+        self.duration = duration
+        self.start = 0.0
+        self.elapsed = 0.0
+        self.stats = None
+
+    @property
+    def units(self):
+        return self.elapsed / self.unit
+
+    def run(self):
+        if self.mode == 'threads':
+            traces = self.run_threads()
+        else:
+            traces = asyncio.run(self.run_tasks())
+        self.elapsed = perf_counter() - self.start
+        self.stats = self.collect(traces)
+        return self.stats
+
+    def throughput(self):
+        """Acquisitions per second of the real run"""
+        if not self.stats or self.elapsed <= 0:
+            return 0.0
+        return sum(entry['acquisitions'] for entry in self.stats.processes.values()) / self.elapsed
+
+    def collect(self, traces):
+        stats = SyncStats()
+        for process in self.config['processes']:
+            stats.add_process(process['name'])
+        events = sorted((event[0], worker, n) + event[1:]
+                        for worker, trace in enumerate(traces) for n, event in enumerate(trace))
+        waiting = {}
+        for seconds, _, _, kind, process, resource in events:
+            time = seconds / self.unit
+            if kind == 'release':
+                stats.release(process, resource, time)
+                continue
+            if kind == 'request':
+                stats.request(process, resource, time)
+                waiting[resource] = waiting.get(resource, 0) + 1
+            else:
+                if kind == 'grant':
+                    stats.grant(process, resource, time)
+                else:
+                    stats.woken(process, resource, time)
+                waiting[resource] -= 1
+            stats.queue(resource, int(time), waiting[resource])
+        return stats
+
+    def run_threads(self):
+        primitives = {}
+        for name, spec in self.config['resources'].items():
+            if spec['kind'] == 'semaphore':
+                primitives[name] = threading.Semaphore(spec['value'])
+            elif spec['kind'] == 'mutex':
+                primitives[name] = threading.Lock()
+            elif spec['kind'] == 'rwlock':
+                primitives[name] = ThreadRWLock()
+            else:
+                primitives[name] = ThreadCondition()
+
+        stop = threading.Event()
+        traces = [[] for _ in self.config['processes']]
+        workers = [threading.Thread(target=self.thread_worker, args=(process, primitives, stop, trace), daemon=True)
+                   for process, trace in zip(self.config['processes'], traces)]
+        self.start = perf_counter()
+        for worker in workers:
+            worker.start()
+        stop.wait(self.duration)
+        stop.set()
+        for worker in workers:
+            worker.join()
+        return traces
+
+    def thread_worker(self, process, primitives, stop, trace):
+        name, start, unit = process['name'], self.start, self.unit
+        held = []
+
+        def mark(kind, resource):
+            trace.append((perf_counter() - start, kind, name, resource))
+
+        try:
+            while not stop.is_set():
+                for op, *operands in process['script']:
+                    if stop.is_set():
+                        return
+                    if op == 'work':
+                        stop.wait(operands[0] * unit)
+                    elif op in ('acquire', 'read'):
+                        resource = operands[0]
+                        lock = primitives[resource]
+                        mark('request', resource)
+                        if self.kinds[resource] == 'rwlock':
+                            while not lock.acquire(op == 'read', POLL):
+                                if stop.is_set():
+                                    return
+                        else:
+                            while not lock.acquire(timeout=POLL):
+                                if stop.is_set():
+                                    return
+                        mark('grant', resource)
+                        if self.kinds[resource] in OWNED:
+                            held.append(resource)
+                    elif op == 'release':
+                        primitives[operands[0]].release()
+                        mark('release', operands[0])
+                        self.forget(held, operands[0])
+                    elif op == 'wait':
+                        condition, mutex = operands
+                        mark('release', mutex)
+                        mark('request', condition)
+                        self.forget(held, mutex)
+                        if not primitives[condition].wait(primitives[mutex], stop):
+                            return
+                        mark('woken', condition)
+                        mark('request', mutex)
+                        while not primitives[mutex].acquire(timeout=POLL):
+                            if stop.is_set():
+                                return
+                        mark('grant', mutex)
+                        held.append(mutex)
+                    else:
+                        self.notify_thread(op, operands[0], primitives, held)
+                if not process['loop']:
+                    return
+        finally:
+            # Let go of everything so no other worker blocks past the end of the run
+            for resource in reversed(held):
+                primitives[resource].release()
+
+    @staticmethod
+    def forget(held, resource):
+        for i in range(len(held) - 1, -1, -1):
+            if held[i] == resource:
+                del held[i]
+                return
+
+    def notify_thread(self, op, condition, primitives, held):
+        notify = getattr(primitives[condition], 'notify' if op == 'signal' else 'notify_all')
+        mutex = self.mutexes.get(condition)
+        if mutex is None or mutex in held:
+            notify()
+        else:
+            with primitives[mutex]:
+                notify()
+
+    async def run_tasks(self):
+        primitives = {}
+        for name, spec in self.config['resources'].items():
+            if spec['kind'] == 'semaphore':
+                primitives[name] = asyncio.Semaphore(spec['value'])
+            elif spec['kind'] == 'mutex':
+                primitives[name] = asyncio.Lock()
+            elif spec['kind'] == 'rwlock':
+                primitives[name] = AsyncRWLock()
+            else:
+                primitives[name] = AsyncCondition()
+
+        traces = [[] for _ in self.config['processes']]
+        self.start = perf_counter()
+        tasks = [asyncio.ensure_future(self.task_worker(process, primitives, trace))
+                 for process, trace in zip(self.config['processes'], traces)]
+        await asyncio.sleep(self.duration)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return traces
+
+    async def task_worker(self, process, primitives, trace):
+        name, start, unit = process['name'], self.start, self.unit
+        held = []
+
+        def mark(kind, resource):
+            trace.append((perf_counter() - start, kind, name, resource))
+
+        try:
+            while perf_counter() - start < self.duration:
+                for op, *operands in process['script']:
+                    if op == 'work':
+                        await asyncio.sleep(operands[0] * unit)
+                    elif op in ('acquire', 'read'):
+                        resource = operands[0]
+                        mark('request', resource)
+                        if self.kinds[resource] == 'rwlock':
+                            await primitives[resource].acquire(op == 'read')
+                        else:
+                            await primitives[resource].acquire()
+                        mark('grant', resource)
+                        if self.kinds[resource] in OWNED:
+                            held.append(resource)
+                    elif op == 'release':
+                        await self.release_task(operands[0], primitives)
+                        mark('release', operands[0])
+                        self.forget(held, operands[0])
+                    elif op == 'wait':
+                        condition, mutex = operands
+                        mark('release', mutex)
+                        mark('request', condition)
+                        self.forget(held, mutex)
+                        await primitives[condition].wait(primitives[mutex])
+                        mark('woken', condition)
+                        mark('request', mutex)
+                        await primitives[mutex].acquire()
+                        mark('grant', mutex)
+                        held.append(mutex)
+                    else:
+                        notify = getattr(primitives[operands[0]], 'notify' if op == 'signal' else 'notify_all')
+                        mutex = self.mutexes.get(operands[0])
+                        if mutex is None or mutex in held:
+                            notify()
+                        else:
+                            async with primitives[mutex]:
+                                notify()
+                if not process['loop']:
+                    return
+                # Uncontended acquires never suspend, so a script without work
+                # steps would otherwise keep the event loop to itself
+                await asyncio.sleep(0)
+        finally:
+            for resource in reversed(held):
+                await self.release_task(resource, primitives)
+
+    async def release_task(self, resource, primitives):
+        if self.kinds[resource] == 'rwlock':
+            await primitives[resource].release()
+        else:
+            primitives[resource].release()
+
+
+def calibrate(simulation, mode="threads", unit=0.001, duration=1.0):
+    """Runs `simulation`'s scenario for real, then simulates it from the start
+    for as many time units as the real run lasted.
+
+    Returns the RealRun, the ScriptedSimulation and a per-resource summary of
+    simulated against real acquisition rate and wait percentiles, in time
+    units, with the real waits also in milliseconds.
+    """
+    real = RealRun(simulation, mode, unit, duration)
+    real.run()
+    units = max(1, int(real.units))
+    simulated = ScriptedSimulation.from_config(real.config)
+    simulated.run(units)
+
+    simulated_rows = {row['name']: row for row in simulated.stats.rows(units, 'resource')}
+    resources = []
+    for row in real.stats.rows(real.units, 'resource'):
+        expected = simulated_rows.get(row['name'], {})
+        summary = {'resource': row['name']}
+        for key in ('rate', 'wait_p50', 'wait_p95', 'wait_p99', 'hold_p50'):
+            summary[f'simulated_{key}'] = expected.get(key)
+            summary[f'real_{key}'] = row[key]
+        for q in (50, 95, 99):
+            wait = row[f'wait_p{q}']
+            summary[f'real_latency_p{q}_ms'] = None if wait is None else wait * unit * 1000
+        resources.append(summary)
+
+    acquisitions = sum(entry['acquisitions'] for entry in simulated.stats.processes.values())
+    return {
+        'real': real,
+        'simulated': simulated,
+        'mode': mode,
+        'unit': unit,
+        'elapsed': real.elapsed,
+        'units': units,
+        'throughput': real.throughput(),
+        'simulated_throughput': acquisitions / (units * unit),
+        'fairness': real.stats.fairness(),
+        'simulated_fairness': simulated.stats.fairness(),
+        'resources': resources,
+    }
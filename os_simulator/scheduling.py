@@ -0,0 +1,545 @@
+import hashlib
+import heapq
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from time import perf_counter
+
+import numpy as np
+
+from .devices import IOSimulation
+from .policies import POLICIES, slice_stats
+from .smp import SMPSimulation
+from .workload import WORKLOAD_DTYPE, Workload
+
+class ProcessScheduler:
+    def __init__(self, cache_size=32):
+        self.processes = []
+        self.result_cache = OrderedDict()
+        self.cache_size = cache_size
+        
+    def fcfs(self, processes):
+        return self.run_events(processes, 'fcfs')
+    
+    def sjf(self, processes):
+        return self.run_events(processes, 'sjf')
+    
+    def srtf(self, processes):
+        return self.run_events(processes, 'srtf')
+    
+    def run_events(self, processes, policy):
+        """Discrete-event engine for FCFS, non-preemptive SJF and preemptive SRTF.
+
+        Arrivals are admitted in arrival order into a min-heap ready queue, so a
+        whole run costs O(n log n) regardless of how the input is ordered.
+        """
+        n = len(processes)
+        arrival, burst = self.columns(processes)
+        remaining = burst[:]
+        finish = [0] * n
+        completed = []
+        gantt = []
+        
+        for i, start, end in self.event_slices(processes, policy):
+            if end > start:
+                gantt.append((self.process_name(processes, i), start, end))
+            remaining[i] -= end - start
+            if remaining[i] == 0:
+                finish[i] = end
+                completed.append(i)
+        
+        if isinstance(processes, Workload):
+            done = processes.take(np.array(completed, dtype=np.int64))
+        else:
+            done = [processes[i] for i in completed]
+        turnaround_time = [finish[i] - arrival[i] for i in completed]
+        waiting_time = [finish[i] - arrival[i] - burst[i] for i in completed]
+        
+        return {
+            'processes': done,
+            'waiting_time': waiting_time,
+            'turnaround_time': turnaround_time,
+            'avg_waiting': sum(waiting_time) / n if n else 0,
+            'avg_turnaround': sum(turnaround_time) / n if n else 0,
+            'gantt_chart': gantt
+        }
+    
+    def event_slices(self, processes, policy):
+        """Yields merged (index, start, end) slices for run_events.
+
+        Zero-burst processes complete on arrival, as in the other engines, and
+        come out as a zero-length slice at their arrival time so every process
+        appears at least once.
+        """
+        n = len(processes)
+        arrival, burst = self.columns(processes)
+        order = sorted(range(n), key=arrival.__getitem__)
+        remaining = burst[:]
+        ready = []
+        pending = None
+        done = 0
+        time = 0
+        k = 0
+        
+        while done < n:
+            # Admit every process that has arrived by now
+            while k < n and arrival[order[k]] <= time:
+                i = order[k]
+                k += 1
+                if remaining[i] == 0:
+                    done += 1
+                    yield (i, arrival[i], arrival[i])
+                    continue
+                heapq.heappush(ready, (self.ready_key(policy, arrival[i], burst[i], remaining[i]), i))
+            
+            if not ready:
+                if k == n:
+                    break   # the last arrivals had nothing to run
+                # CPU idle: jump straight to the next arrival
+                time = arrival[order[k]]
+                continue
+            
+            _, i = heapq.heappop(ready)
+            run = remaining[i]
+            if policy == 'srtf' and k < n:
+                # Run only until the next arrival, which may preempt us
+                run = min(run, arrival[order[k]] - time)
+            
+            start = time
+            time += run
+            remaining[i] -= run
+            if remaining[i] == 0:
+                done += 1
+            else:
+                heapq.heappush(ready, (self.ready_key(policy, arrival[i], burst[i], remaining[i]), i))
+            
+            if pending and pending[0] == i and pending[2] == start:
+                pending = (i, pending[1], time)
+            else:
+                if pending:
+                    yield pending
+                pending = (i, start, time)
+        
+        if pending:
+            yield pending
+    
+    def ready_key(self, policy, arrival, burst, remaining):
+        if policy == 'fcfs':
+            return (arrival,)
+        if policy == 'sjf':
+            return (burst, arrival)
+        return (remaining, arrival)
+    
+    def cache_key(self, processes, algorithm, quantum=None, cpus=1):
+        """Result cache key: a content hash of the workload plus the run settings"""
+        digest = hashlib.blake2b(digest_size=16)
+        if isinstance(processes, Workload):
+            digest.update(processes.data.tobytes())
+            digest.update(repr(processes.names).encode())
+        else:
+            for p in processes:
+                digest.update(repr(sorted(p.items())).encode())
+        return (digest.hexdigest(), algorithm, quantum, cpus)
+    
+    def cached(self, key, compute):
+        """LRU lookup: returns the result stored under key, or computes and stores it"""
+        if key in self.result_cache:
+            self.result_cache.move_to_end(key)
+            return self.result_cache[key]
+        result = compute()
+        self.result_cache[key] = result
+        if len(self.result_cache) > self.cache_size:
+            self.result_cache.popitem(last=False)
+        return result
+    
+    def algorithms(self):
+        return list(POLICIES)
+    
+    def schedule(self, processes, algorithm, quantum=None, **params):
+        """Runs a registered policy by name; see policies.POLICIES"""
+        if algorithm not in POLICIES:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        return POLICIES[algorithm](quantum=quantum, **params).run(self, processes)
+    
+    def run_policy(self, processes, policy):
+        """Event loop for pluggable policies; see policies.SchedulingPolicy.
+
+        The result dict matches the other engines plus 'policy_stats', the
+        policy's decision and queue-operation counters, the wall time spent
+        inside pick() and requeue(), and the slice and context-switch counts.
+        """
+        n = len(processes)
+        arrival, burst = self.columns(processes)
+        order = sorted(range(n), key=arrival.__getitem__)
+        remaining = burst[:]
+        finish = arrival[:]
+        completed = []
+        gantt = []
+        last = None
+        decision_seconds = 0.0
+        ready = 0
+        time = 0
+        k = 0
+        
+        policy.prepare(processes)
+        while len(completed) < n:
+            while k < n and arrival[order[k]] <= time:
+                i = order[k]
+                k += 1
+                if remaining[i] == 0:
+                    completed.append(i)
+                    continue
+                policy.add(i, time)
+                ready += 1
+            
+            if not ready:
+                if k < n:
+                    time = arrival[order[k]]
+                continue
+            
+            t0 = perf_counter()
+            i, allowed = policy.pick(time)
+            decision_seconds += perf_counter() - t0
+            ready -= 1
+            
+            run = remaining[i] if allowed is None else min(allowed, remaining[i])
+            if policy.preempt_on_arrival and k < n:
+                run = min(run, arrival[order[k]] - time)
+            
+            start = time
+            time += run
+            remaining[i] -= run
+            if run > 0:
+                if last == i and gantt[-1][2] == start:
+                    gantt[-1] = (gantt[-1][0], gantt[-1][1], time)
+                else:
+                    gantt.append((self.process_name(processes, i), start, time))
+                last = i
+            
+            if remaining[i] == 0:
+                finish[i] = time
+                completed.append(i)
+                policy.finish(i, time)
+            else:
+                # Let arrivals during the slice queue up before the requeue
+                while k < n and arrival[order[k]] <= time:
+                    j = order[k]
+                    k += 1
+                    if remaining[j] == 0:
+                        completed.append(j)
+                        continue
+                    policy.add(j, time)
+                    ready += 1
+                t0 = perf_counter()
+                policy.requeue(i, run, time)
+                decision_seconds += perf_counter() - t0
+                ready += 1
+        
+        if isinstance(processes, Workload):
+            done = processes.take(np.array(completed, dtype=np.int64))
+        else:
+            done = [processes[i] for i in completed]
+        turnaround_time = [finish[i] - arrival[i] for i in completed]
+        waiting_time = [finish[i] - arrival[i] - burst[i] for i in completed]
+        
+        stats = dict(policy.stats, **slice_stats(gantt))
+        stats['decision_seconds'] = decision_seconds
+        stats['ns_per_decision'] = decision_seconds * 1e9 / stats['decisions'] if stats['decisions'] else 0
+        
+        return {
+            'processes': done,
+            'waiting_time': waiting_time,
+            'turnaround_time': turnaround_time,
+            'avg_waiting': sum(waiting_time) / n if n else 0,
+            'avg_turnaround': sum(turnaround_time) / n if n else 0,
+            'gantt_chart': gantt,
+            'policy_stats': stats
+        }
+    
+    def smp(self, processes, cpus, quantum=None, steal=True, seed=0):
+        """Simulates `cpus` cores with per-CPU run queues; see smp.SMPSimulation.
+
+        Besides the usual result keys, reports 'gantt_cpu' (the core of each
+        Gantt slice), per-core 'utilization', 'migrations', 'steals' and
+        'makespan'.
+        """
+        return SMPSimulation(cpus, quantum, steal, seed).run(self, processes)
+    
+    def io(self, processes, quantum=None, devices=None, record_gantt=True):
+        """Alternating CPU and I/O bursts with device queues; see devices.IOSimulation"""
+        return IOSimulation(quantum, devices, record_gantt).run(self, processes)
+    
+    def round_robin(self, processes, quantum):
+        n = len(processes)
+        arrival, burst = self.columns(processes)
+        finish = arrival[:]
+        gantt = []
+        
+        for i, start, end in self.rr_slices(processes, quantum):
+            finish[i] = end
+            gantt.append((self.process_name(processes, i), start, end))
+        
+        tat = [finish[i] - arrival[i] for i in range(n)]
+        wt = [tat[i] - burst[i] for i in range(n)]
+        
+        avg_waiting = sum(wt) / n if n else 0
+        avg_turnaround = sum(tat) / n if n else 0
+        
+        return {
+            'processes': processes,
+            'waiting_time': wt,
+            'turnaround_time': tat,
+            'avg_waiting': avg_waiting,
+            'avg_turnaround': avg_turnaround,
+            'gantt_chart': gantt
+        }
+    
+    def round_robin_stream(self, processes, quantum):
+        """Yields (name, start, end) slices without building the Gantt list"""
+        for i, start, end in self.rr_slices(processes, quantum):
+            yield (self.process_name(processes, i), start, end)
+    
+    def rr_slices(self, processes, quantum):
+        """Round Robin over a FIFO ready queue, admitting processes as they arrive.
+
+        Only runnable processes are ever touched, so a run costs O(n log n) for
+        the arrival sort plus O(1) per slice. Back-to-back slices of the same
+        process are merged before being yielded as (index, start, end).
+        """
+        if quantum <= 0:
+            raise ValueError("Quantum must be positive")
+        
+        n = len(processes)
+        arrival, remaining = self.columns(processes)
+        order = sorted(range(n), key=arrival.__getitem__)
+        ready = deque()
+        pending = None
+        time = 0
+        k = 0
+        
+        while k < n or ready:
+            if not ready:
+                # CPU idle: jump straight to the next arrival
+                time = max(time, arrival[order[k]])
+            while k < n and arrival[order[k]] <= time:
+                if remaining[order[k]] > 0:
+                    ready.append(order[k])
+                k += 1
+            if not ready:
+                continue
+            
+            i = ready.popleft()
+            start = time
+            run = min(quantum, remaining[i])
+            time += run
+            remaining[i] -= run
+            
+            # New arrivals join the queue ahead of the preempted process
+            while k < n and arrival[order[k]] <= time:
+                if remaining[order[k]] > 0:
+                    ready.append(order[k])
+                k += 1
+            if remaining[i] > 0:
+                ready.append(i)
+            
+            if pending and pending[0] == i and pending[2] == start:
+                pending = (i, pending[1], time)
+            else:
+                if pending:
+                    yield pending
+                pending = (i, start, time)
+        
+        if pending:
+            yield pending
+    
+    def generate_gantt(self, processes, waiting_time):
+        gantt = []
+        for i, p in enumerate(processes):
+            start = max(p['arrival_time'], waiting_time[i])
+            end = start + p['burst_time']
+            gantt.append((p['name'], start, end))
+        return gantt
+
+    def columns(self, processes):
+        """Returns (arrival, burst) lists for a process list or a Workload"""
+        if isinstance(processes, Workload):
+            return processes.arrival_time.tolist(), processes.burst_time.tolist()
+        return ([p['arrival_time'] for p in processes],
+                [p['burst_time'] for p in processes])
+    
+    def process_name(self, processes, i):
+        if isinstance(processes, Workload):
+            return processes.name(i)
+        return processes[i]['name']
+    
+    def summarize(self, workload, algorithm, quantum=None):
+        """Returns (avg_waiting, avg_turnaround) without building a Gantt chart"""
+        if algorithm == "FCFS":
+            result = self.fcfs_columnar(workload)
+        elif algorithm == "SJF":
+            result = self.sjf_columnar(workload)
+        elif algorithm == "Round Robin":
+            arrival, burst = self.columns(workload)
+            finish = arrival[:]
+            for i, _, end in self.rr_slices(workload, quantum):
+                finish[i] = end
+            n = len(workload)
+            turnaround = sum(finish) - sum(arrival)
+            waiting = turnaround - sum(burst)
+            return (waiting / n if n else 0, turnaround / n if n else 0)
+        else:
+            result = self.schedule(workload, algorithm, quantum)
+        return (float(result['avg_waiting']), float(result['avg_turnaround']))
+    
+    def sweep(self, workload, algorithms, quanta=(), max_workers=None):
+        """Runs every algorithm (and every quantum where it takes one) in parallel.
+
+        The workload is copied once into shared memory and each worker maps it
+        instead of receiving a pickled copy per task. Returns one row dict per
+        configuration, in grid order.
+        """
+        if not isinstance(workload, Workload):
+            workload = Workload.from_processes(workload)
+        
+        configs = []
+        for algorithm in algorithms:
+            if algorithm not in POLICIES:
+                raise ValueError(f"Unknown algorithm: {algorithm}")
+            if POLICIES[algorithm].uses_quantum:
+                configs.extend((algorithm, q) for q in quanta)
+            else:
+                configs.append((algorithm, None))
+        
+        data = workload.data
+        shm = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+        try:
+            np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)[:] = data
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = [pool.submit(sweep_task, shm.name, len(data), algorithm, quantum)
+                           for algorithm, quantum in configs]
+                averages = [f.result() for f in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+        
+        return [
+            {
+                'algorithm': algorithm,
+                'quantum': quantum,
+                'avg_waiting': avg_waiting,
+                'avg_turnaround': avg_turnaround
+            }
+            for (algorithm, quantum), (avg_waiting, avg_turnaround) in zip(configs, averages)
+        ]
+    
+    def fcfs_columnar(self, workload):
+        order = np.argsort(workload.arrival_time, kind='stable')
+        return self.columnar_metrics(workload, order)
+    
+    def sjf_columnar(self, workload):
+        arrival = workload.arrival_time
+        burst = workload.burst_time
+        if len(workload) == 0 or (arrival == arrival[0]).all():
+            # Everyone is ready at once: SJF order is a plain sort
+            order = np.lexsort((arrival, burst))
+        else:
+            order = self.sjf_dispatch_order(arrival, burst)
+        return self.columnar_metrics(workload, order)
+    
+    def sjf_dispatch_order(self, arrival, burst):
+        """Non-preemptive SJF dispatch order; only the order needs the heap"""
+        a = arrival.tolist()
+        b = burst.tolist()
+        by_arrival = np.argsort(arrival, kind='stable').tolist()
+        n = len(a)
+        order = []
+        ready = []
+        time = 0
+        k = 0
+        
+        while len(order) < n:
+            while k < n and a[by_arrival[k]] <= time:
+                i = by_arrival[k]
+                heapq.heappush(ready, (b[i], a[i], i))
+                k += 1
+            if not ready:
+                time = a[by_arrival[k]]
+                continue
+            _, _, i = heapq.heappop(ready)
+            order.append(i)
+            time += b[i]
+        
+        return np.array(order, dtype=np.int64)
+    
+    def columnar_metrics(self, workload, order, clock=0):
+        """Vectorized non-preemptive timings for a given dispatch order.
+
+        Completion follows C[i] = max(C[i-1], arrival[i]) + burst[i], which
+        unrolls to a cumulative max over arrival minus prior work plus a cumsum.
+        Zero-burst processes stay out of that chain and complete on arrival,
+        as in the event engines. `clock` is the time the CPU becomes free, for
+        chaining chunks.
+        """
+        ordered = workload.take(order)
+        arrival = ordered.arrival_time
+        burst = ordered.burst_time
+        runs = burst > 0
+        start = arrival.copy()
+        run_arrival, run_burst = arrival[runs], burst[runs]
+        work_before = np.cumsum(run_burst) - run_burst
+        ready = np.maximum(np.maximum.accumulate(run_arrival - work_before), clock)
+        start[runs] = ready + work_before
+        completion = start + burst
+        turnaround = completion - arrival
+        waiting = turnaround - burst
+        n = len(ordered)
+        
+        return {
+            'processes': ordered,
+            'start_time': start,
+            'completion_time': completion,
+            'waiting_time': waiting,
+            'turnaround_time': turnaround,
+            'avg_waiting': waiting.mean() if n else 0,
+            'avg_turnaround': turnaround.mean() if n else 0
+        }
+
+    def fcfs_replay(self, chunks):
+        """FCFS over a stream of arrival-ordered Workload chunks in constant memory"""
+        clock = 0
+        last_arrival = None
+        count = 0
+        total_waiting = 0
+        total_turnaround = 0
+        
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+            arrival = chunk.arrival_time
+            if (last_arrival is not None and arrival[0] < last_arrival) or (np.diff(arrival) < 0).any():
+                raise ValueError("Trace must be sorted by arrival time for replay")
+            result = self.columnar_metrics(chunk, np.arange(len(chunk)), clock)
+            clock = max(clock, int(result['completion_time'].max()))
+            last_arrival = int(arrival[-1])
+            count += len(chunk)
+            total_waiting += int(result['waiting_time'].sum())
+            total_turnaround += int(result['turnaround_time'].sum())
+        
+        return {
+            'count': count,
+            'makespan': clock,
+            'avg_waiting': total_waiting / count if count else 0,
+            'avg_turnaround': total_turnaround / count if count else 0
+        }
+
+def sweep_task(shm_name, n, algorithm, quantum):
+    """Worker for ProcessScheduler.sweep: maps the shared workload and scores it"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    workload = None
+    try:
+        workload = Workload(np.ndarray((n,), dtype=WORKLOAD_DTYPE, buffer=shm.buf))
+        return ProcessScheduler().summarize(workload, algorithm, quantum)
+    finally:
+        # The segment cannot close while a view into it is alive
+        del workload
+        shm.close()
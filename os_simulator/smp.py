@@ -0,0 +1,202 @@
+import heapq
+import random
+from collections import deque
+
+from .policies import process_field
+
+
+class SMPSimulation:
+    """Multi-core scheduling with per-CPU run queues and work stealing.
+
+    Each CPU runs its own queue FCFS, or Round Robin when a quantum is given.
+    A runnable process goes straight to an idle CPU it is allowed on; otherwise
+    arrivals pick the shorter of two random allowed queues. A CPU that runs
+    dry steals from the tail of the busiest queue, found through a lazy
+    max-heap of queue lengths, so each event costs O(log events) whatever the
+    core count. Processes may carry an `affinity` list of allowed CPU ids.
+    """
+    STEAL_SCAN = 8
+    STEAL_VICTIMS = 4
+
+    def __init__(self, cpus, quantum=None, steal=True, seed=0):
+        if cpus < 1:
+            raise ValueError("Need at least one CPU")
+        if quantum is not None and quantum <= 0:
+            raise ValueError("Quantum must be positive")
+        self.cpus = cpus
+        self.quantum = quantum
+        self.steal = steal
+        self.rng = random.Random(seed)
+
+    def run(self, scheduler, processes):
+        n = len(processes)
+        cpus = self.cpus
+        arrival, burst = scheduler.columns(processes)
+        self.remaining = burst[:]
+        self.affinity = [None if a is None else set(a) for a in process_field(processes, 'affinity', None)]
+        self.allowed = [None if a is None else sorted(a) for a in self.affinity]
+        for allowed in self.allowed:
+            if allowed is not None and not any(0 <= c < cpus for c in allowed):
+                raise ValueError("Process affinity excludes every CPU")
+        self.queues = [deque() for _ in range(cpus)]
+        self.current = [None] * cpus
+        self.slice_start = [0] * cpus
+        self.busy = [0] * cpus
+        self.is_idle = [True] * cpus
+        self.idle = list(range(cpus - 1, -1, -1))
+        self.last_cpu = [None] * n
+        self.last_slice = [None] * cpus
+        self.ends = []
+        self.loads = []
+        self.migrations = 0
+        self.steals = 0
+        gantt = []
+        gantt_cpu = []
+        finish = arrival[:]
+        order = sorted(range(n), key=arrival.__getitem__)
+        completed = 0
+        k = 0
+
+        while completed < n:
+            if self.ends and (k == n or self.ends[0][0] <= arrival[order[k]]):
+                time, c = heapq.heappop(self.ends)
+                i = self.current[c]
+                start = self.slice_start[c]
+                self.remaining[i] -= time - start
+                self.busy[c] += time - start
+                self.current[c] = None
+                last = self.last_slice[c]
+                if last is not None and gantt_cpu[last] == c and gantt[last][0] == i and gantt[last][2] == start:
+                    gantt[last] = (i, gantt[last][1], time)
+                else:
+                    self.last_slice[c] = len(gantt)
+                    gantt.append((i, start, time))
+                    gantt_cpu.append(c)
+
+                if self.remaining[i] == 0:
+                    finish[i] = time
+                    completed += 1
+                else:
+                    self.enqueue(c, i)
+                self.pick_next(c, time)
+                if self.queues[c] and self.idle:
+                    # Hand the process at the tail to an idle CPU instead
+                    j = self.queues[c][-1]
+                    target = self.idle_cpu(j)
+                    if target is not None:
+                        self.queues[c].pop()
+                        self.note_load(c)
+                        self.dispatch(target, j, time)
+            else:
+                i = order[k]
+                k += 1
+                time = arrival[i]
+                if self.remaining[i] == 0:
+                    completed += 1
+                    continue
+                c = self.idle_cpu(i)
+                if c is not None:
+                    self.dispatch(c, i, time)
+                else:
+                    self.enqueue(self.place(i), i)
+
+        makespan = max(finish) if n else 0
+        tat = [finish[i] - arrival[i] for i in range(n)]
+        wt = [tat[i] - burst[i] for i in range(n)]
+        return {
+            'processes': processes,
+            'waiting_time': wt,
+            'turnaround_time': tat,
+            'avg_waiting': sum(wt) / n if n else 0,
+            'avg_turnaround': sum(tat) / n if n else 0,
+            'gantt_chart': [(scheduler.process_name(processes, i), s, e) for i, s, e in gantt],
+            'gantt_cpu': gantt_cpu,
+            'cpus': cpus,
+            'utilization': [b / makespan if makespan else 0 for b in self.busy],
+            'migrations': self.migrations,
+            'steals': self.steals,
+            'makespan': makespan
+        }
+
+    def can_run(self, i, c):
+        return self.affinity[i] is None or c in self.affinity[i]
+
+    def idle_cpu(self, i):
+        """Pops an idle CPU that process i may run on, or returns None"""
+        if self.allowed[i] is None:
+            while self.idle:
+                c = self.idle.pop()
+                if self.is_idle[c]:
+                    return c
+            return None
+        for c in self.allowed[i]:
+            if 0 <= c < self.cpus and self.is_idle[c]:
+                return c
+        return None
+
+    def place(self, i):
+        candidates = self.allowed[i]
+        if candidates is None:
+            a = self.rng.randrange(self.cpus)
+            b = self.rng.randrange(self.cpus)
+        else:
+            candidates = [c for c in candidates if 0 <= c < self.cpus]
+            a = self.rng.choice(candidates)
+            b = self.rng.choice(candidates)
+        return a if len(self.queues[a]) <= len(self.queues[b]) else b
+
+    def enqueue(self, c, i):
+        self.queues[c].append(i)
+        self.note_load(c)
+
+    def note_load(self, c):
+        if self.queues[c]:
+            heapq.heappush(self.loads, (-len(self.queues[c]), c))
+        if len(self.loads) > 8 * self.cpus + 64:
+            # Drop stale entries so the heap stays O(cpus)
+            self.loads = [(-len(q), v) for v, q in enumerate(self.queues) if q]
+            heapq.heapify(self.loads)
+
+    def dispatch(self, c, i, time):
+        self.is_idle[c] = False
+        self.current[c] = i
+        if self.last_cpu[i] is not None and self.last_cpu[i] != c:
+            self.migrations += 1
+        self.last_cpu[i] = c
+        run = self.remaining[i] if self.quantum is None else min(self.quantum, self.remaining[i])
+        self.slice_start[c] = time
+        heapq.heappush(self.ends, (time + run, c))
+
+    def pick_next(self, c, time):
+        if self.queues[c]:
+            i = self.queues[c].popleft()
+            self.note_load(c)
+            self.dispatch(c, i, time)
+            return
+        if self.steal:
+            i = self.steal_work(c)
+            if i is not None:
+                self.steals += 1
+                self.dispatch(c, i, time)
+                return
+        self.is_idle[c] = True
+        self.idle.append(c)
+
+    def steal_work(self, thief):
+        """Takes a process thief may run from the tail of the busiest queues"""
+        victims = []
+        stolen = None
+        while self.loads and len(victims) < self.STEAL_VICTIMS and stolen is None:
+            load, v = heapq.heappop(self.loads)
+            if -load != len(self.queues[v]) or v == thief:
+                continue  # stale entry
+            victims.append(v)
+            queue = self.queues[v]
+            for offset in range(1, min(self.STEAL_SCAN, len(queue)) + 1):
+                if self.can_run(queue[-offset], thief):
+                    stolen = queue[-offset]
+                    del queue[-offset]
+                    break
+        for v in victims:
+            self.note_load(v)
+        return stolen
@@ -0,0 +1,267 @@
+import csv
+import json
+import math
+
+
+class QuantileSketch:
+    """Streaming histogram with bounded relative error on its quantiles.
+
+    Integer values below EXACT_LIMIT are counted exactly; larger values go
+    to logarithmic buckets that each span a factor of gamma, so every
+    quantile is within `relative_accuracy` of the true value and memory
+    grows with the log of the largest value, not with the sample count.
+    """
+    EXACT_LIMIT = 128
+
+    def __init__(self, relative_accuracy=0.01):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.exact = {}             # value -> count
+        self.buckets = {}           # log bucket index -> count
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        if value < self.EXACT_LIMIT and value == int(value):
+            value = max(int(value), 0)
+            self.exact[value] = self.exact.get(value, 0) + 1
+        else:
+            key = math.ceil(math.log(value) / self.log_gamma)
+            self.buckets[key] = self.buckets.get(key, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None or value < self.min else self.min
+        self.max = value if self.max is None or value > self.max else self.max
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches of different accuracy")
+        for value, count in other.exact.items():
+            self.exact[value] = self.exact.get(value, 0) + count
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def histogram(self):
+        """[(low, high, count)] in ascending order; exact values have low == high"""
+        bins = [(v, v, c) for v, c in sorted(self.exact.items())]
+        bins.extend((self.gamma ** (k - 1), self.gamma ** k, c) for k, c in sorted(self.buckets.items()))
+        return bins
+
+    def quantile(self, q):
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for low, high, count in self.histogram():
+            seen += count
+            if seen > rank:
+                value = low if low == high else 2 * high / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean': self.mean(),
+            'min': self.min,
+            'max': self.max,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+        }
+
+
+class TimeSeries:
+    """Step-function samples (such as a queue length) kept in at most
+    `capacity` buckets of equal width. The width doubles, merging
+    neighbouring buckets, whenever the run outgrows it, so memory stays
+    fixed however long the simulation runs. Each bucket keeps its maximum,
+    and the time-weighted mean is tracked exactly."""
+
+    def __init__(self, capacity=512):
+        self.capacity = capacity
+        self.width = 1
+        self.peaks = []
+        self.value = 0
+        self.since = 0
+        self.area = 0
+        self.max = 0
+
+    def record(self, time, value):
+        previous = self.value
+        self.area += previous * (time - self.since)
+        self.value, self.since = value, time
+        self.max = max(self.max, value)
+
+        slot = time // self.width
+        while slot >= self.capacity:
+            self.peaks = [max(self.peaks[i:i + 2]) for i in range(0, len(self.peaks), 2)]
+            self.width *= 2
+            slot = time // self.width
+        if slot >= len(self.peaks):
+            # Buckets skipped over held the previous value throughout
+            self.peaks.extend([previous] * (slot + 1 - len(self.peaks)))
+        self.peaks[slot] = max(self.peaks[slot], value)
+
+    def mean(self, time):
+        elapsed = time
+        if elapsed <= 0:
+            return 0
+        return (self.area + self.value * (time - self.since)) / elapsed
+
+    def points(self):
+        return [(i * self.width, peak) for i, peak in enumerate(self.peaks)]
+
+
+def jain_index(values):
+    """Jain's fairness index: 1 when all values are equal, 1/n when one takes everything"""
+    values = list(values)
+    square_sum = sum(v * v for v in values)
+    if not values or not square_sum:
+        return None
+    return sum(values) ** 2 / (len(values) * square_sum)
+
+
+class SyncStats:
+    """Contention and fairness metrics of a sync simulation.
+
+    The simulation reports each request, grant and release and every change
+    in a wait queue's length. Waits and holds go into QuantileSketches and
+    queue lengths into TimeSeries, both per process and per resource, so
+    collecting costs O(1) per event and memory does not grow with run length.
+    """
+    COLUMNS = ['scope', 'name', 'acquisitions', 'rate',
+               'wait_mean', 'wait_p50', 'wait_p95', 'wait_p99',
+               'hold_mean', 'hold_p50', 'hold_p95', 'hold_p99',
+               'queue_mean', 'queue_max', 'fairness']
+
+    def __init__(self):
+        self.processes = {}
+        self.resources = {}
+        self.requested = {}         # (process, resource) -> time of the request
+        self.holding = {}           # (process, resource) -> grant times
+
+    def entry(self, table, name):
+        entry = table.get(name)
+        if entry is None:
+            entry = table[name] = {'acquisitions': 0, 'wait': QuantileSketch(), 'hold': QuantileSketch()}
+            if table is self.resources:
+                entry['queue'] = TimeSeries()
+                entry['by_process'] = {}    # acquisitions of each process that asked
+        return entry
+
+    def add_process(self, process):
+        self.entry(self.processes, process)
+
+    def request(self, process, resource, time):
+        self.requested[(process, resource)] = time
+        self.entry(self.resources, resource)['by_process'].setdefault(process, 0)
+
+    def grant(self, process, resource, time):
+        wait = time - self.requested.pop((process, resource), time)
+        owner = self.entry(self.processes, process)
+        lock = self.entry(self.resources, resource)
+        for entry in (owner, lock):
+            entry['acquisitions'] += 1
+            entry['wait'].add(wait)
+        lock['by_process'][process] = lock['by_process'].get(process, 0) + 1
+        self.holding.setdefault((process, resource), []).append(time)
+
+    def woken(self, process, resource, time):
+        """A wait on a condition variable ended; it counts as a wait but not an acquisition"""
+        wait = time - self.requested.pop((process, resource), time)
+        self.entry(self.resources, resource)['wait'].add(wait)
+
+    def release(self, process, resource, time):
+        starts = self.holding.get((process, resource))
+        if not starts:
+            return  # e.g. a semaphore signalled by a process that never took it
+        hold = time - starts.pop()
+        if not starts:
+            del self.holding[(process, resource)]
+        self.entry(self.processes, process)['hold'].add(hold)
+        self.entry(self.resources, resource)['hold'].add(hold)
+
+    def queue(self, resource, time, length):
+        self.entry(self.resources, resource)['queue'].record(time, length)
+
+    def fairness(self):
+        """Jain's index over the processes' acquisition counts"""
+        return jain_index(entry['acquisitions'] for entry in self.processes.values())
+
+    def hold_fairness(self):
+        """Jain's index over the processes' total hold times"""
+        return jain_index(entry['hold'].total for entry in self.processes.values())
+
+    def rows(self, time, scope=None):
+        """Flat per-resource and per-process rows with the COLUMNS keys"""
+        rows = []
+        for name_scope, table in (('resource', self.resources), ('process', self.processes)):
+            if scope not in (None, name_scope):
+                continue
+            for name, entry in table.items():
+                wait, hold = entry['wait'], entry['hold']
+                row = {
+                    'scope': name_scope,
+                    'name': name,
+                    'acquisitions': entry['acquisitions'],
+                    'rate': entry['acquisitions'] / time if time > 0 else 0,
+                    'wait_mean': wait.mean(),
+                    'hold_mean': hold.mean(),
+                    'queue_mean': None,
+                    'queue_max': None,
+                    'fairness': None,
+                }
+                for q in (50, 95, 99):
+                    row[f'wait_p{q}'] = wait.quantile(q / 100)
+                    row[f'hold_p{q}'] = hold.quantile(q / 100)
+                if 'queue' in entry:
+                    row['queue_mean'] = entry['queue'].mean(time)
+                    row['queue_max'] = entry['queue'].max
+                    row['fairness'] = jain_index(entry['by_process'].values())
+                rows.append(row)
+        return rows
+
+    def report(self, time):
+        """Everything collected, including histograms and queue length series"""
+        def detail(entry):
+            detail = {
+                'acquisitions': entry['acquisitions'],
+                'rate': entry['acquisitions'] / time if time > 0 else 0,
+                'wait': dict(entry['wait'].summary(), histogram=entry['wait'].histogram()),
+                'hold': dict(entry['hold'].summary(), histogram=entry['hold'].histogram()),
+            }
+            if 'queue' in entry:
+                series = entry['queue']
+                detail['queue'] = {'mean': series.mean(time), 'max': series.max, 'series': series.points()}
+                detail['fairness'] = jain_index(entry['by_process'].values())
+            return detail
+
+        return {
+            'time': time,
+            'fairness': self.fairness(),
+            'hold_fairness': self.hold_fairness(),
+            'resources': {name: detail(entry) for name, entry in self.resources.items()},
+            'processes': {name: detail(entry) for name, entry in self.processes.items()},
+        }
+
+    def export(self, path, time):
+        """Writes report() as JSON, or the flat rows as CSV for a .csv path"""
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=self.COLUMNS)
+                writer.writeheader()
+                writer.writerows(self.rows(time))
+        else:
+            with open(path, "w") as f:
+                json.dump(self.report(time), f, indent=2)
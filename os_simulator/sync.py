@@ -0,0 +1,849 @@
+import heapq
+from bisect import bisect_left, insort
+from collections import deque
+
+from .deadlock import WaitForGraph
+from .stats import SyncStats
+
+class WaitQueue:
+    """FIFO wait queue with O(1) membership and position lookups.
+
+    Every waiter draws a ticket from a running counter, so a waiter's
+    position is its distance from the ticket at the head. Waiters removed
+    out of order are tracked in a sorted list and subtracted with a bisect,
+    which keeps position() at O(log n) once removals happen.
+    """
+    def __init__(self):
+        self.tickets = {}           # name -> ticket
+        self.order = deque()        # (ticket, name), may hold stale entries
+        self.removed = []           # sorted tickets removed from the middle
+        self.next_ticket = 0
+
+    def __len__(self):
+        return len(self.tickets)
+
+    def __contains__(self, name):
+        return name in self.tickets
+
+    def __iter__(self):
+        for ticket, name in self.order:
+            if self.tickets.get(name) == ticket:
+                yield name
+
+    def append(self, name):
+        if name in self.tickets:
+            return
+        self.tickets[name] = self.next_ticket
+        self.order.append((self.next_ticket, name))
+        self.next_ticket += 1
+
+    def popleft(self):
+        if not self.tickets:
+            raise IndexError("pop from an empty wait queue")
+        _, name = self.order.popleft()
+        del self.tickets[name]
+        self.drop_stale()
+        return name
+
+    def remove(self, name):
+        if name not in self.tickets:
+            raise ValueError(f"{name} is not waiting")
+        insort(self.removed, self.tickets.pop(name))
+        self.drop_stale()
+
+    def drop_stale(self):
+        order = self.order
+        while order and self.tickets.get(order[0][1]) != order[0][0]:
+            order.popleft()
+        if not order:
+            self.removed.clear()
+
+    def position(self, name):
+        """1-based position of `name`, 0 if it is not waiting"""
+        ticket = self.tickets.get(name)
+        if ticket is None:
+            return 0
+        head = self.order[0][0]
+        position = ticket - head + 1
+        if self.removed:
+            position -= bisect_left(self.removed, ticket) - bisect_left(self.removed, head)
+        return position
+
+    def peek(self):
+        return self.order[0][1] if self.tickets else None
+
+    def index(self, name):
+        position = self.position(name)
+        if not position:
+            raise ValueError(f"{name} is not waiting")
+        return position - 1
+
+class Semaphore:
+    owned = False                   # Released by anyone, so no wait-for edges
+
+    def __init__(self, value=1):
+        self.value = value          # Available permits
+        self.queue = WaitQueue()    # Process wait queue (FIFO)
+        self.holder = None          # Current process holding the semaphore
+        
+    def acquire(self, process_name):
+        """Returns True if acquired successfully, False if blocked"""
+        if self.value > 0:
+            self.value -= 1
+            self.holder = process_name
+            return True
+        else:
+            self.queue.append(process_name)
+            return False
+            
+    def release(self, process_name=None):
+        """Returns the next process to wake up or None"""
+        self.value += 1
+        self.holder = None
+        if self.queue:
+            return self.queue.popleft()
+        return None
+
+    def handoff(self, process_name=None):
+        """Releases and passes the permit straight to the next waiter; returns the processes granted"""
+        next_process = self.release(process_name)
+        if next_process is not None and self.acquire(next_process):
+            return [next_process]
+        return []
+
+class Mutex(Semaphore):
+    """Binary semaphore that only its holder may release"""
+    owned = True
+
+    def __init__(self):
+        super().__init__(value=1)
+
+    def release(self, process_name=None):
+        if process_name is not None and process_name != self.holder:
+            raise ValueError(f"{process_name} does not hold the mutex")
+        return super().release()
+
+class RWLock:
+    """Reader-writer lock: any number of readers or one writer.
+
+    Waiters are granted in FIFO order, so a queued writer holds back the
+    readers behind it and cannot starve.
+    """
+    owned = True
+
+    def __init__(self):
+        self.readers = set()
+        self.writer = None
+        self.queue = WaitQueue()
+        self.shared = {}            # waiting process -> wants a read lock
+
+    def acquire(self, process_name, shared=False):
+        """Returns True if acquired successfully, False if blocked"""
+        if not self.queue and self.can_grant(shared):
+            self.grant(process_name, shared)
+            return True
+        self.queue.append(process_name)
+        self.shared[process_name] = shared
+        return False
+
+    def can_grant(self, shared):
+        return self.writer is None and (shared or not self.readers)
+
+    def grant(self, process_name, shared):
+        if shared:
+            self.readers.add(process_name)
+        else:
+            self.writer = process_name
+
+    def release(self, process_name):
+        """Returns the waiting processes that now hold the lock"""
+        if process_name == self.writer:
+            self.writer = None
+        elif process_name in self.readers:
+            self.readers.discard(process_name)
+        else:
+            raise ValueError(f"{process_name} does not hold the lock")
+
+        granted = []
+        while self.queue:
+            name = self.queue.peek()
+            shared = self.shared[name]
+            if not self.can_grant(shared):
+                break
+            self.queue.popleft()
+            del self.shared[name]
+            self.grant(name, shared)
+            granted.append(name)
+            if not shared:
+                break
+        return granted
+
+    handoff = release
+
+class Condition:
+    """Condition variable: waiters park here until signalled, then re-lock their mutex"""
+    owned = False
+
+    def __init__(self):
+        self.queue = WaitQueue()
+
+    def wait(self, process_name):
+        self.queue.append(process_name)
+
+    def signal(self):
+        return [self.queue.popleft()] if self.queue else []
+
+    def broadcast(self):
+        waiting = list(self.queue)
+        self.queue = WaitQueue()
+        return waiting
+
+class SyncSimulation:
+    """Headless semaphore contention simulation.
+
+    step() advances one time unit. run() and run_until() give the same
+    result but jump straight from one state change (an acquire, a release
+    or a wake-up) to the next, so long runs cost time per event rather than
+    per time unit.
+    """
+    def __init__(self, max_hold_time=3, work_units=3):
+        self.semaphores = {}
+        self.processes = []
+        self.resource = ""
+        self.time = 0
+        self.MAX_HOLD_TIME = max_hold_time
+        self.WORK_UNITS = work_units
+        self.log_callback = None
+        self.event_log = None
+        self.changed = set()        # process indexes whose displayed fields changed
+        self.stats = SyncStats()
+    
+    def start(self, num_processes, resource, permits=1):
+        self.time = 0
+        self.resource = resource
+        
+        # Initialize semaphores
+        self.semaphores = {resource: Semaphore(value=permits)}
+        
+        # Create processes
+        self.processes = []
+        self.changed = set()
+        self.stats = SyncStats()
+        for i in range(num_processes):
+            self.stats.add_process(f"P{i}")
+            self.stats.request(f"P{i}", resource, 0)
+            self.processes.append({
+                'name': f"P{i}",
+                'state': "Ready",
+                'action': "",
+                'blocked_on': "",
+                'progress': 0,
+                'hold_start': None,
+                'wait_since': None,
+                'queue_pos': 0
+            })
+    
+    def run(self, steps):
+        """Advances `steps` time units; returns the number of ticks actually simulated"""
+        return self.run_until(self.time + steps)
+    
+    def run_until(self, time):
+        ticks = 0
+        while self.time < time:
+            change = self.next_change()
+            if change > time:
+                self.fast_forward(time)
+                break
+            self.fast_forward(change - 1)
+            self.step()
+            ticks += 1
+        return ticks
+    
+    def next_change(self):
+        """Earliest time at which step() would do more than count up the running process's progress"""
+        semaphore = self.semaphores.get(self.resource)
+        if not semaphore:
+            return self.time + 1
+        
+        change = float('inf')
+        running = False
+        for process in self.processes:
+            if process['state'] == "Running":
+                running = True
+                change = min(change, self.release_time(process))
+            elif process['state'] == "Blocked" and process['name'] not in semaphore.queue:
+                return self.time + 1
+        
+        # Ready processes only get a turn while nobody holds the resource
+        if not running and semaphore.value > 0 and any(p['state'] == "Ready" for p in self.processes):
+            return self.time + 1
+        return change
+    
+    def release_time(self, process):
+        if process.get('hold_start') is None:
+            return self.time + 1
+        left = min(self.WORK_UNITS - process.get('progress', 0),
+                   self.MAX_HOLD_TIME - (self.time - process['hold_start']))
+        return self.time + max(left, 1)
+    
+    def fast_forward(self, time):
+        """Moves the clock to `time` across ticks in which nothing but the
+        running processes' progress changes"""
+        elapsed = time - self.time
+        if elapsed <= 0:
+            return
+        self.time = time
+        for process in self.processes:
+            if process['state'] == "Running" and process.get('hold_start') is not None:
+                process['progress'] = min(process.get('progress', 0) + elapsed, self.WORK_UNITS)
+                process['hold_time'] = self.time - process['hold_start']
+    
+    def step(self):
+        self.time += 1
+        resource = self.resource
+        semaphore = self.semaphores.get(resource)
+        
+        if not semaphore:
+            self.log("Error: No semaphore initialized!", 'error')
+            return
+
+        # Update all processes
+        active_process = None
+        for i, process in enumerate(self.processes):
+            # Update running processes
+            if process['state'] == "Running":
+                if process.get('hold_start') is None:
+                    process['hold_start'] = self.time
+                
+                process['progress'] = min(process.get('progress', 0) + 1, self.WORK_UNITS)
+                process['hold_time'] = self.time - process['hold_start']
+                
+                if (process['progress'] >= self.WORK_UNITS or 
+                    process['hold_time'] >= self.MAX_HOLD_TIME):
+                    
+                    self.release_resource(process)
+                    self.changed.add(i)
+                    process.update({
+                        'state': "Ready",
+                        'progress': 0,
+                        'hold_start': None,
+                        'blocked_on': ""
+                    })
+                else:
+                    active_process = process
+
+            # Update blocked processes
+            elif process['state'] == "Blocked":
+                position = semaphore.queue.position(process['name'])
+                if position != process['queue_pos']:
+                    self.changed.add(i)
+                if position:
+                    process['queue_pos'] = position
+                else:
+                    self.changed.add(i)
+                    process['state'] = "Ready"
+                    process['queue_pos'] = 0
+                    process['wait_since'] = None
+
+        # Assign resource if available
+        if not active_process and semaphore.value > 0:
+            # Find longest-waiting ready process
+            oldest_waiting = None
+            oldest_index = None
+            min_wait_time = float('inf')
+            
+            for i, process in enumerate(self.processes):
+                if process['state'] == "Ready":
+                    if process.get('wait_since') is None:
+                        process['wait_since'] = self.time
+                    
+                    wait_time = self.time - process['wait_since']
+                    if wait_time < min_wait_time:
+                        oldest_waiting = process
+                        oldest_index = i
+                        min_wait_time = wait_time
+            
+            if oldest_waiting:
+                self.changed.add(oldest_index)
+            if oldest_waiting and self.acquire_resource(oldest_waiting):
+                oldest_waiting.update({
+                    'state': "Running",
+                    'action': f"Accessing {resource}",
+                    'hold_start': self.time,
+                    'wait_since': None,
+                    'queue_pos': 0
+                })
+
+    def acquire_resource(self, process):
+        resource = self.resource
+        semaphore = self.semaphores.get(resource)
+        
+        if not semaphore:
+            self.log(f"Error: No semaphore for {resource}", 'error')
+            return False
+            
+        if semaphore.acquire(process['name']):
+            self.log(f"{process['name']} acquired {resource} (Sem={semaphore.value+1}→{semaphore.value})", 'acquire')
+            self.stats.grant(process['name'], resource, self.time)
+            return True
+        else:
+            process['state'] = "Blocked"
+            process['blocked_on'] = resource
+            if process['wait_since'] is None:
+                process['wait_since'] = self.time
+            self.log(f"{process['name']} blocked (Queue pos: {len(semaphore.queue)})", 'block')
+            self.stats.queue(resource, self.time, len(semaphore.queue))
+            return False
+
+    def release_resource(self, process):
+        resource = self.resource
+        semaphore = self.semaphores.get(resource)
+        
+        if semaphore:
+            next_process = semaphore.release()
+            self.log(f"{process['name']} released {resource} (Sem={semaphore.value-1}→{semaphore.value})", 'release')
+            # The process goes back to Ready and wants the resource again
+            self.stats.release(process['name'], resource, self.time)
+            self.stats.request(process['name'], resource, self.time)
+            self.stats.queue(resource, self.time, len(semaphore.queue))
+            
+            if next_process:
+                self.log(f"Resource granted to {next_process}", 'grant')
+        else:
+            self.log(f"Error: No semaphore to release for {resource}", 'error')
+
+    def snapshot(self):
+        return self.processes
+
+    def take_changed(self):
+        """Indexes of processes whose displayed fields changed since the last call"""
+        changed, self.changed = self.changed, set()
+        return changed
+
+    def timeline(self, limit=None):
+        """One line of process states; with `limit` only the first `limit` processes"""
+        timeline_text = f"Time {self.time}: "
+        for process in self.processes[:limit]:
+            state_symbol = {
+                "Running": "[Locked]",
+                "Blocked": "[Waiting]",
+                "Ready": "[Ready]"
+            }.get(process['state'], "")
+            timeline_text += f"{process['name']}{state_symbol} "
+        if limit is not None and len(self.processes) > limit:
+            timeline_text += f"... (+{len(self.processes) - limit} more)"
+        return timeline_text
+
+    def log(self, message, kind="info"):
+        if self.event_log is not None:
+            self.event_log.append(self.time, kind, message)
+        if self.log_callback:
+            self.log_callback(self.time, message)
+
+class ScriptedSimulation:
+    """Processes run scripts of steps over many named semaphores, mutexes,
+    reader-writer locks and condition variables.
+
+    Script steps:
+        ("acquire", lock)           P a semaphore, lock a mutex, write-lock an RW lock
+        ("read", rwlock)            read-lock an RW lock
+        ("release", lock)           V a semaphore, unlock a mutex or RW lock
+        ("wait", condition, mutex)  unlock mutex, sleep until signalled, re-lock it
+        ("signal", condition)       wake one waiter
+        ("broadcast", condition)    wake all waiters
+        ("work", units)             compute for that many time units
+
+    Every other step takes one time unit. A tick only touches the processes
+    that act on it: blocked ones sit in their primitive's wait queue and
+    working ones in a heap of wake-up times, and run() jumps over ticks in
+    which nobody acts. Waits on mutexes and RW locks feed a WaitForGraph,
+    which reports each deadlock cycle as it closes.
+    """
+    KINDS = ('semaphore', 'mutex', 'rwlock', 'condition')
+    LOCKS = ('semaphore', 'mutex', 'rwlock')
+    OPERANDS = {
+        'acquire': LOCKS,
+        'read': ('rwlock',),
+        'release': LOCKS,
+        'wait': ('condition', 'mutex'),
+        'signal': ('condition',),
+        'broadcast': ('condition',),
+        'work': (),
+    }
+
+    def __init__(self):
+        self.resources = {}
+        self.kinds = {}
+        self.values = {}            # initial semaphore counts
+        self.processes = []
+        self.index = {}             # process name -> position in processes
+        self.time = 0
+        self.runnable = []          # processes that act on the next tick
+        self.sleeping = []          # heap of (wake-up time, process index)
+        self.graph = WaitForGraph()
+        self.deadlocks = []         # (time, cycle)
+        self.stalled = False
+        self.blocked = set()        # indexes of blocked processes
+        self.changed = set()        # process indexes whose displayed fields changed
+        self.stats = SyncStats()
+        self.log_callback = None
+        self.event_log = None
+
+    @classmethod
+    def from_config(cls, config):
+        """Builds a simulation from {"resources": {name: kind or {"kind", "value"}},
+        "processes": [{"name", "script", "loop"}]}"""
+        simulation = cls()
+        for name, spec in config.get('resources', {}).items():
+            if isinstance(spec, str):
+                spec = {'kind': spec}
+            simulation.add_resource(name, spec.get('kind', "semaphore"), spec.get('value', 1))
+        for i, process in enumerate(config.get('processes', [])):
+            simulation.add_process(process.get('name', f"P{i}"), process['script'], process.get('loop', False))
+        return simulation
+
+    def config(self):
+        """The resources and scripts in from_config() form"""
+        return {
+            'resources': {name: {'kind': kind, 'value': self.values[name]} for name, kind in self.kinds.items()},
+            'processes': [{'name': p['name'], 'script': [list(step) for step in p['script']], 'loop': p['loop']}
+                          for p in self.processes],
+        }
+
+    def add_resource(self, name, kind="semaphore", value=1):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown resource kind: {kind}")
+        if name in self.resources:
+            raise ValueError(f"Duplicate resource: {name}")
+        self.resources[name] = {
+            'semaphore': lambda: Semaphore(value),
+            'mutex': Mutex,
+            'rwlock': RWLock,
+            'condition': Condition,
+        }[kind]()
+        self.kinds[name] = kind
+        self.values[name] = value
+        return self.resources[name]
+
+    def add_process(self, name, script, loop=False):
+        if name in self.index:
+            raise ValueError(f"Duplicate process: {name}")
+        script = [tuple(step) for step in script]
+        for step in script:
+            self.check_step(name, step)
+
+        self.index[name] = len(self.processes)
+        self.processes.append({
+            'name': name,
+            'state': "Ready",
+            'action': "",
+            'blocked_on': "",
+            'queue_pos': 0,
+            'script': script,
+            'pc': 0,
+            'loop': loop,
+            'held': {},
+        })
+        self.runnable.append(self.index[name])
+        self.changed.add(self.index[name])
+        self.stats.add_process(name)
+        return self.processes[-1]
+
+    def check_step(self, process_name, step):
+        op = step[0] if step else None
+        if op not in self.OPERANDS:
+            raise ValueError(f"{process_name}: unknown step {step!r}")
+        kinds = self.OPERANDS[op]
+        if op == 'work':
+            if len(step) != 2 or int(step[1]) < 1:
+                raise ValueError(f"{process_name}: work needs a positive duration")
+            return
+        operands = step[1:]
+        if op == 'wait':
+            if len(operands) != 2:
+                raise ValueError(f"{process_name}: wait needs a condition and a mutex")
+            expected = [(kinds[0],), (kinds[1],)]
+        else:
+            if len(operands) != 1:
+                raise ValueError(f"{process_name}: {op} takes one resource")
+            expected = [kinds]
+        for resource, allowed in zip(operands, expected):
+            if resource not in self.resources:
+                raise KeyError(f"{process_name}: unknown resource {resource}")
+            if self.kinds[resource] not in allowed:
+                raise ValueError(f"{process_name}: cannot {op} {self.kinds[resource]} {resource}")
+
+    def run(self, steps):
+        """Advances `steps` time units; returns the number of ticks actually simulated"""
+        return self.run_until(self.time + steps)
+
+    def run_until(self, time):
+        ticks = 0
+        while self.time < time:
+            change = self.next_change()
+            if change > time:
+                self.time = time
+                break
+            self.time = change - 1
+            self.step()
+            ticks += 1
+        return ticks
+
+    def next_change(self):
+        if self.runnable:
+            return self.time + 1
+        if self.sleeping:
+            return self.sleeping[0][0]
+        return float('inf')
+
+    def step(self):
+        self.time += 1
+        while self.sleeping and self.sleeping[0][0] <= self.time:
+            self.runnable.append(heapq.heappop(self.sleeping)[1])
+
+        acting, self.runnable = self.runnable, []
+        for i in acting:
+            self.act(i)
+
+        if acting and not self.runnable and not self.sleeping:
+            waiting = [p['name'] for p in self.processes if p['state'] == "Blocked"]
+            if waiting and not self.stalled:
+                self.stalled = True
+                self.log(f"Stalled: {len(waiting)} processes blocked and none can run", 'stall')
+
+    def act(self, i):
+        process = self.processes[i]
+        self.changed.add(i)
+        script = process['script']
+        if process['pc'] >= len(script):
+            if not process['loop'] or not script:
+                process.update({'state': "Done", 'action': "Finished"})
+                self.log(f"{process['name']} finished", 'finish')
+                return
+            process['pc'] = 0
+
+        op, *operands = script[process['pc']]
+        name = process['name']
+        if op == 'work':
+            units = int(operands[0])
+            process.update({'state': "Running", 'action': f"Working ({units})"})
+            self.advance(i, units)
+        elif op in ('acquire', 'read'):
+            self.acquire(i, operands[0], shared=op == 'read')
+        elif op == 'release':
+            self.release(i, operands[0])
+            process.update({'state': "Ready", 'action': f"Released {operands[0]}"})
+            self.advance(i)
+        elif op == 'wait':
+            condition, mutex = operands
+            self.release(i, mutex)
+            self.resources[condition].wait(name)
+            self.stats.request(name, condition, self.time)
+            self.stats.queue(condition, self.time, len(self.resources[condition].queue))
+            process.update({'state': "Blocked", 'action': f"Waiting on {condition}", 'blocked_on': condition})
+            self.blocked.add(i)
+            self.log(f"{name} waits on {condition}", 'wait')
+        else:
+            condition = self.resources[operands[0]]
+            woken = getattr(condition, op)()
+            self.log(f"{name} {op}s {operands[0]} ({len(woken)} woken)", 'signal')
+            self.stats.queue(operands[0], self.time, len(condition.queue))
+            for waiter in woken:
+                self.stats.woken(waiter, operands[0], self.time)
+                self.relock(waiter)
+            process.update({'state': "Ready", 'action': f"{op.capitalize()} {operands[0]}"})
+            self.advance(i)
+
+    def acquire(self, i, resource, shared=False):
+        process = self.processes[i]
+        name = process['name']
+        lock = self.resources[resource]
+        self.stats.request(name, resource, self.time)
+        acquired = lock.acquire(name, shared) if shared else lock.acquire(name)
+        if acquired:
+            self.log(f"{name} acquired {resource}", 'acquire')
+            self.granted(i, resource)
+            return
+        process.update({'state': "Blocked", 'action': f"Waiting for {resource}", 'blocked_on': resource})
+        self.blocked.add(i)
+        self.log(f"{name} blocked on {resource} (Queue pos: {len(lock.queue)})", 'block')
+        self.stats.queue(resource, self.time, len(lock.queue))
+        if lock.owned:
+            self.check_cycle(self.graph.request(name, resource))
+
+    def release(self, i, resource):
+        process = self.processes[i]
+        name = process['name']
+        lock = self.resources[resource]
+        granted = lock.handoff(name)
+        held = process['held']
+        if held.get(resource):
+            held[resource] -= 1
+            if not held[resource]:
+                del held[resource]
+        if lock.owned:
+            self.graph.release(name, resource)
+        self.log(f"{name} released {resource}", 'release')
+        self.stats.release(name, resource, self.time)
+        if granted:
+            self.stats.queue(resource, self.time, len(lock.queue))
+        for waiter in granted:
+            self.log(f"{resource} granted to {waiter}", 'grant')
+            self.granted(self.index[waiter], resource)
+
+    def relock(self, name):
+        """A signalled waiter re-locks the mutex named in its wait step"""
+        i = self.index[name]
+        process = self.processes[i]
+        mutex = process['script'][process['pc']][2]
+        self.stats.request(name, mutex, self.time)
+        if self.resources[mutex].acquire(name):
+            self.granted(i, mutex)
+        else:
+            self.stats.queue(mutex, self.time, len(self.resources[mutex].queue))
+            process.update({'action': f"Waiting for {mutex}", 'blocked_on': mutex})
+            self.changed.add(i)
+            self.check_cycle(self.graph.request(name, mutex))
+
+    def granted(self, i, resource):
+        process = self.processes[i]
+        held = process['held']
+        held[resource] = held.get(resource, 0) + 1
+        self.stats.grant(process['name'], resource, self.time)
+        if self.resources[resource].owned:
+            self.check_cycle(self.graph.grant(process['name'], resource))
+        process.update({'state': "Ready", 'action': f"Holding {resource}", 'blocked_on': "", 'queue_pos': 0})
+        self.blocked.discard(i)
+        self.changed.add(i)
+        self.stalled = False
+        self.advance(i)
+
+    def advance(self, i, delay=1):
+        self.processes[i]['pc'] += 1
+        if delay == 1:
+            self.runnable.append(i)
+        else:
+            heapq.heappush(self.sleeping, (self.time + delay, i))
+
+    def check_cycle(self, cycle):
+        if cycle:
+            self.deadlocks.append((self.time, cycle))
+            self.log("Deadlock: " + " -> ".join(f"{p} waits for {r}" for p, r in cycle), 'deadlock')
+
+    def snapshot(self):
+        """Fills in queue positions of blocked processes; returns the processes"""
+        for i in self.blocked:
+            process = self.processes[i]
+            position = self.resources[process['blocked_on']].queue.position(process['name'])
+            if position != process['queue_pos']:
+                process['queue_pos'] = position
+                self.changed.add(i)
+        return self.processes
+
+    def take_changed(self):
+        """Indexes of processes whose displayed fields changed since the last call"""
+        changed, self.changed = self.changed, set()
+        return changed
+
+    def timeline(self, limit=None):
+        """One line of process states; with `limit` only the first `limit` processes"""
+        timeline_text = f"Time {self.time}: "
+        for process in self.processes[:limit]:
+            state_symbol = {
+                "Running": "[Working]",
+                "Blocked": "[Waiting]",
+                "Ready": "[Ready]",
+                "Done": "[Done]"
+            }.get(process['state'], "")
+            timeline_text += f"{process['name']}{state_symbol} "
+        if limit is not None and len(self.processes) > limit:
+            timeline_text += f"... (+{len(self.processes) - limit} more)"
+        return timeline_text
+
+    def log(self, message, kind="info"):
+        if self.event_log is not None:
+            self.event_log.append(self.time, kind, message)
+        if self.log_callback:
+            self.log_callback(self.time, message)
+
+
+def shared_resource(processes=3, permits=1, hold_time=3, resource="Printer"):
+    """Every process repeatedly takes one permit of a shared semaphore, works, and gives it back"""
+    simulation = ScriptedSimulation()
+    simulation.add_resource(resource, "semaphore", permits)
+    for i in range(processes):
+        simulation.add_process(f"P{i}", [
+            ("acquire", resource), ("work", hold_time), ("release", resource),
+        ], loop=True)
+    return simulation
+
+
+def producer_consumer(processes=4, capacity=4, produce_time=2, consume_time=3):
+    """Producers and consumers share a bounded buffer guarded by counting semaphores"""
+    simulation = ScriptedSimulation()
+    simulation.add_resource("empty", "semaphore", capacity)
+    simulation.add_resource("full", "semaphore", 0)
+    simulation.add_resource("buffer", "mutex")
+    producers = max(1, processes // 2)
+    for i in range(producers):
+        simulation.add_process(f"Producer{i}", [
+            ("work", produce_time),
+            ("acquire", "empty"), ("acquire", "buffer"),
+            ("release", "buffer"), ("release", "full"),
+        ], loop=True)
+    for i in range(max(1, processes - producers)):
+        simulation.add_process(f"Consumer{i}", [
+            ("acquire", "full"), ("acquire", "buffer"),
+            ("release", "buffer"), ("release", "empty"),
+            ("work", consume_time),
+        ], loop=True)
+    return simulation
+
+
+def readers_writers(processes=5, writers=None, read_time=2, write_time=3, think_time=2):
+    """Readers share and writers exclude each other on one RW lock"""
+    simulation = ScriptedSimulation()
+    simulation.add_resource("data", "rwlock")
+    writers = max(1, processes // 4) if writers is None else writers
+    for i in range(max(1, processes - writers)):
+        simulation.add_process(f"Reader{i}", [
+            ("read", "data"), ("work", read_time), ("release", "data"), ("work", think_time),
+        ], loop=True)
+    for i in range(writers):
+        simulation.add_process(f"Writer{i}", [
+            ("acquire", "data"), ("work", write_time), ("release", "data"), ("work", think_time),
+        ], loop=True)
+    return simulation
+
+
+def dining_philosophers(processes=5, think_time=2, eat_time=3, ordered=False):
+    """Philosophers lock the forks on either side. Taking the left fork first
+    deadlocks; with `ordered` every philosopher takes the lower-numbered fork
+    first, the lock hierarchy that breaks the cycle."""
+    simulation = ScriptedSimulation()
+    for i in range(processes):
+        simulation.add_resource(f"Fork{i}", "mutex")
+    for i in range(processes):
+        first, second = i, (i + 1) % processes
+        if ordered and first > second:
+            first, second = second, first
+        simulation.add_process(f"Philosopher{i}", [
+            ("work", think_time),
+            ("acquire", f"Fork{first}"), ("acquire", f"Fork{second}"),
+            ("work", eat_time),
+            ("release", f"Fork{second}"), ("release", f"Fork{first}"),
+        ], loop=True)
+    return simulation
+
+
+def ordered_philosophers(processes=5, think_time=2, eat_time=3):
+    return dining_philosophers(processes, think_time, eat_time, ordered=True)
+
+
+SCENARIOS = {
+    'shared-resource': shared_resource,
+    'producer-consumer': producer_consumer,
+    'readers-writers': readers_writers,
+    'dining-philosophers': dining_philosophers,
+    'ordered-philosophers': ordered_philosophers,
+}
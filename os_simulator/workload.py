@@ -0,0 +1,175 @@
+import csv
+import mmap
+
+import numpy as np
+
+# Little-endian so binary traces are portable between hosts
+WORKLOAD_DTYPE = np.dtype([
+    ('pid', '<i8'),
+    ('arrival_time', '<i8'),
+    ('burst_time', '<i8')
+])
+
+class Workload:
+    """Columnar process list backed by a NumPy structured array.
+
+    Rows read back as the usual {'name', 'burst_time', 'arrival_time'} dicts,
+    so a Workload can stand in for a process list, but bulk operations never
+    build them. Without explicit names a process is called f"P{pid}".
+    """
+    def __init__(self, data, names=None):
+        self.data = data
+        self.names = names
+    
+    @classmethod
+    def from_arrays(cls, arrival_time, burst_time, pid=None, names=None):
+        n = len(arrival_time)
+        data = np.empty(n, dtype=WORKLOAD_DTYPE)
+        data['pid'] = np.arange(1, n + 1) if pid is None else pid
+        data['arrival_time'] = arrival_time
+        data['burst_time'] = burst_time
+        return cls(data, names)
+    
+    @classmethod
+    def from_processes(cls, processes):
+        return cls.from_arrays(
+            [p['arrival_time'] for p in processes],
+            [p['burst_time'] for p in processes],
+            names=[p['name'] for p in processes]
+        )
+    
+    @property
+    def pid(self):
+        return self.data['pid']
+    
+    @property
+    def arrival_time(self):
+        return self.data['arrival_time']
+    
+    @property
+    def burst_time(self):
+        return self.data['burst_time']
+    
+    def __len__(self):
+        return len(self.data)
+    
+    def __getitem__(self, i):
+        if isinstance(i, (int, np.integer)):
+            return {
+                'name': self.name(i),
+                'burst_time': int(self.data['burst_time'][i]),
+                'arrival_time': int(self.data['arrival_time'][i])
+            }
+        return self.take(np.arange(len(self))[i])
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    def name(self, i):
+        if self.names is not None:
+            return self.names[i]
+        return f"P{self.data['pid'][i]}"
+    
+    def take(self, indices):
+        names = None
+        if self.names is not None:
+            names = [self.names[i] for i in indices.tolist()]
+        return Workload(self.data[indices], names)
+    
+    def to_processes(self):
+        return list(self)
+
+TRACE_MAGIC = b"OSTRACE1"
+
+class TraceLoader:
+    """Streams scheduling traces from disk as Workload chunks.
+
+    CSV traces have a header naming `burst_time` and `arrival_time` columns
+    (and optionally `name`). Binary traces are TRACE_MAGIC followed by packed
+    WORKLOAD_DTYPE records and are read through mmap without copying.
+    """
+    def __init__(self, chunk_rows=65536):
+        self.chunk_rows = chunk_rows
+    
+    def iter_chunks(self, path):
+        with open(path, 'rb') as f:
+            is_binary = f.read(len(TRACE_MAGIC)) == TRACE_MAGIC
+        if is_binary:
+            return self.iter_binary(path)
+        return self.iter_csv(path)
+    
+    def load(self, path):
+        with open(path, 'rb') as f:
+            is_binary = f.read(len(TRACE_MAGIC)) == TRACE_MAGIC
+        if is_binary:
+            return self.load_binary(path)
+        return self.concat(self.iter_csv(path))
+    
+    def iter_csv(self, path):
+        with open(path, newline='') as f:
+            reader = csv.reader(f)
+            header = [h.strip() for h in next(reader, [])]
+            try:
+                burst_col = header.index('burst_time')
+                arrival_col = header.index('arrival_time')
+            except ValueError:
+                raise ValueError("CSV trace needs burst_time and arrival_time columns")
+            name_col = header.index('name') if 'name' in header else None
+            
+            offset = 0
+            while True:
+                rows = []
+                for row in reader:
+                    if not any(cell.strip() for cell in row):
+                        continue
+                    if len(row) != len(header):
+                        raise ValueError(f"{path}, line {reader.line_num}: expected {len(header)} columns, "
+                                         f"got {len(row)}")
+                    rows.append(row)
+                    if len(rows) == self.chunk_rows:
+                        break
+                if not rows:
+                    break
+                columns = list(zip(*rows))
+                n = len(rows)
+                chunk = Workload.from_arrays(
+                    np.array(columns[arrival_col]).astype(np.int64),
+                    np.array(columns[burst_col]).astype(np.int64),
+                    pid=np.arange(offset + 1, offset + n + 1),
+                    names=[name.strip() for name in columns[name_col]] if name_col is not None else None
+                )
+                offset += n
+                yield chunk
+    
+    def load_binary(self, path):
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapped[:len(TRACE_MAGIC)] != TRACE_MAGIC:
+            raise ValueError(f"{path} is not a binary trace")
+        if (len(mapped) - len(TRACE_MAGIC)) % WORKLOAD_DTYPE.itemsize:
+            raise ValueError(f"{path} is truncated")
+        return Workload(np.frombuffer(mapped, dtype=WORKLOAD_DTYPE, offset=len(TRACE_MAGIC)))
+    
+    def iter_binary(self, path):
+        workload = self.load_binary(path)
+        for start in range(0, len(workload), self.chunk_rows):
+            yield Workload(workload.data[start:start + self.chunk_rows])
+    
+    def write_binary(self, path, chunks):
+        """Writes a Workload (or an iterable of them) as a binary trace"""
+        if isinstance(chunks, Workload):
+            chunks = [chunks]
+        with open(path, 'wb') as f:
+            f.write(TRACE_MAGIC)
+            for chunk in chunks:
+                f.write(chunk.data.astype(WORKLOAD_DTYPE, copy=False).tobytes())
+    
+    def concat(self, chunks):
+        chunks = list(chunks)
+        if not chunks:
+            return Workload(np.empty(0, dtype=WORKLOAD_DTYPE))
+        names = None
+        if all(c.names is not None for c in chunks):
+            names = [name for c in chunks for name in c.names]
+        return Workload(np.concatenate([c.data for c in chunks]), names)